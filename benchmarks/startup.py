@@ -0,0 +1,123 @@
+"""Startup-time benchmark for the launcher CLI.
+
+Measures, in fresh interpreters:
+
+* import time of ``rebirth_launcher.main``
+* time to first output of ``launch --skip-update``; the process is killed
+  as soon as it writes anything, so the game is not started
+
+and fails (exit status 1) when the median of either exceeds its budget,
+or when a module that should load on demand is imported eagerly.
+
+Usage::
+
+    python benchmarks/startup.py [--runs 7] [--import-budget-ms 150]
+                                 [--first-output-budget-ms 400]
+"""
+import argparse
+import os
+from pathlib import Path
+import selectors
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Modules the CLI must not load just to start up
+LAZY_MODULES = ("requests", "rich.console", "rich.progress", "winreg")
+
+_IMPORT_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import rebirth_launcher.main
+elapsed = time.perf_counter() - start
+eager = [m for m in {lazy!r} if m in sys.modules]
+print(elapsed, ",".join(eager))
+"""
+
+def _environment(workdir: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(SRC_DIR), env.get("PYTHONPATH")])
+    )
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    # Keep config, logs and caches written during the run out of the real
+    # profile
+    for name in ("HOME", "APPDATA", "LOCALAPPDATA", "XDG_CONFIG_HOME",
+                 "XDG_CACHE_HOME"):
+        env[name] = workdir
+    return env
+
+def measure_import(workdir: str) -> tuple[float, list[str]]:
+    """Import the CLI module once; return seconds and eager lazy modules."""
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SNIPPET.format(lazy=LAZY_MODULES)],
+        env=_environment(workdir),
+        cwd=workdir,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(output[0]), output[1].split(",") if len(output) > 1 else []
+
+def measure_first_output(workdir: str, timeout: float = 30.0) -> float:
+    """Seconds from spawning ``launch --skip-update`` to its first byte."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "rebirth_launcher.main",
+         "launch", "--skip-update"],
+        env=_environment(workdir),
+        cwd=workdir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        with selectors.DefaultSelector() as selector:
+            assert process.stdout and process.stderr
+            selector.register(process.stdout, selectors.EVENT_READ)
+            selector.register(process.stderr, selectors.EVENT_READ)
+            if not selector.select(timeout):
+                raise TimeoutError("launch produced no output")
+            return time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+
+def _report(name: str, samples: list[float], budget_ms: float) -> bool:
+    median = statistics.median(samples) * 1000
+    ok = median <= budget_ms
+    print(
+        f"{name:<14} median {median:7.1f} ms  min {min(samples) * 1000:7.1f} ms"
+        f"  budget {budget_ms:7.1f} ms  {'ok' if ok else 'OVER BUDGET'}"
+    )
+    return ok
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--import-budget-ms", type=float, default=150.0)
+    parser.add_argument("--first-output-budget-ms", type=float, default=400.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # Warm the OS file cache so runs are comparable
+        measure_import(workdir)
+        imports, eager = [], set()
+        for _ in range(args.runs):
+            elapsed, loaded = measure_import(workdir)
+            imports.append(elapsed)
+            eager.update(filter(None, loaded))
+        first_output = [measure_first_output(workdir) for _ in range(args.runs)]
+
+    ok = _report("import", imports, args.import_budget_ms)
+    ok = _report("first output", first_output, args.first_output_budget_ms) and ok
+    if eager:
+        print(f"eagerly imported: {', '.join(sorted(eager))}")
+        ok = False
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,439 @@
+"""Reproducible performance benchmarks for the launcher's update path.
+
+Generates a synthetic mod pack (configurable size and file count, fixed
+seed), publishes it as split archives from a local HTTP server standing
+in for MOD_HOSTING_BASE_URL, and times:
+
+* UpdateChecker.download_release_assets
+* ArchiveHandler.extract_archive
+* utils.clean_directory
+* utils.calculate_checksum (one call per file) and utils.iter_file_digests
+* RebirthLauncher.update, as a full install and as a delta update
+
+Everything runs offline in a temporary directory. Without pack options
+every case in ``DEFAULT_MATRIX`` runs; benchmarks of cases after the first
+are reported as ``name[case]``. Results are written as JSON; ``--compare``
+checks them against an earlier run and exits non-zero when a benchmark got
+slower than ``--threshold`` allows.
+
+Usage::
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --compare results.json
+    python benchmarks/suite.py --size-mb 8 --files 200 --chunk-mb 2
+"""
+import argparse
+import atexit
+import functools
+import http.server
+import json
+import logging
+import os
+from pathlib import Path
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Optional
+import zipfile
+
+# The launcher keeps caches in the per-user data dir; point it at a scratch
+# dir before the package is imported so runs neither read warm caches from
+# nor write into the real profile
+_DATA_DIR = tempfile.mkdtemp(prefix="rebirth-bench-data-")
+atexit.register(shutil.rmtree, _DATA_DIR, ignore_errors=True)
+os.environ["LOCALAPPDATA"] = os.environ["XDG_CACHE_HOME"] = _DATA_DIR
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rebirth_launcher.archive import ArchiveHandler  # noqa: E402
+from rebirth_launcher.config import LauncherConfig  # noqa: E402
+from rebirth_launcher.launcher import RebirthLauncher  # noqa: E402
+from rebirth_launcher.manifest import ReleaseManifest  # noqa: E402
+from rebirth_launcher.update_checker import (  # noqa: E402
+    CHECKSUM_CHUNKS,
+    ReleaseInfo,
+    UpdateChecker,
+    combine_checksums,
+)
+from rebirth_launcher.utils import (  # noqa: E402
+    calculate_checksum,
+    clean_directory,
+    iter_file_digests,
+)
+
+MIB = 1024 * 1024
+PACK_NAME = "Rebirth"
+
+# Pack shapes run when none is given on the command line. Small zip chunks
+# put entries and headers across part boundaries, which split reads must
+# handle.
+DEFAULT_MATRIX: tuple[dict[str, Any], ...] = (
+    {"name": "default", "size_mb": 64, "files": 2000, "chunk_mb": 16,
+     "format": "zip"},
+    {"name": "zip-small-chunks", "size_mb": 8, "files": 200, "chunk_mb": 2,
+     "format": "zip"},
+)
+_CASE_PARAMS = ("size_mb", "files", "chunk_mb", "format")
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def generate_tree(root: Path, total_bytes: int, file_count: int, seed: int) -> None:
+    """Write a mod-like tree: half random bytes, half repetitive XML."""
+    rng = random.Random(seed)
+    per_file = max(1, total_bytes // file_count)
+    filler = b"<property name=\"Value\" value=\"1\"/>\n"
+    for i in range(file_count):
+        path = root / PACK_NAME / f"Mod{i % 20:02d}" / "Config" / f"file{i:05d}.xml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        size = max(1, int(per_file * rng.uniform(0.5, 1.5)))
+        random_part = rng.randbytes(size // 2)
+        text_part = (filler * (size // len(filler) + 1))[:size - len(random_part)]
+        path.write_bytes(random_part + text_part)
+
+def publish_release(
+    tree: Path,
+    www: Path,
+    version: str,
+    archive_format: str,
+    chunk_bytes: int
+) -> ReleaseInfo:
+    """Archive, split and publish a tree the way releases are hosted."""
+    release_dir = www / f"v{version}"
+    release_dir.mkdir(parents=True)
+    archive_path = release_dir / f"rebirth.{archive_format}"
+    if archive_format == "zip":
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for path in sorted(tree.rglob("*")):
+                if path.is_file():
+                    archive.write(path, path.relative_to(tree).as_posix())
+    else:
+        with tarfile.open(archive_path, "w") as archive:
+            archive.add(tree, arcname=".")
+
+    chunks = []
+    with open(archive_path, "rb") as f:
+        index = 1
+        while block := f.read(chunk_bytes):
+            name = f"{archive_path.name}.split.{index}"
+            (release_dir / name).write_bytes(block)
+            chunks.append(name)
+            index += 1
+    archive_path.unlink()
+
+    shutil.copytree(tree, release_dir / "files")
+    manifest = ReleaseManifest.build(tree, version)
+    (release_dir / "manifest.json").write_text(json.dumps(manifest.to_dict()))
+
+    chunk_checksums = {
+        name: calculate_checksum(release_dir / name) or "" for name in chunks
+    }
+    return ReleaseInfo(
+        version=version,
+        tag_name=f"v{version}",
+        chunks=chunks,
+        checksum=combine_checksums([chunk_checksums[n] for n in chunks]),
+        chunk_checksums=chunk_checksums,
+        manifest="manifest.json",
+        checksum_type=CHECKSUM_CHUNKS,
+    )
+
+def tree_size(root: Path) -> int:
+    return sum(p.stat().st_size for p in root.rglob("*") if p.is_file())
+
+def measure(
+    func: Callable[[], Any],
+    setup: Optional[Callable[[], None]],
+    repeat: int,
+    processed_bytes: int
+) -> dict[str, Any]:
+    """Time ``func`` ``repeat`` times, running ``setup`` untimed before each."""
+    runs = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        if func() is False:
+            raise RuntimeError("benchmarked call reported failure")
+        runs.append(time.perf_counter() - start)
+    median = statistics.median(runs)
+    return {
+        "runs": runs,
+        "median": median,
+        "min": min(runs),
+        "bytes": processed_bytes,
+        "throughput_mib_s": processed_bytes / MIB / median if median else None,
+    }
+
+def _reset_dir(path: Path) -> None:
+    shutil.rmtree(path, ignore_errors=True)
+    path.mkdir(parents=True)
+
+def run_suite(args: argparse.Namespace, work: Path) -> dict[str, Any]:
+    www = work / "www"
+    source = work / "source"
+    game = work / "game"
+    mods = game / "Mods"
+    (game).mkdir(parents=True)
+    (game / "7DaysToDie.exe").touch()
+
+    print(f"Generating {args.size_mb} MiB pack of {args.files} files...")
+    generate_tree(source / "v1", args.size_mb * MIB, args.files, args.seed)
+    release = publish_release(
+        source / "v1", www, "1.0.0", args.format, args.chunk_mb * MIB
+    )
+
+    # Second release with a few percent of files changed, for delta updates
+    shutil.copytree(source / "v1", source / "v2")
+    rng = random.Random(args.seed + 1)
+    files = sorted(p for p in (source / "v2").rglob("*") if p.is_file())
+    for path in rng.sample(files, max(1, len(files) * args.delta_percent // 100)):
+        path.write_bytes(rng.randbytes(path.stat().st_size))
+    delta_release = publish_release(
+        source / "v2", www, "1.1.0", args.format, args.chunk_mb * MIB
+    )
+
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(_QuietHandler, directory=str(www))
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    config_path = work / "launcher_config.json"
+    config_path.write_text(json.dumps({
+        "game_path": str(game),
+        "mods_path": str(mods),
+        "version": "v0.0.0",
+        "mod_hosting_url": f"http://127.0.0.1:{server.server_port}",
+        "chunk_cache_enabled": args.chunk_cache,
+        "chunk_cache_path": str(work / "chunk_cache"),
+    }))
+    LauncherConfig._instance = LauncherConfig.load(config_path)
+    config = LauncherConfig._instance
+
+    pack_bytes = sum(
+        (www / "v1.0.0" / name).stat().st_size for name in release.chunks
+    )
+    content_bytes = tree_size(source / "v1")
+    results: dict[str, Any] = {}
+
+    def bench(name: str, *call: Any, **kwargs: Any) -> None:
+        if args.only and name not in args.only:
+            return
+        print(f"  {name}...", flush=True)
+        results[name] = measure(*call, repeat=args.repeat, **kwargs)
+
+    try:
+        downloads = work / "downloads"
+        bench(
+            "download_release_assets",
+            lambda: UpdateChecker().download_release_assets(release, downloads),
+            lambda: _reset_dir(downloads),
+            processed_bytes=pack_bytes,
+        )
+
+        _reset_dir(downloads)
+        UpdateChecker().download_release_assets(release, downloads)
+        extracted = work / "extracted"
+        bench(
+            "extract_archive",
+            lambda: ArchiveHandler().extract_archive(
+                downloads / release.chunks[0], extracted
+            ),
+            lambda: _reset_dir(extracted),
+            processed_bytes=content_bytes,
+        )
+
+        scratch = work / "scratch"
+
+        def copy_tree() -> None:
+            shutil.rmtree(scratch, ignore_errors=True)
+            shutil.copytree(source / "v1", scratch)
+
+        bench(
+            "clean_directory",
+            lambda: clean_directory(scratch),
+            copy_tree,
+            processed_bytes=content_bytes,
+        )
+
+        all_files = sorted(p for p in (source / "v1").rglob("*") if p.is_file())
+        bench(
+            "calculate_checksum",
+            lambda: [calculate_checksum(path) for path in all_files],
+            None,
+            processed_bytes=content_bytes,
+        )
+        bench(
+            "iter_file_digests",
+            lambda: list(iter_file_digests(all_files)),
+            None,
+            processed_bytes=content_bytes,
+        )
+
+        def reset_install(version: str, tree: Optional[Path]) -> None:
+            for path in game.iterdir():
+                if path.name == "7DaysToDie.exe":
+                    continue
+                if path.is_dir():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
+            if tree is not None:
+                shutil.copytree(tree, mods)
+            config.version = version
+
+        bench(
+            "update_full",
+            lambda: RebirthLauncher().update(release),
+            lambda: reset_install("v0.0.0", None),
+            processed_bytes=pack_bytes,
+        )
+        bench(
+            "update_delta",
+            lambda: RebirthLauncher().update(delta_release),
+            lambda: reset_install(release.tag_name, source / "v1"),
+            processed_bytes=content_bytes,
+        )
+    finally:
+        server.shutdown()
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "params": {
+                "size_mb": args.size_mb,
+                "files": args.files,
+                "chunk_mb": args.chunk_mb,
+                "format": args.format,
+                "delta_percent": args.delta_percent,
+                "seed": args.seed,
+                "repeat": args.repeat,
+                "chunk_cache": args.chunk_cache,
+            },
+        },
+        "benchmarks": results,
+    }
+
+def print_results(results: dict[str, Any]) -> None:
+    for name, result in results["benchmarks"].items():
+        throughput = result["throughput_mib_s"]
+        print(
+            f"{name:<36} median {result['median']:8.3f} s  "
+            f"min {result['min']:8.3f} s  "
+            + (f"{throughput:8.1f} MiB/s" if throughput else "")
+        )
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float
+) -> bool:
+    """Print the change per benchmark; False if any regressed."""
+    if current["meta"]["params"] != baseline["meta"]["params"]:
+        print("warning: benchmark parameters differ from the baseline")
+
+    ok = True
+    print(f"\nCompared with {baseline['meta'].get('revision') or 'baseline'}:")
+    for name, result in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if not base:
+            print(f"{name:<36} (no baseline)")
+            continue
+        change = result["median"] / base["median"] - 1
+        regressed = change > threshold
+        ok = ok and not regressed
+        print(
+            f"{name:<36} {base['median']:8.3f} s -> {result['median']:8.3f} s "
+            f"({change:+.1%}){'  REGRESSION' if regressed else ''}"
+        )
+    return ok
+
+def _cases(args: argparse.Namespace) -> list[argparse.Namespace]:
+    """Run parameters: the command line's, or every ``DEFAULT_MATRIX`` case."""
+    given = {
+        name: getattr(args, name)
+        for name in _CASE_PARAMS
+        if getattr(args, name) is not None
+    }
+    matrix = [{**DEFAULT_MATRIX[0], **given, "name": "custom"}] if given else (
+        list(DEFAULT_MATRIX)
+    )
+    cases = []
+    for params in matrix:
+        case = argparse.Namespace(**vars(args))
+        for name in _CASE_PARAMS:
+            setattr(case, name, params[name])
+        case.case = params["name"]
+        cases.append(case)
+    return cases
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int)
+    parser.add_argument("--files", type=int)
+    parser.add_argument("--chunk-mb", type=int)
+    parser.add_argument("--format", choices=("zip", "tar"))
+    parser.add_argument("--delta-percent", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--chunk-cache", action="store_true",
+        help="Leave the chunk cache on (downloads then measure cache hits)"
+    )
+    parser.add_argument("--only", nargs="*", help="Benchmarks to run")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="Slowdown that counts as a regression (default 0.10 = 10%%)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="rebirth-bench-") as work:
+        for index, case in enumerate(_cases(args)):
+            case_results = run_suite(case, Path(work) / str(index))
+            if not results:
+                results = case_results
+                continue
+            for name, result in case_results["benchmarks"].items():
+                results["benchmarks"][f"{name}[{case.case}]"] = result
+
+    print()
+    print_results(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if not compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,88 +1,539 @@
 """Archive handling utilities for Rebirth Launcher."""
-from pathlib import Path
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+import io
+import os
+import re
+import shutil
 import subprocess
 import logging
-from typing import Optional
+import tarfile
+import threading
+import zipfile
+from typing import IO, Any, Callable, Optional
 
-from rebirth_launcher.exceptions import ModError
+from rebirth_launcher.config import get_config
+from rebirth_launcher.exceptions import ConfigError, ModError
+from rebirth_launcher.tracing import span
 from rebirth_launcher.utils import ensure_directory
 
 logger = logging.getLogger(__name__)
 
+# Formats that can be extracted front to back without seeking
+STREAMABLE_ARCHIVE_SUFFIXES = (
+    ".tar",
+    ".tar.gz",
+    ".tgz",
+    ".tar.bz2",
+    ".tar.xz",
+    ".txz",
+)
+
+# Read size used when pulling data through a split archive stream
+_STREAM_BUFFER_SIZE = 1024 * 1024
+
+# Names 7-Zip ships under: full build, standalone, and 7-Zip for Linux
+_7ZIP_EXECUTABLES = ("7z", "7za", "7zz")
+
+_7ZIP_PROGRESS_PATTERN = re.compile(r"(\d+)%")
+
+_SPLIT_PART_PATTERN = re.compile(r"^(?P<base>.+\.split\.)(?P<index>\d+)$")
+
+def is_streamable_archive(chunk_name: str) -> bool:
+    """Check whether a split archive can be extracted as it arrives.
+
+    ``chunk_name`` is the name of any part, e.g. ``rebirth.tar.xz.split.1``.
+    """
+    return _archive_name(chunk_name).endswith(STREAMABLE_ARCHIVE_SUFFIXES)
+
+def split_archive_parts(archive_path: Path) -> list[Path]:
+    """List every part of a split archive, given its first part.
+
+    Archives that are not split come back as a single-element list.
+    """
+    match = _SPLIT_PART_PATTERN.match(archive_path.name)
+    if not match:
+        return [archive_path]
+    
+    parts = []
+    index = int(match.group('index'))
+    while True:
+        part = archive_path.with_name(f"{match.group('base')}{index}")
+        if not part.exists():
+            return parts
+        parts.append(part)
+        index += 1
+
+class SplitArchiveStream(io.RawIOBase):
+    """Reads the parts of a split archive back to back as one stream.
+
+    Parts are pulled from ``parts`` only when the reader reaches them, so
+    an iterator that blocks until a part has been downloaded makes the
+    reader wait exactly when it runs out of data. Each part is deleted
+    once it has been read in full.
+    """
+    
+    def __init__(self, parts: Iterator[Path]) -> None:
+        super().__init__()
+        self._parts = parts
+        self._current: Optional[IO[bytes]] = None
+        self._current_path: Optional[Path] = None
+        self.bytes_read = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer: Any) -> int:
+        while True:
+            if self._current is None:
+                try:
+                    self._current_path = next(self._parts)
+                except StopIteration:
+                    return 0
+                self._current = open(self._current_path, 'rb')
+            
+            count = self._current.readinto(buffer)
+            if count:
+                self.bytes_read += count
+                return count
+            self._finish_part()
+    
+    def drain(self) -> None:
+        """Consume any remaining parts, e.g. archive padding."""
+        while self.readinto(bytearray(_STREAM_BUFFER_SIZE)):
+            pass
+    
+    def close(self) -> None:
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+        # Stops any downloads still running behind the iterator
+        close_parts = getattr(self._parts, 'close', None)
+        if close_parts is not None:
+            close_parts()
+        super().close()
+    
+    def _finish_part(self) -> None:
+        """Close and delete the part that was just read."""
+        assert self._current is not None and self._current_path is not None
+        self._current.close()
+        self._current = None
+        self._current_path.unlink(missing_ok=True)
+
+class MultiPartFile(io.RawIOBase):
+    """Seekable read-only view of split archive parts as one file."""
+    
+    def __init__(self, parts: list[Path]) -> None:
+        super().__init__()
+        self._parts = parts
+        self._starts: list[int] = []
+        offset = 0
+        for part in parts:
+            self._starts.append(offset)
+            offset += part.stat().st_size
+        self._size = offset
+        self._position = 0
+        self._handle: Optional[IO[bytes]] = None
+        self._handle_index = -1
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._position = max(0, offset)
+        return self._position
+    
+    def readinto(self, buffer: Any) -> int:
+        """Fill ``buffer``, reading across part boundaries.
+        
+        Only returns short at the end of the last part; zipfile reads
+        headers with a single read and treats a short one as corrupt.
+        """
+        view = memoryview(buffer).cast('B')
+        filled = 0
+        while filled < len(view) and self._position < self._size:
+            index = bisect_right(self._starts, self._position) - 1
+            if index != self._handle_index:
+                if self._handle is not None:
+                    self._handle.close()
+                self._handle = open(self._parts[index], 'rb')
+                self._handle_index = index
+            
+            assert self._handle is not None
+            self._handle.seek(self._position - self._starts[index])
+            count = self._handle.readinto(view[filled:])
+            if not count:
+                break  # Part shorter than when it was measured
+            self._position += count
+            filled += count
+        return filled
+    
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        super().close()
+
+class ExtractionBackend(ABC):
+    """Strategy for extracting mod archives."""
+    
+    name: str = ""
+    
+    @abstractmethod
+    def supports(self, archive_path: Path) -> bool:
+        """Check whether this backend can extract the archive."""
+    
+    @abstractmethod
+    def extract(
+        self,
+        archive_path: Path,
+        output_dir: Path,
+        password: str | None = None,
+        progress_callback: Callable[[float], None] | None = None
+    ) -> bool:
+        """Extract an archive, given its first part if split."""
+
+class SevenZipBackend(ExtractionBackend):
+    """Extracts archives by shelling out to 7-Zip."""
+    
+    name = "7zip"
+    
+    def __init__(self, executable: Path) -> None:
+        self.executable = executable
+    
+    @classmethod
+    def find(cls) -> Optional["SevenZipBackend"]:
+        """Create a backend for the first 7-Zip found, if any."""
+        executable = find_7zip()
+        return cls(executable) if executable else None
+    
+    def supports(self, archive_path: Path) -> bool:
+        return True
+    
+    def extract(
+        self,
+        archive_path: Path,
+        output_dir: Path,
+        password: str | None = None,
+        progress_callback: Callable[[float], None] | None = None
+    ) -> bool:
+        # Build command
+        cmd = [
+            str(self.executable),
+            "x",  # extract with full paths
+            "-y",  # yes to all prompts
+            "-bsp1",  # progress percentages on stdout
+            f"-o{output_dir}",  # output directory
+        ]
+        
+        if password:
+            cmd.append(f"-p{password}")
+        
+        cmd.append(str(archive_path))
+        
+        # Run extraction, relaying the progress 7-Zip reports
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True
+        )
+        stdout = process.stdout
+        assert stdout is not None
+        output = []
+        with stdout:
+            for text in iter(lambda: stdout.read(256), ''):
+                output.append(text)
+                percentages = _7ZIP_PROGRESS_PATTERN.findall(text)
+                if progress_callback and percentages:
+                    progress_callback(int(percentages[-1]) / 100)
+        
+        if process.wait() != 0:
+            logger.error(
+                "7-Zip extraction failed: %s",
+                "".join(output)[-2000:]
+            )
+            return False
+        
+        return True
+
+class PythonBackend(ExtractionBackend):
+    """Extracts zip and tar family archives in-process.
+
+    Zip entries are independent, so they are decompressed on a thread
+    pool (zlib releases the GIL). Compressed tar streams can only be read
+    front to back and are extracted sequentially.
+    """
+    
+    name = "python"
+    
+    def __init__(self, workers: Optional[int] = None) -> None:
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    
+    def supports(self, archive_path: Path) -> bool:
+        name = _archive_name(archive_path.name)
+        return name.endswith((".zip",) + STREAMABLE_ARCHIVE_SUFFIXES)
+    
+    def extract(
+        self,
+        archive_path: Path,
+        output_dir: Path,
+        password: str | None = None,
+        progress_callback: Callable[[float], None] | None = None
+    ) -> bool:
+        parts = split_archive_parts(archive_path)
+        if _archive_name(archive_path.name).endswith(".zip"):
+            return self._extract_zip(
+                parts, output_dir, password, progress_callback
+            )
+        
+        if password:
+            raise ModError(
+                "Password protected tar archives are not supported",
+                f"Path: {archive_path}"
+            )
+        
+        total = sum(part.stat().st_size for part in parts)
+        with MultiPartFile(parts) as raw:
+            reader = io.BufferedReader(raw, buffer_size=_STREAM_BUFFER_SIZE)
+            with tarfile.open(fileobj=reader, mode='r|*') as archive:
+                for member in archive:
+                    _extract_tar_member(archive, member, output_dir)
+                    if progress_callback and total:
+                        progress_callback(min(raw.tell() / total, 1.0))
+        return True
+    
+    def extract_stream(self, stream: io.RawIOBase, output_dir: Path) -> bool:
+        """Extract a tar-family archive from a forward-only stream.
+
+        Entries are written as soon as their bytes arrive, so extraction
+        overlaps with whatever produces the stream.
+        """
+        reader = io.BufferedReader(stream, buffer_size=_STREAM_BUFFER_SIZE)
+        with tarfile.open(fileobj=reader, mode='r|*') as archive:
+            for member in archive:
+                _extract_tar_member(archive, member, output_dir)
+        return True
+    
+    def _extract_zip(
+        self,
+        parts: list[Path],
+        output_dir: Path,
+        password: str | None,
+        progress_callback: Callable[[float], None] | None
+    ) -> bool:
+        """Extract zip entries concurrently, one archive handle per thread."""
+        pwd = password.encode() if password else None
+        root = output_dir.resolve()
+        
+        with MultiPartFile(parts) as raw, zipfile.ZipFile(raw) as archive:
+            entries = archive.infolist()
+        
+        # Create the directory tree up front so workers never race on it
+        files = []
+        for info in entries:
+            target = _safe_zip_target(root, info.filename)
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                files.append((info, target))
+        
+        total = sum(info.file_size for info, _ in files) or 1
+        done = 0
+        lock = threading.Lock()
+        local = threading.local()
+        # ZipFile doesn't close a file object it was given
+        handles: list[tuple[zipfile.ZipFile, MultiPartFile]] = []
+        
+        def open_handle() -> None:
+            raw = MultiPartFile(parts)
+            local.archive = zipfile.ZipFile(raw)
+            with lock:
+                handles.append((local.archive, raw))
+        
+        def extract_entry(info: zipfile.ZipInfo, target: Path) -> None:
+            nonlocal done
+            with local.archive.open(info, pwd=pwd) as src:
+                with open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, _STREAM_BUFFER_SIZE)
+            if progress_callback:
+                with lock:
+                    done += info.file_size
+                    progress_callback(done / total)
+        
+        executor = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="extract",
+            initializer=open_handle
+        )
+        try:
+            for future in [executor.submit(extract_entry, *f) for f in files]:
+                future.result()
+        finally:
+            # Workers may still be reading; stop them before closing handles
+            executor.shutdown(wait=True, cancel_futures=True)
+            for archive, raw in handles:
+                archive.close()
+                raw.close()
+        return True
+
 class ArchiveHandler:
-    """Handles archive operations for mod files."""
+    """Handles archive operations for mod files.
+
+    The extraction backend comes from ``config.extraction_backend``:
+    ``"python"`` for in-process zip/tar extraction, ``"7zip"`` for the
+    7-Zip command line, or ``"auto"`` to use the in-process engine where
+    it supports the format and 7-Zip otherwise.
+    """
     
     def __init__(self) -> None:
         """Initialize archive handler."""
-        self._7zip_path = self._find_7zip()
-        if not self._7zip_path:
-            logger.error("7-Zip not found in common installation paths")
+        self.config = get_config()
+        self.python_backend = PythonBackend(self.config.extraction_workers)
+        self.seven_zip_backend = SevenZipBackend.find()
+        if not self.seven_zip_backend:
+            logger.debug("7-Zip not found on PATH or in common paths")
     
     def extract_archive(
         self,
         archive_path: Path,
         output_dir: Path,
-        password: str | None = None
+        password: str | None = None,
+        progress_callback: Callable[[float], None] | None = None
     ) -> bool:
         """Extract archive to specified directory."""
         try:
-            if not self._7zip_path:
-                raise ModError("7-Zip not found", "Please install 7-Zip")
-            
             if not archive_path.exists():
                 raise ModError(
                     "Archive not found",
                     f"Path: {archive_path}"
                 )
             
+            backend = self._select_backend(archive_path)
+            
             # Ensure output directory exists
             ensure_directory(output_dir)
             
-            # Build command
-            cmd = [
-                str(self._7zip_path),
-                "x",  # extract with full paths
-                "-y",  # yes to all prompts
-                f"-o{output_dir}",  # output directory
-            ]
-            
-            if password:
-                cmd.append(f"-p{password}")
-            
-            cmd.append(str(archive_path))
-            
-            # Run extraction
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=False
+            logger.debug(
+                "Extracting %s with %s backend", archive_path.name, backend.name
             )
-            
-            if result.returncode != 0:
-                logger.error(
-                    "7-Zip extraction failed: %s",
-                    result.stderr
+            with span("extract", "extract", backend=backend.name) as timing:
+                timing.bytes = sum(
+                    part.stat().st_size
+                    for part in split_archive_parts(archive_path)
+                )
+                return backend.extract(
+                    archive_path, output_dir, password, progress_callback
                 )
-                return False
             
-            return True
+        except (ModError, ConfigError):
+            raise
+        except Exception as e:
+            logger.exception("Failed to extract archive")
+            return False
+    
+    def extract_stream(self, stream: io.RawIOBase, output_dir: Path) -> bool:
+        """Extract a tar-family archive from a forward-only stream."""
+        try:
+            ensure_directory(output_dir)
+            with span("extract_stream", "extract") as timing:
+                try:
+                    return self.python_backend.extract_stream(stream, output_dir)
+                finally:
+                    timing.bytes = getattr(stream, 'bytes_read', None)
             
         except ModError:
             raise
         except Exception as e:
-            logger.exception("Failed to extract archive")
+            logger.exception("Failed to extract archive stream")
             return False
     
-    def _find_7zip(self) -> Path | None:
-        """Find 7-Zip executable."""
-        common_paths = [
-            Path(r"C:\Program Files\7-Zip\7z.exe"),
-            Path(r"C:\Program Files (x86)\7-Zip\7z.exe"),
-        ]
+    def _select_backend(self, archive_path: Path) -> ExtractionBackend:
+        """Pick the configured backend able to handle ``archive_path``."""
+        choice = self.config.extraction_backend
+        if choice not in ("auto", "python", "7zip"):
+            raise ConfigError(
+                "Unknown extraction backend",
+                f"Expected auto, python or 7zip, got {choice!r}"
+            )
         
-        for path in common_paths:
-            if path.exists():
-                return path
+        if choice != "7zip" and self.python_backend.supports(archive_path):
+            return self.python_backend
+        if choice != "python" and self.seven_zip_backend:
+            return self.seven_zip_backend
         
-        return None 
\ No newline at end of file
+        if choice == "python":
+            raise ModError(
+                "Archive format not supported by the python backend",
+                f"Path: {archive_path}"
+            )
+        raise ModError("7-Zip not found", "Please install 7-Zip")
+
+def find_7zip() -> Path | None:
+    """Find 7-Zip executable on PATH or in common installation paths."""
+    for name in _7ZIP_EXECUTABLES:
+        found = shutil.which(name)
+        if found:
+            return Path(found)
+    
+    common_paths = [
+        Path(r"C:\Program Files\7-Zip\7z.exe"),
+        Path(r"C:\Program Files (x86)\7-Zip\7z.exe"),
+    ]
+    
+    for path in common_paths:
+        if path.exists():
+            return path
+    
+    return None
+
+def _archive_name(name: str) -> str:
+    """Lowercase archive name with any ``.split.N`` suffix removed."""
+    return name.lower().split(".split.")[0]
+
+def _safe_zip_target(root: Path, name: str) -> Path:
+    """Resolve a zip entry name below ``root``, rejecting path traversal."""
+    target = (root / PurePosixPath(name.replace('\\', '/'))).resolve()
+    if target != root and not target.is_relative_to(root):
+        raise ModError("Unsafe path in archive", f"Entry: {name}")
+    return target
+
+def _extract_tar_member(
+    archive: tarfile.TarFile,
+    member: tarfile.TarInfo,
+    output_dir: Path
+) -> None:
+    """Extract a single tar member after checking where it lands."""
+    if not _is_safe_member(member, output_dir):
+        raise ModError(
+            "Unsafe path in archive",
+            f"Entry: {member.name}"
+        )
+    if hasattr(tarfile, 'data_filter'):
+        archive.extract(member, output_dir, filter='data')
+    else:
+        archive.extract(member, output_dir)
+
+def _is_safe_member(member: tarfile.TarInfo, output_dir: Path) -> bool:
+    """Check that an archive entry stays inside the output directory."""
+    root = output_dir.resolve()
+    target = (root / member.name).resolve()
+    if member.islnk() or member.issym():
+        link_base = root if member.islnk() else target.parent
+        if not (link_base / member.linkname).resolve().is_relative_to(root):
+            return False
+    return target == root or target.is_relative_to(root)
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""Local cache of downloaded release chunks keyed by content hash."""
+from dataclasses import dataclass
+from pathlib import Path
+import logging
+import os
+import re
+import shutil
+import threading
+import uuid
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+# Share of the cap an automatic prune evicts down to, so a full cache
+# isn't rescanned on every put
+_PRUNE_LOW_WATER = 0.9
+
+@dataclass
+class CacheUsage:
+    """Size summary of the chunk cache."""
+    entries: int
+    total_bytes: int
+    max_bytes: int
+
+class ChunkCache:
+    """Size-capped store of verified chunks, named by their SHA256.
+    
+    Entries live at ``<root>/<first two hex digits>/<digest>``. A file's
+    mtime doubles as its last-use time, so eviction is least recently
+    used without an index to keep in sync. Only data whose digest has
+    already been verified is stored, so hits are trusted as-is.
+    
+    The cache size is scanned once and then kept as a running total, so
+    storing a chunk only lists the cache when it has grown past the cap.
+    """
+    
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        """Initialize cache rooted at ``root``."""
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Bytes in the cache; None until first needed
+        self._total_bytes: Optional[int] = None
+    
+    def get(self, digest: str, destination: Path) -> bool:
+        """Place a cached chunk at ``destination`` if it is present.
+        
+        Returns:
+            bool: True on a cache hit
+        """
+        entry = self._entry_path(digest)
+        if entry is None or not entry.is_file():
+            return False
+        
+        try:
+            _link_or_copy(entry, destination)
+            os.utime(entry)  # Mark as recently used
+            logger.debug("Chunk cache hit for %s", destination.name)
+            return True
+        except OSError:
+            logger.exception(f"Error reading {digest} from chunk cache")
+            return False
+    
+    def put(self, digest: str, source: Path) -> None:
+        """Store a verified file under its digest, pruning if over the cap."""
+        entry = self._entry_path(digest)
+        if entry is None or self.max_bytes <= 0:
+            return
+        
+        try:
+            if entry.exists():
+                os.utime(entry)
+                return
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = entry.with_name(f".{entry.name}.{uuid.uuid4().hex}")
+            _link_or_copy(source, temp_path)
+            os.replace(temp_path, entry)
+            size = entry.stat().st_size
+        except OSError:
+            logger.exception(f"Error adding {source} to chunk cache")
+            return
+        
+        with self._lock:
+            if self._total_bytes is None:
+                # The scan already counts the new entry
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += size
+            over = self._total_bytes > self.max_bytes
+        if over:
+            self.prune(int(self.max_bytes * _PRUNE_LOW_WATER))
+    
+    def usage(self) -> CacheUsage:
+        """Get the number and total size of cached chunks."""
+        entries = self._entries()
+        return CacheUsage(
+            entries=len(entries),
+            total_bytes=sum(size for _, size, _ in entries),
+            max_bytes=self.max_bytes
+        )
+    
+    def prune(self, max_bytes: Optional[int] = None) -> tuple[int, int]:
+        """Evict least recently used chunks until the cache fits.
+        
+        Args:
+            max_bytes: Size to prune down to; defaults to the configured cap
+        
+        Returns:
+            Number of chunks removed and bytes freed
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        removed = freed = 0
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            for path, size, _ in sorted(entries, key=lambda e: e[2]):
+                if total <= limit:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+                freed += size
+            self._total_bytes = total
+        
+        if removed:
+            logger.info("Evicted %d chunk(s) from cache", removed)
+        return removed, freed
+    
+    def clear(self) -> tuple[int, int]:
+        """Remove every cached chunk."""
+        removed, freed = self.prune(0)
+        shutil.rmtree(self.root, ignore_errors=True)
+        return removed, freed
+    
+    def _entry_path(self, digest: str) -> Optional[Path]:
+        digest = digest.lower()
+        if not _DIGEST_PATTERN.match(digest):
+            return None
+        return self.root / digest[:2] / digest
+    
+    def _entries(self) -> list[tuple[Path, int, float]]:
+        """List cached chunks as (path, size, last use)."""
+        entries = []
+        try:
+            with os.scandir(self.root) as buckets:
+                for bucket in buckets:
+                    if not bucket.is_dir():
+                        continue
+                    with os.scandir(bucket.path) as files:
+                        for entry in files:
+                            if not _DIGEST_PATTERN.match(entry.name):
+                                continue
+                            info = entry.stat()
+                            entries.append(
+                                (Path(entry.path), info.st_size, info.st_mtime)
+                            )
+        except FileNotFoundError:
+            pass
+        return entries
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Hard-link ``source`` to ``destination``, copying across devices."""
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
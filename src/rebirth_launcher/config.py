@@ -1,21 +1,35 @@
 """Configuration management for the Rebirth Launcher."""
+import functools
+import hashlib
 import json
 import logging
 import sys
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
+import os
 from pathlib import Path
-from typing import ClassVar, Optional
+from typing import Any, ClassVar, Optional
 
 from rebirth_launcher.constants import (
+    CHUNK_CACHE_DIRNAME,
     CURRENT_GAME_VERSION,
+    DATA_DIRNAME,
+    DEFAULT_CHUNK_CACHE_MAX_BYTES,
     DEFAULT_CONFIG_FILENAME,
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    DEFAULT_DOWNLOAD_RETRIES,
     DEFAULT_GAME_PATH,
+    DEFAULT_MIRROR_PROBE_TTL,
     DEFAULT_MODS_PATH,
+    DEFAULT_PREFLIGHT_TIMEOUT,
     DEFAULT_STEAM_PATH,
+    DEFAULT_UPDATE_CHECK_TTL,
     MOD_HOSTING_BASE_URL,
+    STEAM_APP_ID,
+    STEAM_LIBRARY_CACHE_FILENAME,
 )
 from rebirth_launcher.exceptions import ConfigError, GamePathError
-from rebirth_launcher.utils import is_valid_game_path
+from rebirth_launcher.tracing import traced
+from rebirth_launcher.utils import is_valid_game_path, write_json_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -31,14 +45,37 @@ class LauncherConfig:
     disable_eac: bool = field(default=True)
     custom_game_path: Optional[Path] = field(default=None)
     mod_hosting_url: str = field(default=MOD_HOSTING_BASE_URL)
+    mod_hosting_mirrors: list[str] = field(default_factory=list)
+    mirror_probe_ttl: int = field(default=DEFAULT_MIRROR_PROBE_TTL)
+    download_concurrency: int = field(default=DEFAULT_DOWNLOAD_CONCURRENCY)
+    download_retries: int = field(default=DEFAULT_DOWNLOAD_RETRIES)
+    download_rate_limit: Optional[int] = field(default=None)
+    pipelined_install: bool = field(default=True)
+    extraction_backend: str = field(default="auto")
+    extraction_workers: Optional[int] = field(default=None)
+    cleanup_mode: str = field(default="trash")
+    staged_install: bool = field(default=True)
+    chunk_cache_enabled: bool = field(default=True)
+    chunk_cache_max_bytes: int = field(default=DEFAULT_CHUNK_CACHE_MAX_BYTES)
+    chunk_cache_path: Optional[Path] = field(default=None)
+    update_check_ttl: int = field(default=DEFAULT_UPDATE_CHECK_TTL)
+    preflight_timeout: float = field(default=DEFAULT_PREFLIGHT_TIMEOUT)
+    validate: InitVar[bool] = True
     
     # Class variables
     _instance: ClassVar[Optional["LauncherConfig"]] = None
     _logger: ClassVar[logging.Logger] = logging.getLogger("LauncherConfig")
     
-    def __post_init__(self) -> None:
+    def __post_init__(self, validate: bool) -> None:
         """Validate paths after initialization."""
-        self.validate_paths()
+        # File this config was loaded from; save() writes back to it
+        self._config_path: Optional[Path] = None
+        # (path, text, stat key) of the file last read or written; lets
+        # save() skip rewriting an unchanged file
+        self._persisted: Optional[tuple[Path, str, Any]] = None
+        self._validated = False
+        if validate:
+            self.validate_paths()
     
     @classmethod
     def get_instance(cls) -> "LauncherConfig":
@@ -48,37 +85,60 @@ def get_instance(cls) -> "LauncherConfig":
         return cls._instance
     
     @classmethod
+    @traced("config_load", "disk")
     def load(cls, config_path: Optional[Path] = None) -> "LauncherConfig":
-        """Load configuration from file or create default."""
+        """Load configuration from file, or use defaults if there is none.
+        
+        Path validation is skipped when the validation cache beside the
+        config file shows the same config file and game directories were
+        validated before.
+        """
         if config_path is None:
             config_path = cls._get_default_config_path()
             
         try:
-            if not config_path.exists():
-                config = cls()
-                config.save(config_path)
-                cls._logger.info("Created new configuration file")
+            try:
+                with open(config_path, 'r') as f:
+                    text = f.read()
+                    file_key = _stat_key(os.fstat(f.fileno()))
+            except FileNotFoundError:
+                config = cls(validate=False)
+                config._config_path = config_path
+                config._validate_cached(config_path, None)
+                cls._logger.info("Using default configuration")
                 return config
-                
-            with open(config_path, 'r') as f:
-                data = json.load(f)
-                
+            
+            data = json.loads(text)
             # Convert path strings to Path objects
-            for key in ['steam_path', 'game_path', 'mods_path', 'custom_game_path']:
+            for key in [
+                'steam_path',
+                'game_path',
+                'mods_path',
+                'custom_game_path',
+                'chunk_cache_path',
+            ]:
                 if key in data and data[key] is not None:
                     data[key] = Path(data[key])
                     
-            config = cls(**data)
+            config = cls(**data, validate=False)
+            config._config_path = config_path
+            config._persisted = (config_path, text, file_key)
+            config._validate_cached(config_path, file_key)
             cls._logger.info("Loaded existing configuration")
             return config
-                
+        
         except Exception as e:
             raise ConfigError("Failed to load configuration", str(e))
     
     def save(self, config_path: Optional[Path] = None) -> None:
-        """Save configuration to file."""
+        """Save configuration to file if it changed.
+        
+        Defaults to the file the config was loaded from. The file is
+        replaced atomically, so a crash mid-save never leaves a truncated
+        config behind.
+        """
         if config_path is None:
-            config_path = self._get_default_config_path()
+            config_path = self._config_path or self._get_default_config_path()
             
         try:
             # Convert Path objects to strings
@@ -87,14 +147,49 @@ def save(self, config_path: Optional[Path] = None) -> None:
                 for k, v in self.__dict__.items()
                 if not k.startswith('_')
             }
+            text = json.dumps(data, indent=4)
+            
+            if self._persisted is not None:
+                path, persisted_text, file_key = self._persisted
+                if (
+                    path == config_path
+                    and persisted_text == text
+                    and file_key == _path_key(config_path)
+                ):
+                    self._logger.debug("Configuration unchanged, not saving")
+                    return
             
-            with open(config_path, 'w') as f:
-                json.dump(data, f, indent=4)
+            write_json_atomic(config_path, data)
+            file_key = _path_key(config_path)
+            self._persisted = (config_path, text, file_key)
+            if self._validated:
+                self._record_validation(
+                    config_path,
+                    self._validation_key(
+                        file_key, self._game_path_candidates()
+                    )
+                )
             self._logger.info(f"Saved configuration to {config_path}")
             
         except Exception as e:
             raise ConfigError("Failed to save configuration", str(e))
     
+    @property
+    def data_dir(self) -> Path:
+        """Per-user directory holding the launcher's cached state.
+        
+        Kept out of the install folder, which for a pip install is
+        site-packages and may not be writable.
+        """
+        return _user_data_dir()
+    
+    @property
+    def chunk_cache_dir(self) -> Path:
+        """Directory of the downloaded chunk cache."""
+        if self.chunk_cache_path is not None:
+            return self.chunk_cache_path
+        return self.data_dir / CHUNK_CACHE_DIRNAME
+    
     def validate_paths(self) -> None:
         """Validate and create necessary paths."""
         try:
@@ -102,23 +197,97 @@ def validate_paths(self) -> None:
             if self.custom_game_path and is_valid_game_path(self.custom_game_path):
                 self.game_path = self.custom_game_path
                 self.mods_path = self.game_path / "Mods"
+                self._validated = True
                 return
                 
-            # Check default path
+            # Check default path, then ask Steam where the game is
             if not is_valid_game_path(self.game_path):
-                raise GamePathError(
-                    "Game not found at configured path",
-                    f"Path: {self.game_path}"
-                )
+                discovered = self._discover_game_path()
+                if discovered is None:
+                    raise GamePathError(
+                        "Game not found at configured path",
+                        f"Path: {self.game_path}"
+                    )
+                if self.mods_path == self.game_path / "Mods":
+                    self.mods_path = discovered / "Mods"
+                self.game_path = discovered
                 
             # Create mods directory if needed
             self.mods_path.mkdir(parents=True, exist_ok=True)
+            self._validated = True
             
         except GamePathError:
             raise
         except Exception as e:
             raise ConfigError("Failed to validate paths", str(e))
     
+    def _discover_game_path(self) -> Optional[Path]:
+        """Find the game through Steam's library files, if Steam has it."""
+        from rebirth_launcher.steam_library import SteamLibrary
+        
+        install = SteamLibrary(
+            STEAM_APP_ID,
+            self.data_dir / STEAM_LIBRARY_CACHE_FILENAME,
+            self.steam_path
+        ).locate()
+        if install is None or not is_valid_game_path(install.path):
+            return None
+        self._logger.info(f"Found game in Steam library: {install.path}")
+        return install.path
+    
+    def _validate_cached(self, config_path: Path, file_key: Any) -> None:
+        """Validate paths unless the cache says nothing changed since."""
+        candidates = self._game_path_candidates()
+        key = self._validation_key(file_key, candidates)
+        try:
+            with open(_validation_cache_path(config_path), 'r') as f:
+                cached = json.load(f)
+            game_path = Path(cached['game_path'])
+            # A game found through Steam is outside the key; recheck it
+            if cached['key'] == key and (
+                game_path in candidates or is_valid_game_path(game_path)
+            ):
+                self.game_path = game_path
+                self.mods_path = Path(cached['mods_path'])
+                self._validated = True
+                self._logger.debug("Using cached path validation")
+                return
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        self.validate_paths()
+        # Validation may create the Mods folder, touching the game dir
+        self._record_validation(
+            config_path, self._validation_key(file_key, candidates)
+        )
+    
+    def _record_validation(self, config_path: Path, key: list[Any]) -> None:
+        """Remember that validation of ``key``'s inputs gave these paths."""
+        try:
+            write_json_atomic(_validation_cache_path(config_path), {
+                'key': key,
+                'game_path': str(self.game_path),
+                'mods_path': str(self.mods_path),
+            })
+        except OSError as e:
+            self._logger.debug(f"Could not write validation cache: {e}")
+    
+    def _game_path_candidates(self) -> list[Path]:
+        """Directories validate_paths() may pick the game from."""
+        return [p for p in (self.custom_game_path, self.game_path) if p]
+    
+    @staticmethod
+    def _validation_key(file_key: Any, candidates: list[Path]) -> list[Any]:
+        """Identify the inputs of validate_paths().
+        
+        Covers the config file and the identity and mtime of each
+        candidate game directory; adding or removing the executable or
+        the Mods folder changes the directory's mtime.
+        """
+        return [file_key] + [
+            [str(path), _path_key(path)] for path in candidates
+        ]
+    
     @staticmethod
     def _get_default_config_path() -> Path:
         """Get default configuration file path."""
@@ -127,4 +296,41 @@ def _get_default_config_path() -> Path:
 
 def get_config() -> LauncherConfig:
     """Get launcher configuration singleton."""
-    return LauncherConfig.get_instance()
\ No newline at end of file
+    return LauncherConfig.get_instance()
+
+@functools.lru_cache(maxsize=None)
+def _user_data_dir() -> Path:
+    """Create and return the per-user cache directory.
+    
+    ``%LOCALAPPDATA%`` on Windows, ``~/Library/Caches`` on macOS and
+    ``$XDG_CACHE_HOME`` (default ``~/.cache``) elsewhere.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or str(
+            Path.home() / "AppData" / "Local"
+        )
+    elif sys.platform == "darwin":
+        base = str(Path.home() / "Library" / "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    path = Path(base) / DATA_DIRNAME
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        # Cache writers already treat OSError as "run without the cache"
+        logger.warning(f"Could not create data directory {path}: {e}")
+    return path
+
+def _validation_cache_path(config_path: Path) -> Path:
+    # Installs share the data dir, so key the file on which config it is
+    digest = hashlib.sha256(str(config_path.resolve()).encode()).hexdigest()
+    return _user_data_dir() / f"{config_path.stem}.{digest[:16]}.validated.json"
+
+def _stat_key(info: os.stat_result) -> list[int]:
+    return [info.st_dev, info.st_ino, info.st_size, info.st_mtime_ns]
+
+def _path_key(path: Path) -> Optional[list[int]]:
+    try:
+        return _stat_key(path.stat())
+    except OSError:
+        return None
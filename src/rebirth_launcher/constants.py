@@ -26,14 +26,66 @@
 
 # Steam
 STEAM_APP_ID: Final[str] = "251570"  # 7 Days to Die
+# Game binaries: the Windows build (also run under Proton) and native Linux
+GAME_EXECUTABLES: Final[tuple[str, ...]] = (
+    "7DaysToDie.exe",
+    "7DaysToDie.x86_64",
+)
 
 # GitHub
 GITHUB_REPO: Final[str] = "brbrainerd/rebirth-launcher"
 GITHUB_API_BASE: Final[str] = f"https://api.github.com/repos/{GITHUB_REPO}"
+# Release asset describing the chunks of a mod pack version
+VERSION_INFO_ASSET: Final[str] = "version.json"
 
 # Mod hosting
 MOD_HOSTING_BASE_URL: Final[str] = "https://api.github.com/repos/brbrainerd/rebirth-mods"
 
+# HTTP transport
+# Seconds to establish a connection and to wait between received bytes
+HTTP_CONNECT_TIMEOUT: Final[float] = 10.0
+HTTP_READ_TIMEOUT: Final[float] = 30.0
+# Retries of a failed idempotent request, waiting 0.5s, 1s, 2s... between
+HTTP_RETRIES: Final[int] = 3
+HTTP_BACKOFF_FACTOR: Final[float] = 0.5
+# Minimum keep-alive connections per host
+HTTP_POOL_SIZE: Final[int] = 10
+
+# Downloads
+DEFAULT_DOWNLOAD_CONCURRENCY: Final[int] = 4
+DEFAULT_DOWNLOAD_RETRIES: Final[int] = 3
+PARTIAL_DOWNLOAD_SUFFIX: Final[str] = ".part"
+DEFAULT_CHUNK_CACHE_MAX_BYTES: Final[int] = 10 * 1024**3
+CHUNK_CACHE_DIRNAME: Final[str] = "chunk_cache"
+# Above this share of the pack a delta update falls back to the full download
+DELTA_UPDATE_MAX_FRACTION: Final[float] = 0.5
+
 # Launcher settings
 DEFAULT_CONFIG_FILENAME: Final[str] = "launcher_config.json"
-DEFAULT_LOG_FILENAME: Final[str] = "rebirth_launcher.log"
\ No newline at end of file
+# Per-user cache folder holding the launcher's cached state
+DATA_DIRNAME: Final[str] = "rebirth-launcher"
+DEFAULT_LOG_FILENAME: Final[str] = "rebirth_launcher.log"
+RELEASE_CACHE_FILENAME: Final[str] = "release_cache.json"
+MIRROR_CACHE_FILENAME: Final[str] = "mirror_cache.json"
+MOD_INVENTORY_FILENAME: Final[str] = "mod_inventory.json"
+STEAM_LIBRARY_CACHE_FILENAME: Final[str] = "steam_library.json"
+# Written in the game folder, as passed to -logfile
+GAME_LOG_FILENAME: Final[str] = "output_log.txt"
+# Seconds a cached release lookup is trusted without asking GitHub
+DEFAULT_UPDATE_CHECK_TTL: Final[int] = 3600
+# Seconds mirror latency/throughput probes are reused before probing again
+DEFAULT_MIRROR_PROBE_TTL: Final[int] = 1800
+# Seconds the pre-launch checks may take before launch gives up on them
+DEFAULT_PREFLIGHT_TIMEOUT: Final[float] = 15.0
+# Seconds an update check still running at launch is waited on afterwards
+POST_LAUNCH_CHECK_WAIT: Final[float] = 2.0
+# Siblings of the Mods directory used by staged installs
+STAGING_SUFFIX: Final[str] = ".staging"
+PREVIOUS_GENERATION_SUFFIX: Final[str] = ".previous"
+GENERATIONS_SUFFIX: Final[str] = ".generations.json"
+# Sibling of an installed tree listing its files for integrity checks
+INSTALL_INDEX_SUFFIX: Final[str] = ".index.json"
+# Sibling of a cleaned directory that holds entries awaiting deletion
+TRASH_DIRNAME: Final[str] = ".rebirth-trash"
+# Seconds a command waits at exit for trash it is still deleting
+PURGE_EXIT_TIMEOUT: Final[float] = 60.0
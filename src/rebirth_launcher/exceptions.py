@@ -20,10 +20,18 @@ class ModInstallError(ModError):
     """Raised when mod installation fails."""
     pass
 
+class ModDependencyError(ModInstallError):
+    """Raised when mod dependencies are missing or form a cycle."""
+    pass
+
 class ModUpdateError(ModError):
     """Raised when mod update fails."""
     pass
 
+class ChecksumError(ModUpdateError):
+    """Raised when downloaded data fails checksum verification."""
+    pass
+
 class UpdateError(ModError):
     """Raised when update operations fail."""
     pass
@@ -0,0 +1,236 @@
+"""On-disk index of installed files for incremental integrity checks."""
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+import json
+import logging
+import os
+import time
+from typing import Optional
+
+from rebirth_launcher.constants import INSTALL_INDEX_SUFFIX
+from rebirth_launcher.manifest import ManifestEntry
+from rebirth_launcher.utils import iter_file_digests, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+_INDEX_FORMAT = 1
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """Stat data and digest of an installed file when it was indexed."""
+    path: str
+    size: int
+    mtime_ns: int
+    inode: int
+    sha256: str
+    
+    def matches(self, info: os.stat_result) -> bool:
+        """Whether ``info`` shows the file untouched since indexing."""
+        return (
+            info.st_size == self.size
+            and info.st_mtime_ns == self.mtime_ns
+            and info.st_ino == self.inode
+        )
+
+@dataclass
+class IndexVerification:
+    """Result of checking an install against its index."""
+    checked: int = 0
+    rehashed: int = 0
+    missing: list[str] = field(default_factory=list)
+    modified: list[str] = field(default_factory=list)
+    untracked: list[str] = field(default_factory=list)
+    
+    @property
+    def intact(self) -> bool:
+        """Whether every indexed file is present and unmodified."""
+        return not (self.missing or self.modified)
+    
+    def summary(self) -> str:
+        """Human readable one-line summary of the check."""
+        return (
+            f"{self.checked} checked ({self.rehashed} rehashed), "
+            f"{len(self.missing)} missing, {len(self.modified)} modified, "
+            f"{len(self.untracked)} untracked"
+        )
+
+def index_path(root: Path) -> Path:
+    """Location of the index for the tree at ``root``."""
+    return root.with_name(root.name + INSTALL_INDEX_SUFFIX)
+
+class InstallIndex:
+    """Path, size, mtime, inode and SHA256 of every file below a root.
+    
+    The index lives beside the tree it describes (``Mods.index.json``)
+    as one compact JSON document with a row per file, and is replaced
+    atomically, so a crash leaves either the old or the new index. A
+    missing or unreadable index just means the next check rehashes
+    everything.
+    
+    Top-level entries named in ``preserve`` are not part of the install
+    and are not indexed.
+    """
+    
+    def __init__(
+        self,
+        root: Path,
+        preserve: Optional[set[str]] = None,
+        workers: Optional[int] = None
+    ) -> None:
+        """Initialize index for the tree at ``root``."""
+        self.root = root
+        self.preserve = preserve or set()
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.path = index_path(root)
+        self.entries: dict[str, IndexEntry] = {}
+    
+    def load(self) -> bool:
+        """Read the index from disk.
+        
+        Returns:
+            bool: False if there is no usable index
+        """
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            if data.get('format') != _INDEX_FORMAT:
+                raise ValueError(f"Unknown index format {data.get('format')}")
+            self.entries = {
+                row[0]: IndexEntry(*row) for row in data['files']
+            }
+            return True
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable install index {self.path}: {e}")
+            self.entries = {}
+            return False
+    
+    def save(self) -> None:
+        """Write the index to disk atomically."""
+        write_json_atomic(self.path, {
+            'format': _INDEX_FORMAT,
+            'files': [
+                [e.path, e.size, e.mtime_ns, e.inode, e.sha256]
+                for e in self.entries.values()
+            ],
+        }, indent=None)
+    
+    def rebuild(
+        self,
+        known_files: Optional[Mapping[str, ManifestEntry]] = None
+    ) -> None:
+        """Index the tree as it is now, then save.
+        
+        Args:
+            known_files: Trusted digests by path, e.g. the manifest of the
+                release just verified and installed; files whose size
+                matches take the digest from here instead of being hashed
+        """
+        start = time.perf_counter()
+        known = known_files or {}
+        previous = self.entries
+        stats = self._scan()
+        
+        digests: dict[str, Optional[str]] = {}
+        to_hash = []
+        for path, info in stats.items():
+            entry = previous.get(path)
+            if entry is not None and entry.matches(info):
+                digests[path] = entry.sha256
+            elif path in known and known[path].size == info.st_size:
+                digests[path] = known[path].sha256
+            else:
+                to_hash.append(path)
+        digests.update(self._hash(to_hash))
+        
+        self.entries = {
+            path: IndexEntry(
+                path, info.st_size, info.st_mtime_ns, info.st_ino, digest
+            )
+            for path, info in stats.items()
+            if (digest := digests.get(path)) is not None
+        }
+        self.save()
+        logger.info(
+            "Indexed %d installed file(s) in %.2fs (%d hashed)",
+            len(self.entries), time.perf_counter() - start, len(to_hash)
+        )
+    
+    def verify(self) -> IndexVerification:
+        """Compare the tree with the index, rehashing only changed files.
+        
+        Files whose size, mtime and inode still match are trusted. Files
+        that were touched but hash the same get their stat data refreshed
+        so they are not rehashed next time.
+        """
+        start = time.perf_counter()
+        result = IndexVerification()
+        stats = self._scan()
+        
+        suspects: dict[str, os.stat_result] = {}
+        for path, entry in self.entries.items():
+            info = stats.pop(path, None)
+            if info is None:
+                result.missing.append(path)
+            elif not entry.matches(info):
+                suspects[path] = info
+            result.checked += 1
+        result.untracked = sorted(stats)
+        
+        refreshed = False
+        for path, digest in self._hash(list(suspects)).items():
+            if digest != self.entries[path].sha256:
+                result.modified.append(path)
+                continue
+            info = suspects[path]
+            self.entries[path] = IndexEntry(
+                path, info.st_size, info.st_mtime_ns, info.st_ino, digest
+            )
+            refreshed = True
+        result.rehashed = len(suspects)
+        result.missing.sort()
+        result.modified.sort()
+        
+        if refreshed:
+            self.save()
+        logger.info(
+            "Verified install in %.2fs: %s",
+            time.perf_counter() - start, result.summary()
+        )
+        return result
+    
+    def _scan(self) -> dict[str, os.stat_result]:
+        """Stat every regular file below the root, keyed by POSIX path."""
+        stats: dict[str, os.stat_result] = {}
+        stack = [(str(self.root), "")]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if not prefix and entry.name in self.preserve:
+                            continue
+                        relative = prefix + entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, relative + "/"))
+                        elif entry.is_file(follow_symlinks=False):
+                            # DirEntry.stat() leaves st_ino zero on Windows
+                            try:
+                                stats[relative] = os.stat(entry.path)
+                            except FileNotFoundError:
+                                pass
+            except FileNotFoundError:
+                continue
+        return stats
+    
+    def _hash(self, paths: list[str]) -> dict[str, Optional[str]]:
+        """Hash files in parallel; unreadable files map to None."""
+        full_paths = {self.root / path: path for path in paths}
+        return {
+            full_paths[full]: digest
+            for full, digest in iter_file_digests(
+                full_paths, workers=self.workers
+            )
+        }
@@ -0,0 +1,111 @@
+"""Full integrity checks of an installed tree against a release manifest."""
+from dataclasses import dataclass, field
+from pathlib import Path
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from rebirth_launcher.manifest import ManifestEntry, ReleaseManifest
+from rebirth_launcher.tracing import span
+from rebirth_launcher.utils import format_bytes, iter_file_digests
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class IntegrityReport:
+    """Files of a release found missing or damaged on disk."""
+    checked: int = 0
+    bytes_hashed: int = 0
+    elapsed: float = 0.0
+    missing: list[ManifestEntry] = field(default_factory=list)
+    damaged: list[ManifestEntry] = field(default_factory=list)
+    
+    @property
+    def intact(self) -> bool:
+        """Whether every file matched the manifest."""
+        return not (self.missing or self.damaged)
+    
+    @property
+    def to_fetch(self) -> list[ManifestEntry]:
+        """Entries that have to be downloaded again to repair the tree."""
+        return self.missing + self.damaged
+    
+    @property
+    def throughput(self) -> float:
+        """Average hashing speed in bytes per second."""
+        return self.bytes_hashed / self.elapsed if self.elapsed else 0.0
+    
+    def summary(self) -> str:
+        """Human readable one-line summary of the check."""
+        return (
+            f"{self.checked} files checked, {len(self.missing)} missing, "
+            f"{len(self.damaged)} damaged "
+            f"({format_bytes(self.bytes_hashed)} hashed at "
+            f"{format_bytes(self.throughput)}/s)"
+        )
+
+def verify_tree(
+    manifest: ReleaseManifest,
+    root: Path,
+    preserve: Optional[set[str]] = None,
+    workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> IntegrityReport:
+    """Hash every manifest file below ``root`` and compare digests.
+    
+    Files with the wrong size are reported without being read. The rest
+    are hashed on a thread pool.
+    
+    Args:
+        manifest: Release the tree should match
+        root: Installed tree
+        preserve: Top-level entries to skip
+        workers: Hashing threads; defaults to one per core plus a few
+        progress_callback: Called with (bytes done, bytes total)
+    """
+    preserve = preserve or set()
+    start = time.perf_counter()
+    report = IntegrityReport()
+    
+    to_hash: list[ManifestEntry] = []
+    for entry in manifest.files.values():
+        if entry.path.split('/', 1)[0] in preserve:
+            continue
+        report.checked += 1
+        try:
+            size = (root / entry.path).stat().st_size
+        except OSError:
+            report.missing.append(entry)
+            continue
+        if size != entry.size:
+            report.damaged.append(entry)
+        else:
+            to_hash.append(entry)
+    
+    total = sum(entry.size for entry in to_hash)
+    done = 0
+    lock = threading.Lock()
+    
+    def advance(count: int) -> None:
+        nonlocal done
+        with lock:
+            done += count
+            if progress_callback:
+                progress_callback(done, total)
+    
+    by_path = {root / entry.path: entry for entry in to_hash}
+    with span("verify", "disk") as timing:
+        for full, digest in iter_file_digests(
+            by_path, workers=workers, progress_callback=advance
+        ):
+            if digest != by_path[full].sha256:
+                report.damaged.append(by_path[full])
+        timing.bytes = done
+    
+    report.bytes_hashed = done
+    report.elapsed = time.perf_counter() - start
+    report.missing.sort(key=lambda e: e.path)
+    report.damaged.sort(key=lambda e: e.path)
+    logger.info("Verified install: %s", report.summary())
+    return report
@@ -0,0 +1,243 @@
+"""Inventory of installed mods, read from their ModInfo.xml files."""
+from dataclasses import dataclass, field
+from pathlib import Path
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Any, Optional
+from xml.etree import ElementTree
+
+from rebirth_launcher.constants import MOD_INVENTORY_FILENAME
+from rebirth_launcher.mod_manager import ModInfo
+from rebirth_launcher.utils import write_json_atomic
+
+if TYPE_CHECKING:
+    from rebirth_launcher.config import LauncherConfig
+
+logger = logging.getLogger(__name__)
+
+MODINFO_FILENAME = "ModInfo.xml"
+
+_CACHE_FORMAT = 2
+
+@dataclass
+class InstalledMod:
+    """A folder below the Mods directory and the mod it holds."""
+    folder: str
+    info: Optional[ModInfo] = None
+    problem: Optional[str] = None
+    
+    @property
+    def name(self) -> str:
+        """Mod name, or the folder name if it has no usable ModInfo.xml."""
+        return self.info.name if self.info else self.folder
+
+@dataclass
+class InventoryScan:
+    """Result of scanning the Mods directory."""
+    mods: list[InstalledMod] = field(default_factory=list)
+    parsed: int = 0
+    cached: int = 0
+    elapsed: float = 0.0
+    
+    @property
+    def problems(self) -> list[InstalledMod]:
+        """Folders the game would not load as a mod."""
+        return [mod for mod in self.mods if mod.problem]
+    
+    def summary(self) -> str:
+        """Human readable one-line summary of the scan."""
+        return (
+            f"{len(self.mods)} mod folder(s), {len(self.problems)} with "
+            f"problems ({self.parsed} parsed, {self.cached} cached, "
+            f"{self.elapsed * 1000:.0f} ms)"
+        )
+
+def default_inventory(config: "LauncherConfig") -> "ModInventory":
+    """Inventory of the configured Mods directory."""
+    return ModInventory(
+        config.mods_path, config.data_dir / MOD_INVENTORY_FILENAME
+    )
+
+def parse_modinfo(path: Path) -> ModInfo:
+    """Read a ModInfo.xml file.
+    
+    Understands both the current layout, with ``<Name value=...>`` and
+    friends directly below the root, and the older one that wraps them in
+    a ``<ModInfo>`` element.
+    
+    Raises:
+        ValueError: If the file is not valid XML or names no mod
+        OSError: If the file cannot be read
+    """
+    try:
+        root = ElementTree.parse(path).getroot()
+    except ElementTree.ParseError as e:
+        raise ValueError(f"Invalid XML: {e}")
+    
+    def value(tag: str) -> Optional[str]:
+        element = root.find(f".//{tag}")
+        if element is None:
+            return None
+        text = element.get('value')
+        return text.strip() if text and text.strip() else None
+    
+    name = value('Name')
+    if not name:
+        raise ValueError("No <Name> element")
+    return ModInfo(
+        name=name,
+        version=value('Version') or "unknown",
+        description=value('Description'),
+        author=value('Author'),
+    )
+
+class ModInventory:
+    """Cached listing of the mods installed below a Mods directory.
+    
+    Each mod folder is recorded with the mtimes of the folder and of its
+    ModInfo.xml. A later scan only parses folders whose stamps changed,
+    so listing hundreds of unchanged mods costs one directory read and
+    two stats per mod.
+    """
+    
+    def __init__(self, mods_path: Path, cache_path: Path) -> None:
+        """Initialize inventory of ``mods_path`` cached in ``cache_path``."""
+        self.mods_path = mods_path
+        self.cache_path = cache_path
+    
+    def scan(self, refresh: bool = False) -> InventoryScan:
+        """List installed mods, sorted by folder name.
+        
+        Args:
+            refresh: Parse every ModInfo.xml, ignoring the cache
+        """
+        start = time.perf_counter()
+        cached = {} if refresh else self._load_cache()
+        result = InventoryScan()
+        records: dict[str, dict[str, Any]] = {}
+        
+        try:
+            with os.scandir(self.mods_path) as entries:
+                folders = sorted(
+                    (entry.name, entry.path) for entry in entries
+                    if entry.is_dir() and not entry.name.startswith('.')
+                )
+        except FileNotFoundError:
+            folders = []
+        
+        for folder, path in folders:
+            record = cached.get(folder)
+            if record is not None and record.get('stamp') == _folder_stamp(
+                path, record.get('modinfo') or MODINFO_FILENAME
+            ):
+                result.cached += 1
+            else:
+                modinfo = _find_modinfo(path)
+                record = {
+                    'stamp': _folder_stamp(path, modinfo or MODINFO_FILENAME),
+                    'modinfo': modinfo,
+                    **_read_folder(Path(path), modinfo),
+                }
+                result.parsed += 1
+            records[folder] = record
+            result.mods.append(_from_record(folder, record))
+        
+        if records != cached:
+            self._save_cache(records)
+        result.elapsed = time.perf_counter() - start
+        logger.debug("Scanned mods: %s", result.summary())
+        return result
+    
+    def _load_cache(self) -> dict[str, dict[str, Any]]:
+        """Read cached folder records, ignoring an unusable cache."""
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+            if (
+                data.get('format') != _CACHE_FORMAT
+                or data.get('mods_path') != str(self.mods_path)
+            ):
+                return {}
+            mods: dict[str, dict[str, Any]] = data['mods']
+            return mods
+        except (OSError, ValueError, KeyError, AttributeError):
+            return {}
+    
+    def _save_cache(self, records: dict[str, dict[str, Any]]) -> None:
+        try:
+            write_json_atomic(self.cache_path, {
+                'format': _CACHE_FORMAT,
+                'mods_path': str(self.mods_path),
+                'mods': records,
+            }, indent=None)
+        except OSError:
+            logger.warning("Failed to save mod inventory cache", exc_info=True)
+
+def _folder_stamp(path: str, modinfo: str) -> list[Optional[int]]:
+    """mtimes and sizes of a mod folder and its ModInfo.xml.
+    
+    The folder's mtime changes when files are added, removed or replaced
+    (as most editors and extractors do); the file's own mtime catches
+    edits in place.
+    
+    Args:
+        path: Mod folder
+        modinfo: Name of its ModInfo.xml, in the case found on disk
+    """
+    stamp: list[Optional[int]] = []
+    for target in (path, os.path.join(path, modinfo)):
+        try:
+            info = os.stat(target)
+            stamp.append(info.st_mtime_ns)
+            stamp.append(info.st_size)
+        except OSError:
+            stamp.extend((None, None))
+    return stamp
+
+def _find_modinfo(path: str) -> Optional[str]:
+    """Name of the folder's ModInfo.xml in whatever case it has.
+    
+    The game matches the file name case-insensitively, so ``modinfo.xml``
+    counts too on case-sensitive filesystems.
+    """
+    if os.path.isfile(os.path.join(path, MODINFO_FILENAME)):
+        return MODINFO_FILENAME
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.lower() == MODINFO_FILENAME.lower():
+                    return entry.name
+    except OSError:
+        pass
+    return None
+
+def _read_folder(path: Path, name: Optional[str]) -> dict[str, Any]:
+    """Parse a mod folder into a cacheable record.
+    
+    Args:
+        path: Mod folder
+        name: Its ModInfo.xml as found by ``_find_modinfo``
+    """
+    if name is None:
+        return {'problem': f"No {MODINFO_FILENAME}"}
+    modinfo = path / name
+    try:
+        info = parse_modinfo(modinfo)
+    except (OSError, ValueError) as e:
+        return {'problem': f"Unreadable {modinfo.name}: {e}"}
+    return {'info': {
+        'name': info.name,
+        'version': info.version,
+        'description': info.description,
+        'author': info.author,
+    }}
+
+def _from_record(folder: str, record: dict[str, Any]) -> InstalledMod:
+    info = record.get('info')
+    return InstalledMod(
+        folder=folder,
+        info=ModInfo(**info) if info else None,
+        problem=record.get('problem'),
+    )
@@ -2,22 +2,55 @@
 import logging
 from collections.abc import Sequence
 from pathlib import Path
+import shutil
 import subprocess
+import sys
+import time
 from typing import Callable, Optional
 
 # Local imports
-from rebirth_launcher.archive import ArchiveHandler
+from rebirth_launcher.archive import (
+    ArchiveHandler,
+    SplitArchiveStream,
+    is_streamable_archive,
+)
 from rebirth_launcher.config import LauncherConfig, get_config
-from rebirth_launcher.constants import ALLOWED_MODS
+from rebirth_launcher.constants import (
+    ALLOWED_MODS,
+    DELTA_UPDATE_MAX_FRACTION,
+    GAME_LOG_FILENAME,
+    POST_LAUNCH_CHECK_WAIT,
+    STEAM_APP_ID,
+)
 from rebirth_launcher.exceptions import (
     GamePathError,
     LauncherError,
     ModError,
+    ModUpdateError,
 )
+from rebirth_launcher.install_index import IndexVerification, InstallIndex
+from rebirth_launcher.integrity import IntegrityReport, verify_tree
+from rebirth_launcher.log_monitor import rotate_log
+from rebirth_launcher.manifest import (
+    ReleaseManifest,
+    UpdatePlan,
+    apply_plan,
+    plan_update,
+)
+from rebirth_launcher.preflight import Preflight, PreflightReport
+from rebirth_launcher.staging import StagedInstall
 from rebirth_launcher.steam_integration import SteamIntegration
+from rebirth_launcher.tracing import traced
 from rebirth_launcher.type_definitions import Progress
 from rebirth_launcher.update_checker import ReleaseInfo, UpdateChecker
-from rebirth_launcher.utils import clean_directory, ensure_directory
+from rebirth_launcher.utils import (
+    clean_directory,
+    ensure_directory,
+    game_executable,
+    move_to_trash,
+    purge_in_background,
+    reap_trash,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +63,11 @@ def __init__(self) -> None:
         self.update_checker = UpdateChecker()
         self.steam = SteamIntegration()
         self.archive_handler = ArchiveHandler()
+        self._installed: Optional[tuple[ReleaseInfo, ReleaseManifest]] = None
+        # Set by launch_game; the process is None when Steam started it
+        self.game_process: Optional[subprocess.Popen[bytes]] = None
+        self.launched_at: Optional[float] = None
+        self._reap_trash()
 
     def handle_error(self, error: Exception, message: str) -> None:
         """Handle errors with logging."""
@@ -43,39 +81,71 @@ def handle_error(self, error: Exception, message: str) -> None:
     def run(
         self,
         skip_update: bool = False,
-        progress: Optional['Progress'] = None
-    ) -> None:
+        progress: Optional['Progress'] = None,
+        fresh_log: bool = False
+    ) -> PreflightReport:
         """Main launcher execution.
         
+        Steam ownership, the game path and the update check run side by
+        side under ``config.preflight_timeout``. The game launches as soon
+        as the required checks pass; the update check is informational
+        and is only waited on briefly after launch
+        (``POST_LAUNCH_CHECK_WAIT``), within the same deadline.
+        
         Args:
             skip_update: If True, skips mod update check
             progress: Optional progress bar for update operations
+            fresh_log: Move the previous game log aside before launching,
+                so a monitor can follow the new one from its start
+        
+        Returns:
+            Report of all checks; ``update_check`` holds the ReleaseInfo of
+            an available update, if one was found in time
         """
         try:
             logger.info("Starting Rebirth Launcher")
             
-            # Verify Steam ownership
-            if not self.steam.verify_ownership():
-                raise LauncherError(
-                    "7 Days to Die not found in Steam library",
-                    "Please ensure the game is installed through Steam"
+            preflight = Preflight(self.config.preflight_timeout)
+            preflight.add("steam_ownership", self._verify_steam_ownership)
+            preflight.add("game_path", self._verify_game_path)
+            if not skip_update and self.config.check_updates_on_launch:
+                preflight.add(
+                    "update_check", self.check_for_updates, required=False
                 )
             
-            # Verify game installation
-            if not self.config.game_path.exists():
-                raise GamePathError(
-                    "Game installation not found",
-                    f"Expected path: {self.config.game_path}"
-                )
+            report = preflight.run()
+            report.raise_for_failure()
             
             # Launch game
-            self.launch_game()
+            self.launch_game(fresh_log=fresh_log)
             logger.info("Game launched successfully")
             
+            # Only briefly: the game is already starting
+            report = preflight.wait_optional(POST_LAUNCH_CHECK_WAIT)
+            logger.info(report.summary())
+            return report
+            
         except Exception as e:
             logger.exception("Launcher execution failed")
             raise
     
+    def _verify_steam_ownership(self) -> None:
+        """Preflight check: the game is owned on this Steam account."""
+        if not self.steam.verify_ownership():
+            raise LauncherError(
+                "7 Days to Die not found in Steam library",
+                "Please ensure the game is installed through Steam"
+            )
+    
+    def _verify_game_path(self) -> None:
+        """Preflight check: the game installation exists."""
+        if not self.config.game_path.exists():
+            raise GamePathError(
+                "Game installation not found",
+                f"Expected path: {self.config.game_path}"
+            )
+    
+    @traced("update", "phase")
     def update(
         self,
         release_info: ReleaseInfo,
@@ -85,19 +155,46 @@ def update(
         try:
             logger.info(f"Updating to version {release_info.tag_name}")
             
-            # Clean mod directories
-            if not self._clean_mod_directories():
-                raise ModError(
-                    "Failed to clean mod directories",
-                    "Could not remove existing mods"
-                )
+            # Prefer patching only the files that changed
+            manifest = self._fetch_manifest(release_info)
+            plan = self._plan_delta_update(release_info, manifest)
+            if self.config.staged_install:
+                if not self._staged_update(
+                    release_info, manifest, plan, progress_callback
+                ):
+                    raise ModError(
+                        "Failed to install new version",
+                        "Error staging mod files; current install untouched"
+                    )
+            elif plan is not None:
+                if not self._apply_delta_update(
+                    release_info, plan, self.config.mods_path, progress_callback
+                ):
+                    raise ModError(
+                        "Failed to apply delta update",
+                        "Error downloading or replacing mod files"
+                    )
+                if not self._clean_directory(self._appdata_mods_path):
+                    raise ModError(
+                        "Failed to clean mod directories",
+                        "Could not remove AppData mods"
+                    )
+            else:
+                # Clean mod directories
+                if not self._clean_mod_directories():
+                    raise ModError(
+                        "Failed to clean mod directories",
+                        "Could not remove existing mods"
+                    )
+                
+                # Download and install new version
+                if not self._install_mods(release_info, progress_callback):
+                    raise ModError(
+                        "Failed to install new version",
+                        "Error downloading or extracting mod files"
+                    )
             
-            # Download and install new version
-            if not self._install_mods(release_info, progress_callback):
-                raise ModError(
-                    "Failed to install new version",
-                    "Error downloading or extracting mod files"
-                )
+            self._index_install(manifest)
             
             # Update configuration
             self.config.version = release_info.tag_name
@@ -110,43 +207,300 @@ def update(
             logger.exception("Update failed")
             return False
     
-    def launch_game(self) -> None:
-        """Launch 7 Days to Die with appropriate settings."""
+    @traced("rollback", "disk")
+    def rollback(self) -> bool:
+        """Swap the previous mod pack generation back in."""
+        try:
+            staged = StagedInstall(self.config.mods_path, ALLOWED_MODS)
+            restored = staged.rollback()
+            if restored:
+                self.config.version = restored
+                self.config.save()
+            logger.info("Rollback completed successfully")
+            return True
+            
+        except Exception as e:
+            self.handle_error(e, "Rollback failed")
+            return False
+    
+    def verify_install(
+        self,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> IntegrityReport:
+        """Hash the installed mods and compare them with their release.
+        
+        Args:
+            progress_callback: Called with (bytes hashed, bytes to hash)
+        """
+        _, manifest = self._installed_release()
+        report = verify_tree(
+            manifest,
+            self.config.mods_path,
+            ALLOWED_MODS,
+            progress_callback=progress_callback
+        )
+        if report.intact:
+            self._index_install(manifest)
+        return report
+    
+    def quick_verify(self) -> Optional[IndexVerification]:
+        """Check the install against its index, hashing only changed files.
+        
+        Returns:
+            None if there is no install index to check against
+        """
+        index = InstallIndex(self.config.mods_path, ALLOWED_MODS)
+        if not index.load():
+            return None
+        return index.verify()
+    
+    def repair(
+        self,
+        report: IntegrityReport,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> bool:
+        """Re-download only the files a verify pass found missing or damaged."""
+        try:
+            release_info, manifest = self._installed_release()
+            plan = UpdatePlan(added=report.missing, changed=report.damaged)
+            if plan.is_empty:
+                return True
+            
+            logger.info("Repairing install: %s", plan.summary())
+            if not self._apply_delta_update(
+                release_info,
+                plan,
+                self.config.mods_path,
+                progress_callback
+            ):
+                raise ModError(
+                    "Failed to repair installation",
+                    "Error downloading or replacing damaged files"
+                )
+            
+            self._index_install(manifest)
+            logger.info("Repair completed successfully")
+            return True
+            
+        except Exception as e:
+            self.handle_error(e, "Repair failed")
+            return False
+    
+    def _installed_release(self) -> tuple[ReleaseInfo, ReleaseManifest]:
+        """Look up the installed release and its manifest."""
+        if self._installed is None:
+            release_info = self.update_checker.get_release(self.config.version)
+            manifest = self.update_checker.fetch_manifest(release_info)
+            if manifest is None:
+                raise ModUpdateError(
+                    "Release has no file manifest to verify against",
+                    f"Version: {release_info.tag_name}"
+                )
+            self._installed = (release_info, manifest)
+        return self._installed
+    
+    @traced("launch", "phase")
+    def launch_game(self, fresh_log: bool = False) -> None:
+        """Launch 7 Days to Die with appropriate settings.
+        
+        Args:
+            fresh_log: Move the previous game log aside first
+        """
         try:
-            exe_path = self.config.game_path / "7DaysToDie.exe"
+            exe_path = game_executable(self.config.game_path)
             
-            if not exe_path.exists():
+            if exe_path is None:
                 raise GamePathError(
                     "Game executable not found",
-                    f"Expected path: {exe_path}"
+                    f"Expected path: {self.config.game_path / '7DaysToDie.exe'}"
                 )
             
-            cmd = [
-                str(exe_path),
+            if fresh_log:
+                rotate_log(self.log_path)
+            
+            args = [
                 "-logfile",
-                str(self.config.game_path / "output_log.txt")
+                str(self.log_path)
             ]
             
             if self.config.disable_eac:
-                cmd.append("-noeac")
+                args.append("-noeac")
+            
+            if exe_path.suffix == ".exe" and sys.platform != "win32":
+                # Windows build on Linux: let Steam start it under Proton
+                cmd = ["steam", "-applaunch", STEAM_APP_ID, *args]
+            else:
+                cmd = [str(exe_path), *args]
             
             logger.info(f"Launching game with command: {' '.join(cmd)}")
-            subprocess.Popen(cmd)
+            self.launched_at = time.monotonic()
+            process = subprocess.Popen(cmd)
+            # The steam command returns once it has handed the launch over
+            self.game_process = None if cmd[0] == "steam" else process
             
         except Exception as e:
             logger.exception("Failed to launch game")
             raise LauncherError("Failed to launch game", str(e))
     
+    @property
+    def log_path(self) -> Path:
+        """Log file the game is told to write."""
+        return Path(self.config.game_path) / GAME_LOG_FILENAME
+    
+    @property
+    def _appdata_mods_path(self) -> Path:
+        """Mods folder under AppData, which is cleared on every update."""
+        return Path(self.config.game_path).parent / "AppData" / "Mods"
+    
+    @traced("fetch_manifest", "network")
+    def _fetch_manifest(
+        self,
+        release_info: ReleaseInfo
+    ) -> Optional[ReleaseManifest]:
+        """Fetch the release manifest, or None if it is unavailable."""
+        try:
+            return self.update_checker.fetch_manifest(release_info)
+        except ModUpdateError as e:
+            logger.warning("%s, falling back to full update", e.message)
+            return None
+    
+    @traced("plan_update", "disk")
+    def _plan_delta_update(
+        self,
+        release_info: ReleaseInfo,
+        manifest: Optional[ReleaseManifest]
+    ) -> Optional[UpdatePlan]:
+        """Plan a file-level update, or None if a full install is needed."""
+        if manifest is None:
+            return None
+        
+        # Files untouched since the last install keep their recorded digest
+        index = InstallIndex(self.config.mods_path, ALLOWED_MODS)
+        index.load()
+        plan = plan_update(manifest, self.config.mods_path, ALLOWED_MODS, index)
+        logger.info(
+            "Update plan for %s: %s", release_info.tag_name, plan.summary()
+        )
+        
+        # Many small file requests lose to a few large chunks past this point
+        if plan.download_bytes > manifest.total_size * DELTA_UPDATE_MAX_FRACTION:
+            logger.info("Most of the pack changed, downloading full release")
+            return None
+        
+        return plan
+    
+    @traced("staged_update", "phase")
+    def _staged_update(
+        self,
+        release_info: ReleaseInfo,
+        manifest: Optional[ReleaseManifest],
+        plan: Optional[UpdatePlan],
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> bool:
+        """Build the new version beside the live mods, then swap it in.
+
+        Delta updates start from a hard-linked clone of the live tree, full
+        installs from an empty directory. Nothing live changes until the
+        staged tree has been validated.
+        """
+        staged = StagedInstall(self.config.mods_path, ALLOWED_MODS)
+        if plan is not None:
+            staging_dir = staged.prepare(clone_live=True)
+            installed = self._apply_delta_update(
+                release_info, plan, staging_dir, progress_callback
+            )
+        else:
+            staging_dir = staged.prepare()
+            installed = self._install_mods(
+                release_info, progress_callback, staging_dir
+            )
+        
+        if not installed or not staged.validate(manifest):
+            staged.discard()
+            return False
+        
+        staged.commit(release_info.tag_name, self.config.version)
+        return self._clean_directory(self._appdata_mods_path)
+    
+    @traced("index_install", "disk")
+    def _index_install(self, manifest: Optional[ReleaseManifest]) -> None:
+        """Record the installed files so later checks only rehash changes.
+        
+        Digests come from the release manifest where available; the
+        install is still usable without an index, so failures only log.
+        """
+        try:
+            index = InstallIndex(self.config.mods_path, ALLOWED_MODS)
+            index.load()
+            index.rebuild(manifest.files if manifest else None)
+        except Exception:
+            logger.exception("Failed to write install index")
+    
+    @traced("apply_delta", "phase")
+    def _apply_delta_update(
+        self,
+        release_info: ReleaseInfo,
+        plan: UpdatePlan,
+        install_root: Path,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> bool:
+        """Download changed files and apply a file-level update plan."""
+        try:
+            temp_dir = Path(self.config.game_path) / "Temp" / "delta"
+            ensure_directory(temp_dir)
+            
+            # Fetch everything before touching the installed tree
+            if plan.to_fetch and not self.update_checker.download_release_files(
+                release_info,
+                plan.to_fetch,
+                temp_dir,
+                progress_callback
+            ):
+                return False
+            
+            apply_plan(plan, install_root, temp_dir)
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return True
+            
+        except Exception as e:
+            logger.exception("Failed to apply delta update")
+            return False
+    
+    @traced("clean", "disk")
+    def _clean_directory(self, path: Path) -> bool:
+        """Clear a mods folder except allowed mods.
+
+        In ``"trash"`` cleanup mode the entries are renamed into a trash
+        directory and deleted in the background, so the update continues
+        immediately. ``"inline"`` mode, or a failed rename, deletes them
+        in place before returning.
+        """
+        if self.config.cleanup_mode == "trash":
+            batch = move_to_trash(path, ALLOWED_MODS)
+            if batch is not None:
+                purge_in_background([batch])
+                return True
+            if path.exists():
+                logger.warning(
+                    "Could not move %s to trash, deleting in place", path
+                )
+        
+        return clean_directory(path, ALLOWED_MODS)
+    
+    def _reap_trash(self) -> None:
+        """Start deleting trash left behind by an earlier run."""
+        for mods_path in (self.config.mods_path, self._appdata_mods_path):
+            reap_trash(mods_path.parent)
+    
     def _clean_mod_directories(self) -> bool:
         """Clean mod directories while preserving allowed mods."""
         try:
             # Clean program files mods
-            if not clean_directory(self.config.mods_path, ALLOWED_MODS):
+            if not self._clean_directory(self.config.mods_path):
                 return False
             
             # Clean appdata mods
-            appdata_mods = Path(self.config.game_path).parent / "AppData" / "Mods"
-            if not clean_directory(appdata_mods, ALLOWED_MODS):
+            if not self._clean_directory(self._appdata_mods_path):
                 return False
             
             return True
@@ -155,18 +509,33 @@ def _clean_mod_directories(self) -> bool:
             logger.exception("Failed to clean mod directories")
             return False
     
+    @traced("install", "phase")
     def _install_mods(
         self,
         release_info: ReleaseInfo,
-        progress_callback: Optional[Callable[[float], None]] = None
+        progress_callback: Optional[Callable[[float], None]] = None,
+        output_dir: Optional[Path] = None
     ) -> bool:
         """Install mods from split archives."""
         try:
             # Ensure directories exist
-            ensure_directory(self.config.mods_path)
+            output_dir = output_dir or self.config.mods_path
+            ensure_directory(output_dir)
             temp_dir = Path(self.config.game_path) / "Temp"
             ensure_directory(temp_dir)
             
+            # Stream-friendly archives are extracted while parts download,
+            # which is only safe when each part is verified on arrival
+            if (
+                self.config.pipelined_install
+                and release_info.chunks
+                and release_info.verifiable_per_chunk
+                and is_streamable_archive(release_info.chunks[0])
+            ):
+                return self._install_mods_pipelined(
+                    release_info, temp_dir, output_dir, progress_callback
+                )
+            
             # Download split archives
             if not self.update_checker.download_release_assets(
                 release_info,
@@ -175,9 +544,10 @@ def _install_mods(
             ):
                 return False
             
-            # Find downloaded split files
+            # Downloaded split files in archive order (partial
+            # downloads share the "*.split.*" pattern, so no globbing)
             split_files: Sequence[Path] = sorted(
-                temp_dir.glob("*.split.*"),
+                (temp_dir / name for name in release_info.chunks),
                 key=lambda p: int(p.suffix.split('.')[-1])
             )
             
@@ -186,10 +556,10 @@ def _install_mods(
                 return False
             
             # Extract directly from first split file
-            # 7-Zip will automatically handle all parts
+            # The extraction backend picks up the remaining parts
             if not self.archive_handler.extract_archive(
                 split_files[0],  # First part contains archive info
-                self.config.mods_path
+                output_dir
             ):
                 return False
             
@@ -203,11 +573,39 @@ def _install_mods(
             logger.exception("Failed to install mods")
             return False
     
+    def _install_mods_pipelined(
+        self,
+        release_info: ReleaseInfo,
+        temp_dir: Path,
+        output_dir: Path,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> bool:
+        """Extract split archives while later parts are still downloading.
+
+        Extraction only waits when it reaches a part that has not arrived
+        yet, and each part is deleted once extracted, so the temp directory
+        never holds more than the download window.
+        """
+        parts = self.update_checker.iter_release_assets(
+            release_info, temp_dir, progress_callback
+        )
+        with SplitArchiveStream(parts) as stream:
+            if not self.archive_handler.extract_stream(stream, output_dir):
+                return False
+            # Pull in trailing padding so every part is verified and removed
+            stream.drain()
+        return True
+    
     def check_for_updates(self) -> Optional[ReleaseInfo]:
         """Check for mod updates."""
         try:
             release_info = self.update_checker.check_updates()
-            if release_info and release_info.version != self.config.version:
+            # Installs record the tag, older configs the bare version
+            installed = self.config.version
+            if release_info and installed not in (
+                release_info.version,
+                release_info.tag_name,
+            ):
                 logger.info(
                     "Update available: %s -> %s",
                     self.config.version,
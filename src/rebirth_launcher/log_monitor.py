@@ -0,0 +1,381 @@
+"""Follow the game's log after launch and report problems as they appear."""
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+import logging
+import os
+import re
+import select
+import subprocess
+import sys
+import time
+from typing import BinaryIO, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Largest read from the log at once
+_READ_SIZE = 1024 * 1024
+
+# Seconds between checks when inotify is unavailable
+_POLL_INTERVAL = 0.25
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+@dataclass(frozen=True)
+class LogPattern:
+    """A kind of log line worth reporting."""
+    kind: str
+    severity: str
+    regex: re.Pattern[str]
+
+# Checked in order; the first match classifies the line. Lines look like
+# "2024-05-01T18:22:03 12.345 ERR [MODS] ...". Error patterns key on the
+# severity or on failure wording, never on words that could be mod names.
+_SEVERITY = r"^\S+\s+[\d.]+\s+"
+_FAILURE = r"(?:[Ff]ailed|[Ee]rror|[Cc]ould not|[Cc]ouldn't|did not apply)\b"
+_MOD_NAME = r"['\"]?(?P<mod>[\w.-]+)"
+
+PATTERNS: tuple[LogPattern, ...] = (
+    LogPattern("mod_loaded", "info", re.compile(
+        r"\[MODS\]\s+Loaded Mod:\s*(?P<mod>.+?)\s*(?:\((?P<version>[^)]*)\))?\s*$"
+    )),
+    LogPattern("mod_error", "error", re.compile(
+        rf"(?:{_SEVERITY}(?:ERR|EXC)\s+\[MODS\]|\[MODS\]\s+{_FAILURE})"
+        rf"(?:.*?\bmod(?: folder)?\s+{_MOD_NAME})?"
+    )),
+    LogPattern("xml_patch_error", "error", re.compile(
+        rf"(?:{_SEVERITY}(?:ERR|EXC)\s.*?XML.*?(?:[Pp]atch|[Ll]oader)"
+        rf"|XML.*?(?:[Pp]atch|[Ll]oader)(?=.*?{_FAILURE}))"
+        rf"(?:.*?\bfrom mod\s+{_MOD_NAME})?"
+    )),
+    LogPattern("exception", "error", re.compile(rf"{_SEVERITY}EXC\s")),
+    LogPattern("error", "error", re.compile(rf"{_SEVERITY}ERR\s")),
+    LogPattern("warning", "warning", re.compile(rf"{_SEVERITY}WRN\s")),
+)
+
+# The main menu has finished loading and the game is playable
+MAIN_MENU_PATTERN = re.compile(
+    r"XUiC_MainMenu|\bmain ?menu\b.*\b(?:open|shown|loaded)", re.IGNORECASE
+)
+
+def _interesting(line: str) -> bool:
+    """Cheap test run before the regexes.
+    
+    Nearly every line is ordinary INF output; plain substring checks
+    reject those several times faster than any regex scan.
+    """
+    return (
+        "ERR" in line or "EXC" in line or "WRN" in line
+        or "[MODS]" in line or "XML" in line or "enu" in line
+    )
+
+@dataclass
+class LogEvent:
+    """A reported log line."""
+    kind: str
+    severity: str
+    line: str
+    elapsed: float
+    mod: Optional[str] = None
+
+@dataclass
+class MonitorReport:
+    """What the game logged while being monitored."""
+    elapsed: float = 0.0
+    time_to_main_menu: Optional[float] = None
+    mods_loaded: list[str] = field(default_factory=list)
+    errors: list[LogEvent] = field(default_factory=list)
+    warnings: int = 0
+    lines: int = 0
+    exit_code: Optional[int] = None
+    
+    @property
+    def healthy(self) -> bool:
+        """Whether the game logged no errors."""
+        return not self.errors
+    
+    def summary(self) -> str:
+        """Human readable one-line summary of the run."""
+        menu = (
+            f"main menu after {self.time_to_main_menu:.1f}s"
+            if self.time_to_main_menu is not None
+            else "main menu not reached"
+        )
+        text = (
+            f"{menu}, {len(self.mods_loaded)} mod(s) loaded, "
+            f"{len(self.errors)} error(s), {self.warnings} warning(s) "
+            f"in {self.lines} log lines"
+        )
+        if self.exit_code is not None:
+            text += f", game exited with code {self.exit_code}"
+        return text
+
+def classify(line: str) -> Optional[tuple[LogPattern, Optional[str]]]:
+    """Match a log line against ``PATTERNS``.
+    
+    Returns:
+        The matching pattern and the mod it names, if any
+    """
+    if not _interesting(line):
+        return None
+    for pattern in PATTERNS:
+        match = pattern.regex.search(line)
+        if match:
+            mod = match.groupdict().get('mod')
+            return pattern, mod
+    return None
+
+def rotate_log(path: Path) -> Optional[Path]:
+    """Move the previous run's log aside before launching.
+    
+    The game would overwrite it anyway; moving it means the monitor
+    starts on a fresh file and the last run's log is kept for comparison.
+    
+    Returns:
+        Where the old log went, or None if there was none
+    """
+    previous = path.with_name(f"{path.stem}.previous{path.suffix}")
+    try:
+        os.replace(path, previous)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Could not move old log {path} aside: {e}")
+        return None
+    return previous
+
+class LogTailer:
+    """Reads lines appended to a file, like ``tail -F``.
+    
+    Only bytes past the last read offset are read, so following a log of
+    hundreds of MiB costs nothing beyond its new lines. A file that does
+    not exist yet is waited for; one that is truncated or replaced is
+    followed from its start.
+    """
+    
+    def __init__(self, path: Path) -> None:
+        """Initialize tailer of ``path``, starting at its beginning."""
+        self.path = path
+        self._file: Optional[BinaryIO] = None
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._partial = b""
+    
+    def read_lines(self) -> list[str]:
+        """Return complete lines appended since the last call."""
+        self._check_rotation()
+        if self._file is None:
+            return []
+        
+        handle = self._file
+        handle.seek(self._offset)
+        chunks: list[bytes] = []
+        while True:
+            chunk = handle.read(_READ_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            self._offset += len(chunk)
+        if not chunks:
+            return []
+        
+        data = self._partial + b"".join(chunks)
+        *complete, self._partial = data.split(b"\n")
+        return [
+            line.decode('utf-8', errors='replace').rstrip('\r')
+            for line in complete
+        ]
+    
+    def close(self) -> None:
+        """Close the followed file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def _check_rotation(self) -> None:
+        """(Re)open the file if it appeared, shrank or was replaced."""
+        try:
+            info = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if self._file is not None and info.st_ino == self._inode:
+            if info.st_size < self._offset:
+                self._offset = 0
+                self._partial = b""
+            return
+        
+        self.close()
+        try:
+            handle = open(self.path, 'rb')
+        except OSError:
+            return
+        self._file = handle
+        self._inode = os.fstat(handle.fileno()).st_ino
+        self._offset = 0
+        self._partial = b""
+
+class _Inotify:
+    """Blocks until something in a directory changes (Linux only)."""
+    
+    def __init__(self, directory: Path) -> None:
+        import ctypes
+        import ctypes.util
+        
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        watch = libc.inotify_add_watch(
+            self.fd,
+            os.fsencode(directory),
+            _IN_MODIFY | _IN_CREATE | _IN_MOVED_TO
+        )
+        if watch < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+    
+    def wait(self, timeout: float) -> None:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if ready:
+            # Events only wake us; the tailer works out what changed
+            try:
+                while os.read(self.fd, 65536):
+                    pass
+            except BlockingIOError:
+                pass
+    
+    def close(self) -> None:
+        os.close(self.fd)
+
+class GameMonitor:
+    """Follows the game log and reports mod and XML problems live.
+    
+    Wakes on inotify events where available and polls otherwise. Lines
+    are classified with the precompiled ``PATTERNS``; each match is
+    passed to ``on_event`` as soon as it is read.
+    """
+    
+    def __init__(
+        self,
+        log_path: Path,
+        on_event: Optional[Callable[[LogEvent], None]] = None,
+        process: Optional[subprocess.Popen[bytes]] = None,
+        started: Optional[float] = None
+    ) -> None:
+        """Initialize monitor.
+        
+        Args:
+            log_path: Log file the game was told to write
+            on_event: Called with every reported line
+            process: Game process; monitoring ends when it exits
+            started: ``time.monotonic()`` at launch, which times are
+                measured from; defaults to now
+        """
+        self.log_path = log_path
+        self.on_event = on_event
+        self.process = process
+        self.report = MonitorReport()
+        self._start = time.monotonic() if started is None else started
+    
+    def follow(
+        self,
+        timeout: Optional[float] = None,
+        until_main_menu: bool = False
+    ) -> MonitorReport:
+        """Follow the log until the game exits.
+        
+        Args:
+            timeout: Stop after this many seconds
+            until_main_menu: Stop once the main menu has loaded
+        
+        Returns:
+            MonitorReport: Also available as ``self.report`` if following
+                is interrupted
+        """
+        tailer = LogTailer(self.log_path)
+        waiter = self._waiter()
+        try:
+            for _ in self._ticks(waiter, timeout):
+                for line in tailer.read_lines():
+                    self._handle(line)
+                if until_main_menu and self.report.time_to_main_menu is not None:
+                    break
+                if self.process is not None and self.process.poll() is not None:
+                    # Pick up whatever was written just before exit
+                    for line in tailer.read_lines():
+                        self._handle(line)
+                    self.report.exit_code = self.process.returncode
+                    break
+        finally:
+            tailer.close()
+            if waiter is not None:
+                waiter.close()
+            self.report.elapsed = time.monotonic() - self._start
+        logger.info("Game monitor: %s", self.report.summary())
+        return self.report
+    
+    def _ticks(
+        self,
+        waiter: Optional[_Inotify],
+        timeout: Optional[float]
+    ) -> Iterator[None]:
+        """Yield whenever the log may have changed, until ``timeout``."""
+        deadline = None if timeout is None else self._start + timeout
+        while True:
+            yield
+            wait = _POLL_INTERVAL
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    return
+            if waiter is not None:
+                # Still time out now and then to notice the game exiting
+                waiter.wait(wait * 4)
+            else:
+                time.sleep(wait)
+    
+    def _waiter(self) -> Optional[_Inotify]:
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            return _Inotify(self.log_path.parent)
+        except (OSError, AttributeError) as e:
+            logger.debug(f"inotify unavailable, polling the log: {e}")
+            return None
+    
+    def _handle(self, line: str) -> None:
+        report = self.report
+        report.lines += 1
+        if not _interesting(line):
+            return
+        elapsed = time.monotonic() - self._start
+        
+        matched = classify(line)
+        if matched is None:
+            # Errors raised from menu code are errors, not the menu loading
+            if (
+                report.time_to_main_menu is None
+                and "enu" in line
+                and MAIN_MENU_PATTERN.search(line)
+            ):
+                report.time_to_main_menu = elapsed
+                self._emit(LogEvent("main_menu", "info", line, elapsed))
+            return
+        pattern, mod = matched
+        event = LogEvent(pattern.kind, pattern.severity, line, elapsed, mod)
+        if pattern.kind == "mod_loaded" and mod:
+            report.mods_loaded.append(mod)
+        elif pattern.severity == "error":
+            report.errors.append(event)
+        elif pattern.severity == "warning":
+            report.warnings += 1
+        self._emit(event)
+    
+    def _emit(self, event: LogEvent) -> None:
+        if self.on_event is not None:
+            self.on_event(event)
@@ -1,27 +1,23 @@
 """Main entry point for the Rebirth Launcher."""
+import functools
 import logging
-import sys
 from pathlib import Path
-from typing import Optional
+import sys
+from typing import TYPE_CHECKING, NoReturn, Optional
 
 # Third-party imports
 import typer
-from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-)
-from rich.prompt import Confirm
 
 # Local imports
-from rebirth_launcher.config import LauncherConfig, get_config
-from rebirth_launcher.constants import DEFAULT_LOG_FILENAME
+from rebirth_launcher.constants import DEFAULT_LOG_FILENAME, PURGE_EXIT_TIMEOUT
 from rebirth_launcher.exceptions import LauncherError
-from rebirth_launcher.launcher import RebirthLauncher
-from rebirth_launcher.type_definitions import RichConsole
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+
+    from rebirth_launcher.integrity import IntegrityReport
+    from rebirth_launcher.launcher import RebirthLauncher
 
 # Initialize logging
 logging.basicConfig(
@@ -34,9 +30,65 @@
 )
 
 logger = logging.getLogger(__name__)
-console = Console()
 app = typer.Typer()
 
+# Commands import what they need when they run, so each invocation only
+# pays for its own dependencies. See benchmarks/startup.py.
+
+@functools.lru_cache(maxsize=None)
+def _console() -> "Console":
+    """Get the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+    return Console()
+
+@app.callback()
+def _options(
+    ctx: typer.Context,
+    profile: Optional[Path] = typer.Option(
+        None,
+        "--profile",
+        help="Write a Chrome trace-event JSON of this run's phases to a file"
+    ),
+    limit_rate: Optional[str] = typer.Option(
+        None,
+        "--limit-rate",
+        help="Cap combined download speed, e.g. 500K or 2M per second; "
+        "0 for unlimited. Overrides download_rate_limit in the config"
+    ),
+) -> None:
+    """Rebirth mod pack launcher for 7 Days to Die."""
+    ctx.call_on_close(functools.partial(_finish_trace, profile))
+    ctx.call_on_close(_finish_purges)
+    if limit_rate is not None:
+        from rebirth_launcher.transfer import parse_rate, set_rate_limit
+        
+        try:
+            set_rate_limit(parse_rate(limit_rate))
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--limit-rate")
+
+def _finish_purges() -> None:
+    """Let trash deletion started by the command finish before exiting."""
+    utils = sys.modules.get("rebirth_launcher.utils")
+    if utils is None:
+        return  # Nothing that deletes trash was loaded
+    if utils.wait_for_purges(0.5):
+        return
+    _console().print("Finishing removal of old mod files...")
+    if not utils.wait_for_purges(PURGE_EXIT_TIMEOUT):
+        logger.info("Trash removal continues on the next run")
+
+def _finish_trace(profile: Optional[Path]) -> None:
+    """Log the slowest phases and write the trace if one was requested."""
+    from rebirth_launcher.tracing import get_tracer
+    
+    tracer = get_tracer()
+    if tracer.spans:
+        logger.info(tracer.summary())
+    if profile is not None:
+        tracer.write_chrome_trace(profile)
+        _console().print(f"Trace written to {profile}")
+
 @app.command(name="launch")
 def launch(
     skip_update: bool = typer.Option(
@@ -44,36 +96,321 @@ def launch(
         "--skip-update",
         help="Skip mod update check"
     ),
+    monitor: bool = typer.Option(
+        False,
+        "--monitor",
+        help="Follow the game log after launch and report mod and XML "
+        "errors as they happen"
+    ),
+    monitor_timeout: Optional[float] = typer.Option(
+        None,
+        "--monitor-timeout",
+        help="Stop monitoring after this many seconds"
+    ),
 ) -> None:
     """Launch the game with Rebirth mod pack."""
     try:
+        from rebirth_launcher.launcher import RebirthLauncher
+        
         launcher = RebirthLauncher()
+        report = launcher.run(skip_update=skip_update, fresh_log=monitor)
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            launcher.run(
-                skip_update=skip_update,
-                progress=progress
+        update = report.value("update_check")
+        if update is not None:
+            _console().print(
+                f"[yellow]Update available: {launcher.config.version} -> "
+                f"{update.tag_name}[/yellow]"
             )
+        
+        if monitor:
+            _monitor_game(launcher, monitor_timeout)
             
     except LauncherError as e:
         logger.error(str(e))
         if e.details:
             logger.debug(e.details)
-        console.print(f"[red]Error: {e.message}[/red]")
+        _console().print(f"[red]Error: {e.message}[/red]")
         if e.details:
-            console.print(f"[red]Details: {e.details}[/red]")
+            _console().print(f"[red]Details: {e.details}[/red]")
         sys.exit(1)
     except Exception as e:
         logger.exception("Fatal error")
-        console.print(f"[red]Error: {str(e)}[/red]")
+        _console().print(f"[red]Error: {str(e)}[/red]")
         sys.exit(1)
 
+def _monitor_game(
+    launcher: "RebirthLauncher",
+    timeout: Optional[float]
+) -> None:
+    """Print game log problems live until the game exits or Ctrl+C."""
+    from rich.markup import escape
+    
+    from rebirth_launcher.log_monitor import GameMonitor, LogEvent
+    
+    console = _console()
+    
+    def on_event(event: LogEvent) -> None:
+        if event.kind == "main_menu":
+            console.print(
+                f"[green]Main menu reached after {event.elapsed:.1f}s[/green]"
+            )
+        elif event.severity == "error":
+            console.print(
+                f"[red]{event.elapsed:7.1f}s  {escape(event.line)}[/red]"
+            )
+    
+    monitor = GameMonitor(
+        launcher.log_path,
+        on_event,
+        process=launcher.game_process,
+        started=launcher.launched_at
+    )
+    console.print(f"Monitoring {launcher.log_path}, press Ctrl+C to stop")
+    try:
+        result = monitor.follow(timeout=timeout)
+    except KeyboardInterrupt:
+        result = monitor.report
+    colour = "green" if result.healthy else "yellow"
+    console.print(f"[{colour}]{result.summary()}[/{colour}]")
+
+@app.command(name="rollback")
+def rollback() -> None:
+    """Restore the previously installed mod pack version."""
+    try:
+        from rebirth_launcher.launcher import RebirthLauncher
+        
+        launcher = RebirthLauncher()
+        if not launcher.rollback():
+            _console().print("[red]Error: Rollback failed, see log for details[/red]")
+            sys.exit(1)
+        _console().print(
+            f"[green]Rolled back to version {launcher.config.version}[/green]"
+        )
+        
+    except Exception as e:
+        _exit_with_error(e)
+
+@app.command(name="verify")
+def verify(
+    quick: bool = typer.Option(
+        False,
+        "--quick",
+        help="Only rehash files changed since install, using the install index"
+    ),
+) -> None:
+    """Check installed mod files against the installed release."""
+    try:
+        from rebirth_launcher.launcher import RebirthLauncher
+        
+        launcher = RebirthLauncher()
+        if quick:
+            result = launcher.quick_verify()
+            if result is None:
+                _console().print(
+                    "[yellow]No install index found, "
+                    "run verify without --quick[/yellow]"
+                )
+                sys.exit(1)
+            _console().print(result.summary())
+            _print_paths("Missing", result.missing)
+            _print_paths("Modified", result.modified)
+            if not result.intact:
+                sys.exit(1)
+            return
+        
+        report = _verify_with_progress(launcher)
+        _print_integrity_report(report)
+        if not report.intact:
+            _console().print("Run 'repair' to re-download the damaged files")
+            sys.exit(1)
+        
+    except Exception as e:
+        _exit_with_error(e)
+
+@app.command(name="repair")
+def repair() -> None:
+    """Re-download only missing or damaged mod files."""
+    try:
+        from rebirth_launcher.launcher import RebirthLauncher
+        
+        launcher = RebirthLauncher()
+        report = _verify_with_progress(launcher)
+        _print_integrity_report(report)
+        if report.intact:
+            _console().print("[green]Nothing to repair[/green]")
+            return
+        
+        total = sum(entry.size for entry in report.to_fetch)
+        with _transfer_progress() as progress:
+            task = progress.add_task("Downloading", total=total)
+            repaired = launcher.repair(
+                report,
+                lambda fraction: progress.update(
+                    task, completed=fraction * total
+                )
+            )
+        if not repaired:
+            _console().print("[red]Error: Repair failed, see log for details[/red]")
+            sys.exit(1)
+        _console().print(
+            f"[green]Repaired {len(report.to_fetch)} file(s)[/green]"
+        )
+        
+    except Exception as e:
+        _exit_with_error(e)
+
+@app.command(name="list")
+def list_mods(
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Re-read every ModInfo.xml instead of using the cached inventory"
+    ),
+) -> None:
+    """List installed mods."""
+    try:
+        from rich.table import Table
+        
+        from rebirth_launcher.config import get_config
+        from rebirth_launcher.inventory import default_inventory
+        
+        config = get_config()
+        scan = default_inventory(config).scan(refresh=refresh)
+        
+        table = Table(title=f"Mods in {config.mods_path}")
+        table.add_column("Name")
+        table.add_column("Version")
+        table.add_column("Author")
+        table.add_column("Folder", style="dim")
+        for mod in scan.mods:
+            if mod.info is None:
+                table.add_row(
+                    f"[red]{mod.folder}[/red]",
+                    "",
+                    "",
+                    f"[red]{mod.problem}[/red]"
+                )
+            else:
+                table.add_row(
+                    mod.info.name,
+                    mod.info.version,
+                    mod.info.author or "",
+                    mod.folder
+                )
+        _console().print(table)
+        _console().print(scan.summary())
+        
+    except Exception as e:
+        _exit_with_error(e)
+
+@app.command(name="cache")
+def cache(
+    prune: bool = typer.Option(
+        False,
+        "--prune",
+        help="Evict least recently used chunks down to the size cap"
+    ),
+    clear: bool = typer.Option(
+        False,
+        "--clear",
+        help="Remove every cached chunk"
+    ),
+    max_size: Optional[int] = typer.Option(
+        None,
+        "--max-size",
+        help="Prune down to this many MiB instead of the configured cap"
+    ),
+) -> None:
+    """Show downloaded chunk cache usage and prune it."""
+    try:
+        from rebirth_launcher.cache import ChunkCache
+        from rebirth_launcher.config import get_config
+        from rebirth_launcher.utils import format_bytes
+        
+        config = get_config()
+        chunk_cache = ChunkCache(
+            config.chunk_cache_dir,
+            config.chunk_cache_max_bytes
+        )
+        
+        if clear:
+            removed, freed = chunk_cache.clear()
+            _console().print(
+                f"Removed {removed} chunk(s), freed {format_bytes(freed)}"
+            )
+        elif prune or max_size is not None:
+            limit = max_size * 1024 * 1024 if max_size is not None else None
+            removed, freed = chunk_cache.prune(limit)
+            _console().print(
+                f"Evicted {removed} chunk(s), freed {format_bytes(freed)}"
+            )
+        
+        usage = chunk_cache.usage()
+        _console().print(f"Chunk cache: {chunk_cache.root}")
+        _console().print(
+            f"{usage.entries} chunk(s), {format_bytes(usage.total_bytes)} "
+            f"of {format_bytes(usage.max_bytes)}"
+        )
+        
+    except Exception as e:
+        _exit_with_error(e)
+
+def _transfer_progress() -> "Progress":
+    """Progress display with byte counts and live throughput."""
+    from rich.progress import (
+        BarColumn,
+        DownloadColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TransferSpeedColumn,
+    )
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        console=_console(),
+    )
+
+def _verify_with_progress(launcher: "RebirthLauncher") -> "IntegrityReport":
+    """Run a full verify pass behind a progress bar."""
+    with _transfer_progress() as progress:
+        task = progress.add_task("Verifying", total=None)
+        return launcher.verify_install(
+            lambda done, total: progress.update(
+                task, completed=done, total=total
+            )
+        )
+
+def _print_integrity_report(report: "IntegrityReport") -> None:
+    _console().print(report.summary())
+    _print_paths("Missing", [entry.path for entry in report.missing])
+    _print_paths("Damaged", [entry.path for entry in report.damaged])
+
+def _print_paths(label: str, paths: list[str], limit: int = 20) -> None:
+    for path in paths[:limit]:
+        _console().print(f"  {label}: {path}")
+    if len(paths) > limit:
+        _console().print(f"  ... and {len(paths) - limit} more")
+
+def _exit_with_error(error: Exception) -> NoReturn:
+    """Report a command failure and exit with a non-zero status."""
+    if isinstance(error, LauncherError):
+        logger.error(str(error))
+        if error.details:
+            logger.debug(error.details)
+        _console().print(f"[red]Error: {error.message}[/red]")
+        if error.details:
+            _console().print(f"[red]Details: {error.details}[/red]")
+    else:
+        logger.exception("Fatal error")
+        _console().print(f"[red]Error: {str(error)}[/red]")
+    sys.exit(1)
+
 def main() -> None:
     """Entry point for the launcher."""
     app()
@@ -0,0 +1,245 @@
+"""Release manifests and file-level update planning."""
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath, PureWindowsPath
+import logging
+import os
+from typing import TYPE_CHECKING, Any, Optional
+
+from rebirth_launcher.exceptions import ModUpdateError
+from rebirth_launcher.utils import format_bytes, iter_file_digests
+
+if TYPE_CHECKING:
+    from rebirth_launcher.install_index import InstallIndex
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """A single file shipped in a release."""
+    path: str
+    size: int
+    sha256: str
+
+@dataclass
+class ReleaseManifest:
+    """Every file of a release, keyed by POSIX path relative to the Mods dir.
+    
+    Published next to the release chunks as JSON::
+        
+        {"version": "1.2.0",
+         "files": [{"path": "Rebirth/ModInfo.xml", "size": 812,
+                    "sha256": "..."}, ...]}
+    """
+    version: str
+    files: dict[str, ManifestEntry] = field(default_factory=dict)
+    
+    @property
+    def total_size(self) -> int:
+        """Total size of all files in the release."""
+        return sum(entry.size for entry in self.files.values())
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ReleaseManifest":
+        """Create a manifest from its JSON representation."""
+        try:
+            entries = (
+                ManifestEntry(
+                    path=_checked_path(item['path']),
+                    size=int(item['size']),
+                    sha256=item['sha256'].lower()
+                )
+                for item in data['files']
+            )
+            return cls(
+                version=str(data['version']),
+                files={entry.path: entry for entry in entries}
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ModUpdateError("Invalid release manifest", str(e))
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Get the JSON representation of the manifest."""
+        return {
+            'version': self.version,
+            'files': [
+                {'path': e.path, 'size': e.size, 'sha256': e.sha256}
+                for e in sorted(self.files.values(), key=lambda e: e.path)
+            ],
+        }
+    
+    @classmethod
+    def build(cls, root: Path, version: str) -> "ReleaseManifest":
+        """Build the manifest for an extracted release tree at ``root``."""
+        paths = dict(_walk_files(root, set()))
+        relative_by_full = {full: relative for relative, full in paths.items()}
+        files = {}
+        for full, checksum in iter_file_digests(paths.values()):
+            if checksum is None:
+                raise ModUpdateError(
+                    "Failed to hash release file", f"Path: {full}"
+                )
+            relative = relative_by_full[full]
+            files[relative] = ManifestEntry(
+                relative, full.stat().st_size, checksum
+            )
+        return cls(version=version, files=files)
+
+@dataclass
+class UpdatePlan:
+    """Files to add, replace and delete to reach a release."""
+    added: list[ManifestEntry] = field(default_factory=list)
+    changed: list[ManifestEntry] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged_count: int = 0
+    removed_bytes: int = 0
+    
+    @property
+    def to_fetch(self) -> list[ManifestEntry]:
+        """Entries that have to be downloaded."""
+        return self.added + self.changed
+    
+    @property
+    def download_bytes(self) -> int:
+        """Bytes to download to apply the plan."""
+        return sum(entry.size for entry in self.to_fetch)
+    
+    @property
+    def is_empty(self) -> bool:
+        """Whether the installed tree already matches the release."""
+        return not (self.added or self.changed or self.removed)
+    
+    def summary(self) -> str:
+        """Human readable one-line summary of the plan."""
+        return (
+            f"{len(self.added)} added, {len(self.changed)} changed "
+            f"({format_bytes(self.download_bytes)} to download), "
+            f"{len(self.removed)} removed ({format_bytes(self.removed_bytes)}), "
+            f"{self.unchanged_count} unchanged"
+        )
+
+def plan_update(
+    manifest: ReleaseManifest,
+    install_root: Path,
+    preserve: Optional[set[str]] = None,
+    index: Optional["InstallIndex"] = None
+) -> UpdatePlan:
+    """Compare a release manifest with the installed tree.
+    
+    Files whose size differs are changed without hashing. Same-size files
+    take their digest from ``index`` while their size, mtime and inode
+    still match it; only the rest are hashed, in parallel. Top-level
+    entries named in ``preserve`` are neither compared nor removed.
+    """
+    preserve = preserve or set()
+    plan = UpdatePlan()
+    installed = dict(_walk_files(install_root, preserve))
+    indexed = index.entries if index is not None else {}
+    
+    def compare(entry: ManifestEntry, checksum: Optional[str]) -> None:
+        if checksum != entry.sha256:
+            plan.changed.append(entry)
+        else:
+            plan.unchanged_count += 1
+    
+    same_size: dict[Path, ManifestEntry] = {}
+    for path, entry in manifest.files.items():
+        if path.split('/', 1)[0] in preserve:
+            continue
+        full = installed.pop(path, None)
+        if full is None:
+            plan.added.append(entry)
+            continue
+        info = full.stat()
+        recorded = indexed.get(path)
+        if info.st_size != entry.size:
+            plan.changed.append(entry)
+        elif recorded is not None and recorded.matches(info):
+            compare(entry, recorded.sha256)
+        else:
+            same_size[full] = entry
+    
+    for full, checksum in iter_file_digests(same_size):
+        compare(same_size[full], checksum)
+    plan.changed.sort(key=lambda e: e.path)
+    
+    for path, full in sorted(installed.items()):
+        plan.removed.append(path)
+        plan.removed_bytes += full.stat().st_size
+    
+    return plan
+
+def apply_plan(
+    plan: UpdatePlan,
+    install_root: Path,
+    download_dir: Path
+) -> None:
+    """Apply a plan whose files were downloaded into ``download_dir``.
+    
+    Downloaded files are moved into place with ``os.replace``, so every
+    file is swapped atomically. Directories left empty by removals are
+    pruned afterwards.
+    """
+    for entry in plan.to_fetch:
+        target = _safe_target(install_root, entry.path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(_safe_target(download_dir, entry.path), target)
+    
+    for path in plan.removed:
+        _safe_target(install_root, path).unlink(missing_ok=True)
+    
+    for directory in sorted(
+        {(install_root / path).parent for path in plan.removed},
+        key=lambda p: len(p.parts),
+        reverse=True
+    ):
+        _prune_empty_dirs(directory, install_root)
+
+def _checked_path(path: str) -> str:
+    """Reject manifest paths that could point outside the install root.
+    
+    Raises:
+        ModUpdateError: For absolute or drive-qualified paths and paths
+            with ``..`` components
+    """
+    posix = PurePosixPath(path.replace('\\', '/'))
+    if (
+        not path
+        or posix.is_absolute()
+        or PureWindowsPath(path).drive
+        or '..' in posix.parts
+    ):
+        raise ModUpdateError("Unsafe path in release manifest", f"Path: {path}")
+    return path
+
+def _safe_target(root: Path, path: str) -> Path:
+    """Resolve a manifest path below ``root``, rejecting path traversal."""
+    root = root.resolve()
+    target = (root / PurePosixPath(path.replace('\\', '/'))).resolve()
+    if target == root or not target.is_relative_to(root):
+        raise ModUpdateError("Unsafe path in release manifest", f"Path: {path}")
+    return target
+
+def _walk_files(root: Path, preserve: set[str]) -> list[tuple[str, Path]]:
+    """List files below ``root`` as (POSIX relative path, full path)."""
+    files: list[tuple[str, Path]] = []
+    if not root.exists():
+        return files
+    
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        if current == root:
+            dirnames[:] = [d for d in dirnames if d not in preserve]
+            filenames = [f for f in filenames if f not in preserve]
+        for name in filenames:
+            full = current / name
+            files.append((full.relative_to(root).as_posix(), full))
+    return files
+
+def _prune_empty_dirs(directory: Path, stop: Path) -> None:
+    """Remove ``directory`` and its parents while empty, up to ``stop``."""
+    while directory != stop and stop in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
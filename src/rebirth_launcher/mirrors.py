@@ -0,0 +1,264 @@
+"""Mirror selection for release downloads."""
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+import json
+import logging
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from rebirth_launcher.tracing import span
+from rebirth_launcher.utils import format_bytes, write_json_atomic
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+# Bytes requested from each mirror when probing
+_PROBE_BYTES = 256 * 1024
+
+# Seconds a probe may take before the mirror counts as down
+_PROBE_TIMEOUT = 5
+
+# Chunk size the cost estimate is based on
+_REFERENCE_BYTES = 16 * 1024 * 1024
+
+# Assumed for mirrors that have not been probed, so they rank equally
+_UNPROBED_LATENCY = 0.5
+_UNPROBED_THROUGHPUT = 1024 * 1024
+
+@dataclass
+class MirrorStatus:
+    """Probe results for one mirror."""
+    url: str
+    latency: Optional[float] = None
+    throughput: Optional[float] = None
+    probed_at: float = 0.0
+    healthy: bool = True
+    
+    @property
+    def cost(self) -> float:
+        """Estimated seconds to fetch a typical chunk; lower is better."""
+        if not self.healthy:
+            return math.inf
+        latency = _UNPROBED_LATENCY if self.latency is None else self.latency
+        throughput = self.throughput or _UNPROBED_THROUGHPUT
+        return latency + _REFERENCE_BYTES / throughput
+    
+    def describe(self) -> str:
+        """Short text form for logs."""
+        if not self.healthy:
+            return f"{self.url} (down)"
+        if self.latency is None:
+            return f"{self.url} (not probed)"
+        text = f"{self.url} ({self.latency * 1000:.0f} ms"
+        if self.throughput:
+            text += f", {format_bytes(self.throughput)}/s"
+        return text + ")"
+
+class MirrorSet:
+    """Hosts publishing the same release files, ranked by speed.
+    
+    Mirrors are probed with a small ranged request for time to first
+    byte and throughput. Results are cached on disk for ``ttl`` seconds,
+    so most launches rank mirrors without any traffic. A mirror that
+    fails a transfer is ranked last for the rest of the run only; one
+    transient error shouldn't keep later runs off it.
+    
+    ``candidates()`` spreads concurrent downloads over the healthy
+    mirrors in proportion to their speed and lists the others as
+    fallbacks. With a single mirror nothing is ever probed.
+    """
+    
+    def __init__(
+        self,
+        urls: Sequence[str],
+        cache_path: Path,
+        ttl: float
+    ) -> None:
+        """Initialize mirror set.
+        
+        Args:
+            urls: Base URLs, preferred first; duplicates are dropped
+            cache_path: File caching probe results
+            ttl: Seconds probe results stay valid
+        """
+        bases = dict.fromkeys(url.rstrip('/') for url in urls if url)
+        self.status = {url: MirrorStatus(url) for url in bases}
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self._active = {url: 0 for url in bases}
+        # Mirrors that failed a transfer during this run; never cached
+        self._failed: set[str] = set()
+        self._ranked = len(self.status) < 2
+        self._lock = threading.Lock()
+    
+    @property
+    def urls(self) -> list[str]:
+        """Base URLs from fastest to slowest, down mirrors last."""
+        with self._lock:
+            return self._by_cost()
+    
+    def ensure_ranked(
+        self,
+        session: "requests.Session",
+        probe_path: str
+    ) -> None:
+        """Rank mirrors from cached probes, probing any that are stale.
+        
+        Does nothing after the first call, or when there is one mirror.
+        
+        Args:
+            session: Session used for probes
+            probe_path: File to probe, relative to each mirror's base URL
+        """
+        if self._ranked:
+            return
+        
+        cached = self._load_cache()
+        now = time.time()
+        stale = []
+        for url in self.status:
+            entry = cached.get(url)
+            if entry is not None and 0 <= now - entry.probed_at < self.ttl:
+                self.status[url] = entry
+            else:
+                stale.append(url)
+        
+        if stale:
+            with span("probe_mirrors", "network"):
+                with ThreadPoolExecutor(
+                    max_workers=len(stale),
+                    thread_name_prefix="probe"
+                ) as executor:
+                    for status in executor.map(
+                        lambda url: self._probe(session, url, probe_path),
+                        stale
+                    ):
+                        self.status[status.url] = status
+            self._save_cache()
+        
+        self._ranked = True
+        logger.info("Mirrors: %s", ", ".join(
+            self.status[url].describe() for url in self.urls
+        ))
+    
+    def candidates(self, path: str) -> list[str]:
+        """URLs of ``path`` to try in order.
+        
+        The first is the healthy mirror with the lowest cost once its
+        transfers already in flight are counted, so concurrent downloads
+        stripe across mirrors; the rest follow by cost.
+        """
+        with self._lock:
+            ordered = self._by_cost()
+            first = min(
+                ordered,
+                key=lambda url: self._cost(url) * (self._active[url] + 1)
+            )
+        ordered.remove(first)
+        return [f"{url}/{path}" for url in [first] + ordered]
+    
+    @contextmanager
+    def transfer(self, url: str) -> Iterator[None]:
+        """Count a download from ``url`` as in flight while the block runs."""
+        base = self._base_of(url)
+        if base is None:
+            yield
+            return
+        with self._lock:
+            self._active[base] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active[base] -= 1
+    
+    def mark_failed(self, url: str, error: Exception) -> None:
+        """Rank the mirror serving ``url`` last for the rest of this run."""
+        base = self._base_of(url)
+        if base is None or len(self.status) < 2:
+            return
+        with self._lock:
+            first_failure = base not in self._failed
+            self._failed.add(base)
+        if first_failure:
+            logger.warning(
+                "Mirror %s failed (%s), moving to others", base, error
+            )
+    
+    def _cost(self, url: str) -> float:
+        return math.inf if url in self._failed else self.status[url].cost
+    
+    def _by_cost(self) -> list[str]:
+        # sorted() is stable, so configured order breaks ties
+        return sorted(self.status, key=self._cost)
+    
+    def _base_of(self, url: str) -> Optional[str]:
+        for base in self.status:
+            if url.startswith(base + '/'):
+                return base
+        return None
+    
+    @staticmethod
+    def _probe(
+        session: "requests.Session",
+        url: str,
+        probe_path: str
+    ) -> MirrorStatus:
+        """Time a small ranged download from one mirror."""
+        status = MirrorStatus(url, probed_at=time.time())
+        start = time.perf_counter()
+        try:
+            with session.get(
+                f"{url}/{probe_path}",
+                headers={'Range': f"bytes=0-{_PROBE_BYTES - 1}"},
+                stream=True,
+                timeout=_PROBE_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                first_byte = time.perf_counter()
+                # Servers ignoring the range still send only what is read
+                received = len(response.raw.read(_PROBE_BYTES))
+            status.latency = first_byte - start
+            if received:
+                status.throughput = received / max(
+                    time.perf_counter() - first_byte, 1e-3
+                )
+        except Exception as e:
+            # Includes raw urllib3 errors from the body read
+            logger.info("Mirror %s failed its probe: %s", url, e)
+            status.healthy = False
+        return status
+    
+    def _load_cache(self) -> dict[str, MirrorStatus]:
+        """Read cached probe results, ignoring an unusable cache."""
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+            return {
+                url: MirrorStatus(**entry)
+                for url, entry in data['mirrors'].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+    
+    def _save_cache(self) -> None:
+        """Merge current probe results into the cache file."""
+        mirrors = {
+            url: asdict(status) for url, status in self._load_cache().items()
+        }
+        with self._lock:
+            mirrors.update(
+                (url, asdict(status)) for url, status in self.status.items()
+                if status.probed_at
+            )
+        try:
+            write_json_atomic(self.cache_path, {'mirrors': mirrors})
+        except OSError:
+            logger.warning("Failed to save mirror probe cache", exc_info=True)
@@ -1,16 +1,23 @@
 """Mod management functionality for Rebirth Launcher."""
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from graphlib import CycleError, TopologicalSorter
 from pathlib import Path
 import json
 import logging
-from dataclasses import dataclass
-from typing import Callable, Optional, Union
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
-import requests
-
-from rebirth_launcher.config import get_config
-from rebirth_launcher.exceptions import ModError
+from rebirth_launcher.config import LauncherConfig, get_config
+from rebirth_launcher.exceptions import ModDependencyError, ModError
+from rebirth_launcher.transfer import iter_response, shared_rate_limiter
 from rebirth_launcher.utils import ensure_directory, clean_directory
 
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -22,13 +29,41 @@ class ModInfo:
     author: Optional[str] = None
     dependencies: Optional[list[str]] = None
 
+@dataclass
+class BatchInstallResult:
+    """Outcome of installing several mods at once."""
+    installed: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    skipped: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+    
+    @property
+    def ok(self) -> bool:
+        """Whether every mod of the batch was installed."""
+        return not (self.failed or self.skipped)
+    
+    def summary(self) -> str:
+        """Human readable one-line summary of the batch."""
+        return (
+            f"{len(self.installed)} installed, {len(self.failed)} failed, "
+            f"{len(self.skipped)} skipped in {self.elapsed:.1f}s"
+        )
+
 class ModManager:
     """Manages mod installation and updates."""
     
     def __init__(self, config: LauncherConfig) -> None:
         """Initialize mod manager with configuration."""
         self.config = config
-        self.session = requests.Session()
+        self._session: Optional["requests.Session"] = None
+    
+    @property
+    def session(self) -> "requests.Session":
+        """Shared HTTP session, set up on first use to keep startup cheap."""
+        if self._session is None:
+            from rebirth_launcher.transport import get_session
+            self._session = get_session(self.config.download_concurrency)
+        return self._session
     
     def install_mod(
         self,
@@ -48,6 +83,8 @@ def install_mod(
         Raises:
             ModError: If installation fails
         """
+        import requests
+        
         try:
             # Ensure mod directory exists
             if not ensure_directory(self.config.mods_path):
@@ -75,11 +112,12 @@ def install_mod(
                 )
             
             total = int(response.headers.get('content-length', 0))
+            limiter = shared_rate_limiter(self.config.download_rate_limit)
             
             try:
                 with open(mod_path, 'wb') as f:
                     downloaded = 0
-                    for chunk in response.iter_content(chunk_size=8192):
+                    for chunk in iter_response(response, limiter):
                         f.write(chunk)
                         downloaded += len(chunk)
                         if progress_callback and total:
@@ -99,4 +137,148 @@ def install_mod(
             raise ModError(
                 f"Failed to install mod {mod_info.name}",
                 str(e)
-            )
\ No newline at end of file
+            )
+    
+    def install_mods(
+        self,
+        mods: Iterable[ModInfo],
+        progress_callback: Callable[[str, float], None] | None = None,
+        overall_callback: Callable[[float], None] | None = None,
+        workers: Optional[int] = None
+    ) -> BatchInstallResult:
+        """
+        Install several mods concurrently, dependencies first.
+        
+        A mod is started as soon as every mod of the batch it depends on
+        is installed, so independent mods install side by side while
+        dependency chains keep their order. Dependencies outside the batch
+        must already be installed. When a mod fails, the mods depending on
+        it are skipped and the rest of the batch carries on.
+        
+        Args:
+            mods: Mods to install; names must be unique
+            progress_callback: Called with (mod name, fraction) per mod
+            overall_callback: Called with the fraction of the whole batch
+            workers: Concurrent installs; defaults to
+                ``config.download_concurrency``
+            
+        Returns:
+            BatchInstallResult: Installed, failed and skipped mods
+            
+        Raises:
+            ModDependencyError: If dependencies are missing or circular
+        """
+        start = time.perf_counter()
+        by_name: dict[str, ModInfo] = {}
+        for mod in mods:
+            if mod.name in by_name:
+                raise ModDependencyError(
+                    f"Mod {mod.name} is listed more than once"
+                )
+            by_name[mod.name] = mod
+        
+        result = BatchInstallResult()
+        if not by_name:
+            return result
+        
+        graph = self._dependency_graph(by_name)
+        sorter = TopologicalSorter(graph)
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            raise ModDependencyError(
+                "Mod dependencies form a cycle",
+                " -> ".join(e.args[1])
+            )
+        
+        fractions = dict.fromkeys(by_name, 0.0)
+        lock = threading.Lock()
+        
+        def report(name: str, fraction: float) -> None:
+            with lock:
+                fractions[name] = fraction
+                if progress_callback:
+                    progress_callback(name, fraction)
+                if overall_callback:
+                    overall_callback(sum(fractions.values()) / len(fractions))
+        
+        # Failed or skipped mods; anything depending on them is skipped
+        blocked: set[str] = set()
+        workers = max(1, min(
+            workers or self.config.download_concurrency, len(by_name)
+        ))
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="mod-install"
+        ) as executor:
+            running: dict[Future[bool], str] = {}
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    unmet = graph[name] & blocked
+                    if unmet:
+                        logger.warning(
+                            "Skipping mod %s, dependency %s was not installed",
+                            name, ", ".join(sorted(unmet))
+                        )
+                        result.skipped.append(name)
+                        blocked.add(name)
+                        sorter.done(name)
+                        report(name, 1.0)
+                        continue
+                    running[executor.submit(
+                        self.install_mod,
+                        by_name[name],
+                        lambda fraction, name=name: report(name, fraction)
+                    )] = name
+                
+                if not running:
+                    # Everything ready was skipped; look again
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                        result.installed.append(name)
+                    except ModError as e:
+                        logger.error("Failed to install mod %s: %s", name, e)
+                        result.failed[name] = (
+                            f"{e.message}: {e.details}" if e.details
+                            else e.message
+                        )
+                        blocked.add(name)
+                    sorter.done(name)
+                    report(name, 1.0)
+        
+        result.elapsed = time.perf_counter() - start
+        logger.info("Batch install: %s", result.summary())
+        return result
+    
+    def _dependency_graph(
+        self,
+        mods: dict[str, ModInfo]
+    ) -> dict[str, set[str]]:
+        """Map each mod to the mods of the batch it depends on.
+        
+        Raises:
+            ModDependencyError: If a dependency is neither in the batch
+                nor already installed
+        """
+        graph: dict[str, set[str]] = {}
+        missing: list[str] = []
+        for name, mod in mods.items():
+            dependencies = set(mod.dependencies or [])
+            outside = dependencies - mods.keys()
+            absent = sorted(
+                dep for dep in outside
+                if not (self.config.mods_path / dep).exists()
+            )
+            if absent:
+                missing.append(f"{name} needs {', '.join(absent)}")
+            graph[name] = dependencies - outside
+        
+        if missing:
+            raise ModDependencyError(
+                "Missing mod dependencies", "; ".join(missing)
+            )
+        return graph
@@ -0,0 +1,188 @@
+"""Concurrent pre-launch checks with a shared deadline."""
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from rebirth_launcher.exceptions import LauncherError
+from rebirth_launcher.tracing import span
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CheckResult:
+    """Outcome of a single preflight check."""
+    name: str
+    required: bool
+    status: str = "pending"  # pending, passed, failed or timed_out
+    duration: Optional[float] = None
+    value: Any = None
+    error: Optional[BaseException] = None
+    
+    @property
+    def passed(self) -> bool:
+        """Whether the check completed successfully."""
+        return self.status == "passed"
+
+@dataclass
+class PreflightReport:
+    """Snapshot of every preflight check."""
+    results: dict[str, CheckResult] = field(default_factory=dict)
+    elapsed: float = 0.0
+    
+    @property
+    def ok(self) -> bool:
+        """Whether every required check passed."""
+        return all(r.passed for r in self.results.values() if r.required)
+    
+    def value(self, name: str) -> Any:
+        """Get the value a passed check returned, or None."""
+        result = self.results.get(name)
+        return result.value if result and result.passed else None
+    
+    def raise_for_failure(self) -> None:
+        """Raise for the first required check that failed or timed out."""
+        required = [r for r in self.results.values() if r.required]
+        for result in required:
+            if result.status != "failed":
+                continue
+            if isinstance(result.error, LauncherError):
+                raise result.error
+            raise LauncherError(
+                f"Preflight check {result.name} failed",
+                str(result.error) if result.error else None
+            )
+        for result in required:
+            if result.status == "timed_out":
+                raise LauncherError(
+                    "Preflight check timed out",
+                    f"Check: {result.name}"
+                )
+    
+    def summary(self) -> str:
+        """One-line summary of check outcomes and timings."""
+        parts = []
+        for result in self.results.values():
+            timing = (
+                f" {result.duration * 1000:.0f}ms"
+                if result.duration is not None else ""
+            )
+            parts.append(f"{result.name}={result.status}{timing}")
+        return f"Preflight in {self.elapsed * 1000:.0f}ms: " + ", ".join(parts)
+
+class Preflight:
+    """Runs launch checks concurrently under one deadline.
+    
+    Checks are callables that raise (or return False) to fail; any other
+    return value is kept on the report. Required checks gate the launch.
+    Optional ones run on daemon threads, so an unfinished optional check
+    never holds the process open.
+    """
+    
+    def __init__(self, deadline: float) -> None:
+        """Initialize preflight with a deadline in seconds."""
+        self.deadline = deadline
+        self._checks: list[tuple[str, Callable[[], Any], bool]] = []
+        self._futures: dict[str, Future[Any]] = {}
+        self._results: dict[str, CheckResult] = {}
+        self._start = 0.0
+    
+    def add(
+        self,
+        name: str,
+        check: Callable[[], Any],
+        required: bool = True
+    ) -> None:
+        """Register a check to run."""
+        self._checks.append((name, check, required))
+    
+    def run(self) -> PreflightReport:
+        """Start every check and wait until the required ones are done.
+        
+        Returns as soon as all required checks have passed, any of them
+        has failed, or the deadline expires, whichever comes first.
+        """
+        self._start = time.perf_counter()
+        for name, check, required in self._checks:
+            self._results[name] = CheckResult(name=name, required=required)
+            future: Future[Any] = Future()
+            self._futures[name] = future
+            threading.Thread(
+                target=self._run_check,
+                args=(name, check, future),
+                name=f"preflight-{name}",
+                daemon=True
+            ).start()
+        
+        pending = {
+            self._futures[name]
+            for name, _, required in self._checks
+            if required
+        }
+        while pending:
+            done, pending = wait(
+                pending,
+                timeout=self.remaining(),
+                return_when=FIRST_COMPLETED
+            )
+            if not done:
+                break
+            if any(f.exception() or f.result() is False for f in done):
+                break
+        return self.report()
+    
+    def wait_optional(self, timeout: Optional[float] = None) -> PreflightReport:
+        """Give optional checks until ``timeout`` or the deadline to finish.
+        
+        Returns at once if no optional check is still running.
+        """
+        remaining = self.remaining()
+        if timeout is not None:
+            remaining = min(remaining, timeout)
+        pending = [
+            self._futures[name]
+            for name, _, required in self._checks
+            if not required and not self._futures[name].done()
+        ]
+        if pending and remaining > 0:
+            wait(pending, timeout=remaining)
+        return self.report()
+    
+    def remaining(self) -> float:
+        """Seconds left before the deadline."""
+        return max(0.0, self.deadline - (time.perf_counter() - self._start))
+    
+    def report(self) -> PreflightReport:
+        """Snapshot the current state of all checks."""
+        elapsed = time.perf_counter() - self._start
+        for result in self._results.values():
+            if result.status == "pending" and elapsed >= self.deadline:
+                result.status = "timed_out"
+        return PreflightReport(
+            results={n: CheckResult(**vars(r)) for n, r in self._results.items()},
+            elapsed=elapsed
+        )
+    
+    def _run_check(
+        self,
+        name: str,
+        check: Callable[[], Any],
+        future: Future[Any]
+    ) -> None:
+        started = time.perf_counter()
+        result = self._results[name]
+        try:
+            with span(name, "preflight"):
+                value = check()
+        except BaseException as e:
+            result.status, result.error = "failed", e
+            logger.debug("Preflight check %s failed: %s", name, e)
+            future.set_exception(e)
+        else:
+            result.status = "failed" if value is False else "passed"
+            result.value = value
+            future.set_result(value)
+        finally:
+            result.duration = time.perf_counter() - started
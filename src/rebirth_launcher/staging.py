@@ -0,0 +1,228 @@
+"""Staged installs of the Mods directory with one-step rollback."""
+from pathlib import Path
+import json
+import logging
+import os
+import shutil
+from typing import Optional
+
+from rebirth_launcher.constants import (
+    GENERATIONS_SUFFIX,
+    PREVIOUS_GENERATION_SUFFIX,
+    STAGING_SUFFIX,
+)
+from rebirth_launcher.exceptions import ModError
+from rebirth_launcher.install_index import index_path
+from rebirth_launcher.manifest import ReleaseManifest
+from rebirth_launcher.utils import (
+    move_to_trash,
+    purge_directory,
+    purge_in_background,
+    write_json_atomic,
+)
+
+logger = logging.getLogger(__name__)
+
+class StagedInstall:
+    """Builds a new Mods generation beside the live one and swaps it in.
+    
+    A release is extracted into ``Mods.staging``; committing renames the
+    live ``Mods`` to ``Mods.previous`` and the staging directory to
+    ``Mods``, so the game never sees a half-installed tree. The previous
+    generation is kept until the next commit and can be swapped back with
+    ``rollback``. Versions of both generations are tracked in
+    ``Mods.generations.json``.
+    
+    Entries named in ``preserve`` are not part of any generation; they are
+    moved along into whichever generation is live.
+    """
+    
+    def __init__(
+        self,
+        mods_path: Path,
+        preserve: Optional[set[str]] = None
+    ) -> None:
+        """Initialize staged install for ``mods_path``."""
+        self.mods_path = mods_path
+        self.preserve = preserve or set()
+        self.staging_path = self._sibling(STAGING_SUFFIX)
+        self.previous_path = self._sibling(PREVIOUS_GENERATION_SUFFIX)
+        self.state_path = self._sibling(GENERATIONS_SUFFIX)
+    
+    @property
+    def previous_version(self) -> Optional[str]:
+        """Version of the generation ``rollback`` would restore."""
+        if not self.previous_path.is_dir():
+            return None
+        return self._load_state().get('previous')
+    
+    def prepare(self, clone_live: bool = False) -> Path:
+        """Create an empty staging directory, or a clone of the live tree.
+        
+        Cloning hard-links every file where the filesystem allows it, so
+        it costs one metadata operation per file. Updates must replace
+        files (``os.replace``) rather than write into them, which keeps
+        the linked previous generation intact.
+        """
+        stale = self.staging_path.exists()
+        if stale and not purge_directory(self.staging_path):
+            raise ModError(
+                "Failed to remove stale staging directory",
+                f"Path: {self.staging_path}"
+            )
+        
+        self.staging_path.mkdir(parents=True)
+        if clone_live and self.mods_path.is_dir():
+            _clone_tree(self.mods_path, self.staging_path, self.preserve)
+        return self.staging_path
+    
+    def validate(self, manifest: Optional[ReleaseManifest] = None) -> bool:
+        """Check the staged tree before it goes live.
+        
+        The tree must not be empty, and when a manifest is available every
+        file it lists must be present with the expected size.
+        """
+        staged = self.staging_path
+        if not staged.is_dir() or not any(staged.iterdir()):
+            logger.error("Staged install is empty")
+            return False
+        
+        if manifest is None:
+            return True
+        
+        for entry in manifest.files.values():
+            try:
+                if (staged / entry.path).stat().st_size != entry.size:
+                    logger.error("Staged file has wrong size: %s", entry.path)
+                    return False
+            except OSError:
+                logger.error("Staged file is missing: %s", entry.path)
+                return False
+        return True
+    
+    def commit(self, version: str, previous_version: Optional[str]) -> None:
+        """Swap the staged tree in, keeping the live one as previous."""
+        # The generation before last is no longer reachable; drop it
+        if self.previous_path.exists():
+            trashed = move_to_trash(self.previous_path)
+            if trashed is None:
+                raise ModError(
+                    "Failed to remove previous generation",
+                    f"Path: {self.previous_path}"
+                )
+            self.previous_path.rmdir()
+            purge_in_background([trashed])
+        
+        has_live = self.mods_path.exists()
+        if has_live:
+            try:
+                os.rename(self.mods_path, self.previous_path)
+            except OSError as e:
+                raise ModError("Failed to set aside live install", str(e))
+        try:
+            os.rename(self.staging_path, self.mods_path)
+        except OSError as e:
+            if has_live:
+                os.rename(self.previous_path, self.mods_path)
+            raise ModError("Failed to activate staged install", str(e))
+        
+        # Only now, so a failed swap never strands them in staging, which
+        # the next prepare() purges
+        if has_live:
+            self._move_preserved(self.previous_path, self.mods_path)
+        
+        # The live index now describes the previous generation
+        self._move_index(self.mods_path, self.previous_path)
+        
+        self._save_state({
+            'current': version,
+            'previous': previous_version if has_live else None,
+        })
+        logger.info("Activated staged install of %s", version)
+    
+    def rollback(self) -> Optional[str]:
+        """Swap the previous generation back in.
+        
+        The generation being replaced becomes the new previous one, so a
+        second rollback rolls forward again.
+        
+        Returns:
+            The version now live, as recorded when it was installed
+        """
+        if not self.previous_path.is_dir():
+            raise ModError(
+                "No previous installation to roll back to",
+                f"Expected path: {self.previous_path}"
+            )
+        
+        state = self._load_state()
+        self._move_preserved(self.mods_path, self.previous_path)
+        swap_path = self._sibling(STAGING_SUFFIX)
+        if swap_path.exists() and not purge_directory(swap_path):
+            raise ModError(
+                "Failed to clear staging directory", f"Path: {swap_path}"
+            )
+        
+        try:
+            os.rename(self.mods_path, swap_path)
+            os.rename(self.previous_path, self.mods_path)
+            os.rename(swap_path, self.previous_path)
+        except OSError as e:
+            raise ModError("Failed to roll back installation", str(e))
+        
+        self._move_index(self.mods_path, swap_path)
+        self._move_index(self.previous_path, self.mods_path)
+        self._move_index(swap_path, self.previous_path)
+        
+        restored = state.get('previous')
+        self._save_state({'current': restored, 'previous': state.get('current')})
+        logger.info("Rolled back to %s", restored or "previous installation")
+        return restored
+    
+    def discard(self) -> None:
+        """Delete a staged tree that will not be committed."""
+        purge_directory(self.staging_path)
+    
+    def _sibling(self, suffix: str) -> Path:
+        return self.mods_path.with_name(self.mods_path.name + suffix)
+    
+    def _move_preserved(self, source: Path, destination: Path) -> None:
+        """Move preserved entries from one generation to another."""
+        for name in self.preserve:
+            if (source / name).exists() and not (destination / name).exists():
+                os.rename(source / name, destination / name)
+    
+    def _move_index(self, source: Path, destination: Path) -> None:
+        """Move the install index of one generation to another's slot."""
+        target = index_path(destination)
+        try:
+            os.replace(index_path(source), target)
+        except FileNotFoundError:
+            target.unlink(missing_ok=True)
+    
+    def _load_state(self) -> dict[str, Optional[str]]:
+        try:
+            with open(self.state_path, 'r') as f:
+                state: dict[str, Optional[str]] = json.load(f)
+                return state
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_state(self, state: dict[str, Optional[str]]) -> None:
+        write_json_atomic(self.state_path, state)
+
+def _clone_tree(source: Path, destination: Path, preserve: set[str]) -> None:
+    """Recreate ``source`` in ``destination`` using hard links."""
+    for dirpath, dirnames, filenames in os.walk(source):
+        current = Path(dirpath)
+        if current == source:
+            dirnames[:] = [d for d in dirnames if d not in preserve]
+            filenames = [f for f in filenames if f not in preserve]
+        target_dir = destination / current.relative_to(source)
+        target_dir.mkdir(exist_ok=True)
+        for name in filenames:
+            try:
+                os.link(current / name, target_dir / name)
+            except OSError:
+                # No hard links on this filesystem (e.g. FAT); copy instead
+                shutil.copy2(current / name, target_dir / name)
@@ -1,14 +1,24 @@
 """Steam integration functionality."""
 import logging
 from pathlib import Path
-import winreg
+import sys
+from typing import Any, Optional
 
 from rebirth_launcher.config import get_config
-from rebirth_launcher.constants import STEAM_APP_ID
+from rebirth_launcher.constants import STEAM_APP_ID, STEAM_LIBRARY_CACHE_FILENAME
 from rebirth_launcher.exceptions import SteamError
+from rebirth_launcher.steam_library import GameInstall, SteamLibrary
 
 logger = logging.getLogger(__name__)
 
+def _load_winreg() -> Any:
+    """Import the registry module on demand; it only exists on Windows."""
+    try:
+        import winreg
+    except ImportError:
+        raise SteamError("The Steam registry is only available on Windows")
+    return winreg
+
 class SteamIntegration:
     """Handles Steam-related operations."""
     
@@ -26,9 +36,38 @@ class SteamIntegration:
     def __init__(self) -> None:
         """Initialize Steam integration."""
         self.config = get_config()
+        self.library = SteamLibrary(
+            STEAM_APP_ID,
+            self.config.data_dir / STEAM_LIBRARY_CACHE_FILENAME,
+            self.config.steam_path
+        )
+    
+    def find_game(self) -> Optional[GameInstall]:
+        """Locate the game in any Steam library, on any platform."""
+        try:
+            return self.library.locate()
+        except Exception:
+            logger.exception("Steam library lookup failed")
+            return None
     
     def verify_ownership(self) -> bool:
-        """Verify game ownership through Steam registry."""
+        """Verify the game is installed through Steam.
+        
+        Steam's library files are checked first; they work on every
+        platform and are usually answered from cache. The registry is
+        only consulted on Windows when they don't list the game.
+        """
+        install = self.find_game()
+        if install is not None and install.executable is not None:
+            logger.info(
+                f"Game found in Steam library at {install.path} "
+                f"(build {install.build_id})"
+            )
+            return True
+        if sys.platform != "win32":
+            logger.error("Game not found in any Steam library")
+            return False
+        
         try:
             # Check Steam installation
             steam_path = self._get_steam_path()
@@ -53,6 +92,7 @@ def verify_ownership(self) -> bool:
     
     def _get_steam_path(self) -> Path:
         """Get Steam installation path from registry."""
+        winreg = _load_winreg()
         for registry_path in self.STEAM_REGISTRY_PATHS:
             try:
                 with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, registry_path) as key:
@@ -67,6 +107,7 @@ def _get_steam_path(self) -> Path:
     
     def _is_game_owned(self) -> bool:
         """Check if game is owned through Steam registry."""
+        winreg = _load_winreg()
         for registry_path in self.STEAM_APPS_REGISTRY_PATHS:
             try:
                 with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, registry_path) as key:
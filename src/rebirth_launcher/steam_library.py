@@ -0,0 +1,342 @@
+"""Locate Steam games from Steam's own library files.
+
+Steam records every library folder in ``steamapps/libraryfolders.vdf``
+and every installed app in ``steamapps/appmanifest_<appid>.acf``, both
+in Valve's KeyValues (VDF) text format. Reading them finds the game in
+any library, on any platform, without registry or path probing.
+"""
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+import json
+import logging
+import re
+import sys
+from typing import Any, Optional
+
+from rebirth_launcher.utils import game_executable, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FORMAT = 1
+
+# Quoted string, brace, line comment or bare word
+_VDF_TOKEN = re.compile(
+    r'"((?:[^"\\]|\\.)*)"|([{}])|(//[^\n]*)|([^\s{}"]+)'
+)
+_VDF_ESCAPE = re.compile(r'\\(.)')
+_VDF_ESCAPES = {'n': '\n', 't': '\t'}
+
+# AppState StateFlags bit set once an app is fully installed
+_STATE_FULLY_INSTALLED = 4
+
+def parse_vdf(text: str) -> dict[str, Any]:
+    """Parse Valve KeyValues text into nested dicts.
+    
+    Keys are lowercased, since Steam itself matches them case-insensitively
+    and writes both ``LibraryFolders`` and ``libraryfolders``. Values stay
+    strings. Platform conditionals such as ``[$WIN32]`` are ignored.
+    
+    Raises:
+        ValueError: If braces or key/value pairs don't match up
+    """
+    root: dict[str, Any] = {}
+    stack = [root]
+    key: Optional[str] = None
+    for match in _VDF_TOKEN.finditer(text):
+        quoted, brace, comment, bare = match.groups()
+        if comment is not None:
+            continue
+        if brace == '{':
+            if key is None:
+                raise ValueError(f"Unexpected '{{' at offset {match.start()}")
+            child = stack[-1].get(key)
+            if not isinstance(child, dict):
+                child = stack[-1][key] = {}
+            stack.append(child)
+            key = None
+        elif brace == '}':
+            if key is not None or len(stack) == 1:
+                raise ValueError(f"Unexpected '}}' at offset {match.start()}")
+            stack.pop()
+        else:
+            if quoted is None:
+                if bare.startswith('[$'):
+                    continue
+                token = bare
+            elif '\\' in quoted:
+                token = _VDF_ESCAPE.sub(
+                    lambda m: _VDF_ESCAPES.get(m.group(1), m.group(1)), quoted
+                )
+            else:
+                token = quoted
+            if key is None:
+                key = token.lower()
+            else:
+                stack[-1][key] = token
+                key = None
+    if key is not None or len(stack) != 1:
+        raise ValueError("Unexpected end of VDF text")
+    return root
+
+def read_vdf(path: Path) -> dict[str, Any]:
+    """Parse a VDF file.
+    
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If it is not valid VDF
+    """
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return parse_vdf(f.read())
+
+@dataclass
+class GameInstall:
+    """Where Steam installed a game, as recorded in its app manifest."""
+    app_id: str
+    path: Path
+    library: Path
+    build_id: Optional[str] = None
+    fully_installed: bool = True
+    
+    @property
+    def executable(self) -> Optional[Path]:
+        """Game binary, native or Windows; None if neither is present."""
+        return game_executable(self.path)
+
+def default_steam_roots(configured: Optional[Path] = None) -> list[Path]:
+    """Steam installations to look in, configured one first.
+    
+    Covers the registry entry on Windows, the usual Linux locations
+    including Flatpak and Snap installs (as on the Steam Deck), and
+    macOS. Only existing directories are returned.
+    """
+    candidates: list[Path] = []
+    if configured is not None:
+        candidates.append(configured)
+    if sys.platform == "win32":
+        registry_path = _registry_steam_path()
+        if registry_path is not None:
+            candidates.append(registry_path)
+        candidates.append(Path(r"C:\Program Files (x86)\Steam"))
+    else:
+        home = Path.home()
+        candidates += [
+            home / ".steam" / "steam",
+            home / ".local" / "share" / "Steam",
+            home / ".var" / "app" / "com.valvesoftware.Steam" / ".local"
+            / "share" / "Steam",
+            home / "snap" / "steam" / "common" / ".local" / "share" / "Steam",
+            home / "Library" / "Application Support" / "Steam",
+        ]
+    
+    roots: list[Path] = []
+    seen: set[str] = set()
+    for candidate in candidates:
+        try:
+            # ~/.steam/steam is usually a symlink to one of the others
+            resolved = candidate.resolve()
+        except OSError:
+            continue
+        if str(resolved) not in seen and (resolved / "steamapps").is_dir():
+            seen.add(str(resolved))
+            roots.append(resolved)
+    return roots
+
+def library_folders(steam_root: Path) -> list[Path]:
+    """Library folders of a Steam installation, the root's own first.
+    
+    Reads both the current ``libraryfolders.vdf`` layout (numbered
+    blocks with a ``path``) and the older one (numbered paths).
+    """
+    libraries = [steam_root]
+    try:
+        data = read_vdf(steam_root / "steamapps" / "libraryfolders.vdf")
+    except FileNotFoundError:
+        return libraries
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable Steam library list: {e}")
+        return libraries
+    
+    folders = data.get('libraryfolders') or {}
+    for key, value in folders.items():
+        if not key.isdigit():
+            continue
+        path = value.get('path') if isinstance(value, dict) else value
+        if path and Path(path) not in libraries:
+            libraries.append(Path(path))
+    return libraries
+
+def find_app(app_id: str, steam_roots: list[Path]) -> Optional[GameInstall]:
+    """Find an installed app in any library of the given Steam roots.
+    
+    A fully installed copy wins over one that is mid-update or download.
+    """
+    return _first_install(app_id, _app_manifests(app_id, steam_roots))
+
+def _first_install(
+    app_id: str,
+    manifests: Iterable[tuple[Path, Path]]
+) -> Optional[GameInstall]:
+    fallback: Optional[GameInstall] = None
+    for _, manifest in manifests:
+        install = _read_app_manifest(app_id, manifest)
+        if install is None:
+            continue
+        if install.fully_installed:
+            return install
+        fallback = fallback or install
+    return fallback
+
+class SteamLibrary:
+    """Finds a game through Steam's library files, with a cache.
+    
+    The result is cached with the mtime and size of every file it was
+    derived from: each root's ``libraryfolders.vdf`` and the app manifest
+    in each library (including ones that did not exist). While none of
+    them change, locating the game costs a few stat calls and no parsing.
+    """
+    
+    def __init__(
+        self,
+        app_id: str,
+        cache_path: Path,
+        steam_path: Optional[Path] = None
+    ) -> None:
+        """Initialize lookup of ``app_id``.
+        
+        Args:
+            app_id: Steam app ID of the game
+            cache_path: File caching the last lookup
+            steam_path: Configured Steam installation, searched first
+        """
+        self.app_id = app_id
+        self.cache_path = cache_path
+        self.steam_path = steam_path
+    
+    def locate(self, refresh: bool = False) -> Optional[GameInstall]:
+        """Find the game, from the cache while Steam's files are unchanged.
+        
+        Args:
+            refresh: Re-read Steam's files even if the cache is current
+        """
+        roots = default_steam_roots(self.steam_path)
+        root_names = [str(root) for root in roots]
+        
+        if not refresh:
+            cached = self._load_cache()
+            if cached.get('roots') == root_names and all(
+                _file_stamp(Path(path)) == stamp
+                for path, stamp in cached.get('stamps', {}).items()
+            ):
+                install = cached.get('install')
+                logger.debug("Using cached Steam library lookup")
+                return _install_from_dict(install) if install else None
+        
+        stamps = {}
+        for root in roots:
+            vdf = root / "steamapps" / "libraryfolders.vdf"
+            stamps[str(vdf)] = _file_stamp(vdf)
+        manifests = list(_app_manifests(self.app_id, roots))
+        for _, manifest in manifests:
+            stamps[str(manifest)] = _file_stamp(manifest)
+        install = _first_install(self.app_id, manifests)
+        
+        if install is not None:
+            logger.info(
+                "Found app %s (build %s) at %s",
+                self.app_id, install.build_id, install.path
+            )
+        try:
+            write_json_atomic(self.cache_path, {
+                'format': _CACHE_FORMAT,
+                'roots': root_names,
+                'stamps': stamps,
+                'install': _install_to_dict(install) if install else None,
+            })
+        except OSError:
+            logger.warning("Failed to save Steam library cache", exc_info=True)
+        return install
+    
+    def _load_cache(self) -> dict[str, Any]:
+        try:
+            with open(self.cache_path, 'r') as f:
+                data: dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('format') != _CACHE_FORMAT:
+            return {}
+        return data
+
+def _app_manifests(
+    app_id: str,
+    steam_roots: list[Path]
+) -> Iterator[tuple[Path, Path]]:
+    """(library, manifest path) for every library, existing or not."""
+    seen: set[Path] = set()
+    for root in steam_roots:
+        for library in library_folders(root):
+            if library in seen:
+                continue
+            seen.add(library)
+            manifest = library / "steamapps" / f"appmanifest_{app_id}.acf"
+            yield library, manifest
+
+def _read_app_manifest(app_id: str, manifest: Path) -> Optional[GameInstall]:
+    """Read an app manifest, or None if it is missing or unusable."""
+    try:
+        state = read_vdf(manifest).get('appstate') or {}
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable app manifest {manifest}: {e}")
+        return None
+    
+    install_dir = state.get('installdir')
+    if not install_dir:
+        return None
+    library = manifest.parent.parent
+    try:
+        flags = int(state.get('stateflags', _STATE_FULLY_INSTALLED))
+    except ValueError:
+        flags = _STATE_FULLY_INSTALLED
+    return GameInstall(
+        app_id=app_id,
+        path=library / "steamapps" / "common" / install_dir,
+        library=library,
+        build_id=state.get('buildid'),
+        fully_installed=bool(flags & _STATE_FULLY_INSTALLED),
+    )
+
+def _file_stamp(path: Path) -> Optional[list[int]]:
+    try:
+        info = path.stat()
+    except OSError:
+        return None
+    return [info.st_mtime_ns, info.st_size]
+
+def _install_to_dict(install: GameInstall) -> dict[str, Any]:
+    data = asdict(install)
+    data['path'] = str(install.path)
+    data['library'] = str(install.library)
+    return data
+
+def _install_from_dict(data: dict[str, Any]) -> Optional[GameInstall]:
+    try:
+        return GameInstall(**{
+            **data,
+            'path': Path(data['path']),
+            'library': Path(data['library']),
+        })
+    except (KeyError, TypeError):
+        return None
+
+def _registry_steam_path() -> Optional[Path]:
+    """Steam folder recorded for the current user, on Windows."""
+    try:
+        import winreg
+        with winreg.OpenKey(
+            winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam"
+        ) as key:
+            return Path(winreg.QueryValueEx(key, "SteamPath")[0])
+    except (ImportError, OSError):
+        return None
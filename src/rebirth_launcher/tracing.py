@@ -0,0 +1,193 @@
+"""Lightweight timing spans for launcher phases."""
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar, cast
+
+from rebirth_launcher.utils import format_bytes, write_json_atomic
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+@dataclass
+class Span:
+    """One timed phase, optionally with the number of bytes it moved."""
+    name: str
+    category: str
+    start: float
+    thread_id: int
+    thread_name: str
+    duration: Optional[float] = None
+    bytes: Optional[int] = None
+    args: dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def throughput(self) -> Optional[float]:
+        """Bytes per second, when the span recorded bytes."""
+        if self.bytes is None or not self.duration:
+            return None
+        return self.bytes / self.duration
+    
+    def describe(self) -> str:
+        """Short text form, e.g. ``extract 4.2s (1.1 GiB, 260.0 MiB/s)``."""
+        text = f"{self.name} {self.duration or 0:.2f}s"
+        if self.bytes is not None:
+            text += f" ({format_bytes(self.bytes)}"
+            if self.throughput:
+                text += f", {format_bytes(self.throughput)}/s"
+            text += ")"
+        return text
+
+class Tracer:
+    """Collects spans from every thread of the process.
+    
+    Recording is always on; a span is a couple of clock reads and a list
+    append. Categories say where the time went: ``network``, ``disk``,
+    ``extract``, ``preflight`` or the enclosing ``phase``.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty tracer."""
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+    
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: str = "phase",
+        **args: Any
+    ) -> Iterator[Span]:
+        """Time the enclosed block.
+        
+        The yielded span can be given ``bytes`` or extra ``args`` before
+        the block ends. Spans are recorded even when the block raises,
+        with the exception type added to their args.
+        """
+        thread = threading.current_thread()
+        span = Span(
+            name=name,
+            category=category,
+            start=time.perf_counter(),
+            thread_id=threading.get_ident(),
+            thread_name=thread.name,
+            args=args
+        )
+        try:
+            yield span
+        except BaseException as e:
+            span.args['error'] = type(e).__name__
+            raise
+        finally:
+            span.duration = time.perf_counter() - span.start
+            with self._lock:
+                self._spans.append(span)
+    
+    @property
+    def spans(self) -> list[Span]:
+        """Finished spans, in order of completion."""
+        with self._lock:
+            return list(self._spans)
+    
+    def summary(self, limit: int = 5) -> str:
+        """One line naming the slowest phases and steps.
+        
+        Enclosing ``phase`` spans are listed apart from the steps inside
+        them, followed by the time spent per step category. Concurrent
+        steps add up, so category totals can exceed wall-clock time.
+        """
+        spans = sorted(
+            self.spans, key=lambda s: s.duration or 0, reverse=True
+        )
+        if not spans:
+            return "No phases recorded"
+        
+        phases = [s for s in spans if s.category == "phase"]
+        steps = [s for s in spans if s.category != "phase"]
+        by_category: dict[str, float] = {}
+        for step in steps:
+            by_category[step.category] = (
+                by_category.get(step.category, 0.0) + (step.duration or 0)
+            )
+        
+        parts = []
+        if phases:
+            parts.append("Slowest phases: " + ", ".join(
+                s.describe() for s in phases[:limit]
+            ))
+        if steps:
+            parts.append("slowest steps: " + ", ".join(
+                s.describe() for s in steps[:limit]
+            ))
+            parts.append("time by category: " + ", ".join(
+                f"{category} {total:.2f}s"
+                for category, total in sorted(
+                    by_category.items(), key=lambda item: -item[1]
+                )
+            ))
+        return "; ".join(parts)
+    
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Spans as Chrome trace-event JSON (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+        threads: dict[int, str] = {}
+        for span in self.spans:
+            threads[span.thread_id] = span.thread_name
+            args = dict(span.args)
+            if span.bytes is not None:
+                args['bytes'] = span.bytes
+            if span.throughput:
+                args['mib_per_s'] = round(span.throughput / 1024**2, 2)
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': (span.start - self._origin) * 1e6,
+                'dur': (span.duration or 0) * 1e6,
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': args,
+            })
+        for thread_id, thread_name in threads.items():
+            events.append({
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': pid,
+                'tid': thread_id,
+                'args': {'name': thread_name},
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+    
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the trace to ``path`` as Chrome trace-event JSON."""
+        write_json_atomic(path, self.to_chrome_trace(), indent=None)
+
+_tracer = Tracer()
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    return _tracer
+
+def span(
+    name: str,
+    category: str = "phase",
+    **args: Any
+) -> AbstractContextManager[Span]:
+    """Time a block on the process-wide tracer; see ``Tracer.span``."""
+    return _tracer.span(name, category, **args)
+
+def traced(name: str, category: str = "phase") -> Callable[[F], F]:
+    """Decorator timing every call of a function as a span."""
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _tracer.span(name, category):
+                return func(*args, **kwargs)
+        return cast(F, wrapper)
+    return decorate
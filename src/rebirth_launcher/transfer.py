@@ -0,0 +1,211 @@
+"""Streaming reads for downloads: adaptive read sizes and rate limiting."""
+from collections.abc import Iterator
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+# Bounds on a single read from the socket
+MIN_READ_SIZE = 16 * 1024
+INITIAL_READ_SIZE = 64 * 1024
+MAX_READ_SIZE = 4 * 1024 * 1024
+
+# Reads are sized to take about this long at the measured throughput, so
+# fast links make few large reads and slow links still report progress
+_TARGET_READ_SECONDS = 0.1
+
+# Weight of the newest sample in the smoothed throughput
+_THROUGHPUT_SMOOTHING = 0.3
+
+_RATE_PATTERN = re.compile(
+    r'^\s*(\d+(?:\.\d+)?)\s*([kmg]?)(?:i?b)?(?:/s)?\s*$', re.IGNORECASE
+)
+_RATE_UNITS = {'': 1, 'k': 1024, 'm': 1024**2, 'g': 1024**3}
+
+class TokenBucket:
+    """Thread-safe token bucket capping the combined rate of its users.
+    
+    Each consumer takes tokens for the bytes it just read and sleeps off
+    any deficit. The deficit is shared, so concurrent transfers split the
+    rate between them instead of each getting the full rate.
+    """
+    
+    def __init__(self, rate: int, burst: Optional[int] = None) -> None:
+        """Initialize bucket allowing ``rate`` bytes per second.
+        
+        Args:
+            rate: Sustained bytes per second
+            burst: Bytes that may pass at once after an idle spell;
+                defaults to a quarter second's worth
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = burst or max(MIN_READ_SIZE, rate // 4)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def consume(self, amount: int) -> float:
+        """Take ``amount`` tokens, sleeping until they are paid for.
+        
+        Returns:
+            float: Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+class AdaptiveReadSize:
+    """Read size that follows the throughput of a transfer.
+    
+    Sizes are powers of two between ``MIN_READ_SIZE`` and
+    ``MAX_READ_SIZE``, chosen so one read takes about a tenth of a
+    second. Under a rate limit reads never exceed the bucket's burst,
+    which keeps throttled transfers smooth.
+    """
+    
+    def __init__(self, limiter: Optional[TokenBucket] = None) -> None:
+        """Initialize at ``INITIAL_READ_SIZE``."""
+        self.size = INITIAL_READ_SIZE
+        self.throughput: Optional[float] = None
+        self._ceiling = MAX_READ_SIZE
+        if limiter is not None:
+            self._ceiling = max(
+                MIN_READ_SIZE, min(MAX_READ_SIZE, limiter.capacity)
+            )
+        self.size = min(self.size, self._ceiling)
+    
+    def record(self, amount: int, elapsed: float) -> None:
+        """Account for a read of ``amount`` bytes taking ``elapsed`` seconds."""
+        if amount <= 0:
+            return
+        sample = amount / max(elapsed, 1e-6)
+        if self.throughput is None:
+            self.throughput = sample
+        else:
+            self.throughput += (
+                _THROUGHPUT_SMOOTHING * (sample - self.throughput)
+            )
+        
+        wanted = self.throughput * _TARGET_READ_SECONDS
+        size = MIN_READ_SIZE
+        while size * 2 <= wanted and size < self._ceiling:
+            size *= 2
+        # Grow at most one step per read; a single fast read from a
+        # socket buffer says little about the link
+        self.size = min(size, self.size * 2, self._ceiling)
+
+def iter_response(
+    response: "requests.Response",
+    limiter: Optional[TokenBucket] = None
+) -> Iterator[bytes]:
+    """Stream the body of ``response`` in adaptively sized chunks.
+    
+    Drop-in replacement for ``response.iter_content()`` on a streamed
+    response, raising the same ``requests`` exceptions on failure.
+    Reads go through urllib3's ``stream()``, which keeps going until the
+    body and any buffered decompressed data are exhausted; a new stream
+    is started whenever the read size changes.
+    
+    Args:
+        response: Response opened with ``stream=True``
+        limiter: Rate limit shared with other transfers
+    """
+    import requests
+    from urllib3.exceptions import (
+        DecodeError,
+        ProtocolError,
+        ReadTimeoutError,
+        SSLError,
+    )
+    
+    reads = AdaptiveReadSize(limiter)
+    exhausted = False
+    while not exhausted:
+        size = reads.size
+        chunks = response.raw.stream(size, decode_content=True)
+        exhausted = True
+        while True:
+            start = time.perf_counter()
+            try:
+                chunk = next(chunks, None)
+            except ProtocolError as e:
+                raise requests.exceptions.ChunkedEncodingError(e)
+            except DecodeError as e:
+                raise requests.exceptions.ContentDecodingError(e)
+            except ReadTimeoutError as e:
+                raise requests.ConnectionError(e)
+            except SSLError as e:
+                raise requests.exceptions.SSLError(e)
+            if chunk is None:
+                break
+            reads.record(len(chunk), time.perf_counter() - start)
+            if limiter is not None:
+                limiter.consume(len(chunk))
+            yield chunk
+            if reads.size != size:
+                exhausted = False
+                break
+
+_limiter: Optional[TokenBucket] = None
+_limiter_lock = threading.Lock()
+_rate_override: Optional[int] = None
+
+def set_rate_limit(rate: Optional[int]) -> None:
+    """Override the configured rate limit for this process.
+    
+    Args:
+        rate: Bytes per second; 0 disables limiting, None restores the
+            configured limit
+    """
+    global _rate_override
+    _rate_override = rate
+
+def shared_rate_limiter(configured: Optional[int]) -> Optional[TokenBucket]:
+    """Get the process-wide limiter for downloads.
+    
+    Every caller gets the same bucket, so the limit holds across all
+    concurrent transfers rather than per connection.
+    
+    Args:
+        configured: ``config.download_rate_limit`` in bytes per second;
+            ignored when ``set_rate_limit()`` overrode it
+    
+    Returns:
+        Optional[TokenBucket]: None when downloads are unlimited
+    """
+    global _limiter
+    rate = _rate_override if _rate_override is not None else configured
+    if not rate:
+        return None
+    with _limiter_lock:
+        if _limiter is None or _limiter.rate != rate:
+            _limiter = TokenBucket(rate)
+        return _limiter
+
+def parse_rate(text: str) -> int:
+    """Parse a rate such as ``500K``, ``2.5M`` or ``1MiB/s`` into bytes.
+    
+    Suffixes are binary (K = 1024). A bare number is bytes per second.
+    
+    Raises:
+        ValueError: If ``text`` is not a rate
+    """
+    match = _RATE_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Invalid rate: {text!r}")
+    value, unit = match.groups()
+    return int(float(value) * _RATE_UNITS[unit.lower()])
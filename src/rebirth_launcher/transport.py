@@ -0,0 +1,122 @@
+"""Shared HTTP session for every request the launcher makes.
+
+Importing this module imports ``requests``; callers import it when they
+first need the network so launching without an update check stays fast.
+"""
+import logging
+import threading
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from rebirth_launcher import __version__
+from rebirth_launcher.constants import (
+    HTTP_BACKOFF_FACTOR,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_POOL_SIZE,
+    HTTP_READ_TIMEOUT,
+    HTTP_RETRIES,
+)
+
+logger = logging.getLogger(__name__)
+
+# Responses worth asking again for; 429 and 503 honour Retry-After
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+class TimeoutAdapter(HTTPAdapter):
+    """Adapter applying default timeouts to requests that set none.
+    
+    ``requests`` waits forever by default, so one dead server could hang
+    an update indefinitely.
+    """
+    
+    def __init__(
+        self,
+        timeout: tuple[float, float],
+        **kwargs: Any
+    ) -> None:
+        """Initialize adapter with a (connect, read) timeout."""
+        self.timeout = timeout
+        super().__init__(**kwargs)
+    
+    def send(  # type: ignore[override]
+        self,
+        request: requests.PreparedRequest,
+        timeout: Any = None,
+        **kwargs: Any
+    ) -> requests.Response:
+        """Send ``request``, using the default timeout if it has none."""
+        return super().send(
+            request,
+            timeout=self.timeout if timeout is None else timeout,
+            **kwargs
+        )
+
+def retry_policy(retries: int = HTTP_RETRIES) -> Retry:
+    """Retries with exponential backoff for idempotent requests.
+    
+    Failed connects, timeouts before a response arrives and 429/5xx
+    answers are retried after 0.5s, 1s, 2s... Failures once the body is
+    streaming are left to the caller, which can resume with a Range
+    request instead of starting over.
+    """
+    return Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'}),
+        status_forcelist=_RETRY_STATUSES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        respect_retry_after_header=True,
+        # Hand the last response back so raise_for_status() reports it
+        raise_on_status=False,
+    )
+
+def create_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """Build a session with pooled keep-alive connections and retries.
+    
+    Args:
+        pool_size: Connections kept open per host; should cover the
+            number of concurrent downloads so none wait for a slot or
+            pay for a fresh TLS handshake
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = f"rebirth-launcher/{__version__}"
+    _mount_adapter(session, pool_size)
+    return session
+
+def _mount_adapter(session: requests.Session, pool_size: int) -> None:
+    adapter = TimeoutAdapter(
+        (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=pool_size,
+        max_retries=retry_policy(),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+_session: Optional[requests.Session] = None
+_pool_size = 0
+_session_lock = threading.Lock()
+
+def get_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """Get the process-wide session, shared by metadata and downloads.
+    
+    Sharing one session lets a chunk download reuse the connection the
+    release lookup opened. The pool grows if a caller needs more
+    connections than the session was created with.
+    """
+    global _session, _pool_size
+    pool_size = max(pool_size, HTTP_POOL_SIZE)
+    with _session_lock:
+        if _session is None:
+            _session = create_session(pool_size)
+            _pool_size = pool_size
+        elif pool_size > _pool_size:
+            logger.debug("Growing HTTP connection pool to %d", pool_size)
+            _mount_adapter(_session, pool_size)
+            _pool_size = pool_size
+        return _session
@@ -1,17 +1,44 @@
 """Update checking and downloading functionality."""
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
+import hashlib
+import json
 import logging
-from typing import Callable, Optional
-
-import requests
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+from urllib.parse import quote
 
+from .cache import ChunkCache
 from .config import get_config
-from .constants import GITHUB_API_BASE
-from .exceptions import ModUpdateError
+from .constants import (
+    GITHUB_API_BASE,
+    MIRROR_CACHE_FILENAME,
+    PARTIAL_DOWNLOAD_SUFFIX,
+    RELEASE_CACHE_FILENAME,
+    VERSION_INFO_ASSET,
+)
+from .exceptions import ChecksumError, ModUpdateError
+from .manifest import ManifestEntry, ReleaseManifest
+from .mirrors import MirrorSet
+from .tracing import span
+from .transfer import iter_response, shared_rate_limiter
+from .utils import write_json_atomic
+
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
+# What ReleaseInfo.checksum is a digest of: the whole archive (every chunk
+# concatenated in order, as older releases publish it) or the ordered
+# chunk digests (see combine_checksums)
+CHECKSUM_ARCHIVE = "archive"
+CHECKSUM_CHUNKS = "chunks"
+
 @dataclass
 class ReleaseInfo:
     """Information about a mod release."""
@@ -20,6 +47,212 @@ class ReleaseInfo:
     chunks: list[str]
     checksum: str
     changelog: Optional[str] = None
+    chunk_checksums: Optional[dict[str, str]] = None
+    manifest: Optional[str] = None
+    checksum_type: str = CHECKSUM_ARCHIVE
+    
+    @property
+    def verifiable_per_chunk(self) -> bool:
+        """Whether every chunk can be verified on its own as it arrives."""
+        digests = self.chunk_checksums or {}
+        return self.checksum_type == CHECKSUM_CHUNKS and all(
+            name in digests for name in self.chunks
+        )
+
+def combine_checksums(chunk_checksums: Sequence[str]) -> str:
+    """Compute the overall release digest from ordered chunk digests.
+
+    For ``CHECKSUM_CHUNKS`` releases, ``ReleaseInfo.checksum`` is the
+    SHA256 of the chunks' lowercase hex SHA256 digests joined in archive
+    order. Unlike a digest of the joined
+    archive, it can be checked from chunks downloaded in any order without
+    reading them back from disk.
+    """
+    joined = "".join(digest.lower() for digest in chunk_checksums)
+    return hashlib.sha256(joined.encode('ascii')).hexdigest()
+
+def _hash_file(digest: Any, path: Path) -> None:
+    """Feed a file's bytes into ``digest``."""
+    with open(path, 'rb') as f:
+        while block := f.read(_REHASH_BLOCK_SIZE):
+            digest.update(block)
+
+def _retryable_errors() -> tuple[type[Exception], ...]:
+    """Mid-transfer failures worth resuming rather than aborting the update."""
+    import requests
+    return (
+        requests.ConnectionError,
+        requests.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+    )
+
+# Seconds to wait on GitHub API and metadata requests
+_METADATA_TIMEOUT = 10
+
+# Seconds a download may go without receiving data before it counts as
+# stalled and moves to another mirror
+_STALL_TIMEOUT = 20
+
+# How often the sidecar offset is refreshed while streaming
+_CHECKPOINT_BYTES = 4 * 1024 * 1024
+
+# Read size used when re-hashing the prefix of a resumed part
+_REHASH_BLOCK_SIZE = 1024 * 1024
+
+class _PartialDownload:
+    """Persistent state of an interrupted download.
+
+    Bytes live in ``<name>.part`` and a small JSON sidecar next to it
+    records the source URL, the ETag/Last-Modified validators, the
+    expected checksum and the offset that has been flushed to disk.
+    
+    A part with a known checksum can continue from another mirror: the
+    other host's validators mean nothing here, but the final checksum
+    still catches a mirror serving different bytes.
+    """
+    
+    def __init__(
+        self,
+        output_path: Path,
+        url: str,
+        checksum: Optional[str] = None
+    ) -> None:
+        self.output_path = output_path
+        self.path = output_path.with_name(
+            output_path.name + PARTIAL_DOWNLOAD_SUFFIX
+        )
+        self.sidecar = self.path.with_name(self.path.name + ".json")
+        self.url = url
+        self.checksum = checksum.lower() if checksum else None
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.offset = 0
+    
+    @classmethod
+    def load(
+        cls,
+        output_path: Path,
+        url: str,
+        checksum: Optional[str] = None
+    ) -> "_PartialDownload":
+        """Load resume state for ``output_path``, if any is usable."""
+        partial = cls(output_path, url, checksum)
+        try:
+            with open(partial.sidecar, 'r') as f:
+                data = json.load(f)
+            same_url = data.get('url') == url
+            if not same_url and (
+                not partial.checksum or data.get('checksum') != partial.checksum
+            ):
+                return partial
+            if same_url:
+                partial.etag = data.get('etag')
+                partial.last_modified = data.get('last_modified')
+            # Never trust more bytes than actually made it to disk
+            partial.offset = min(
+                int(data.get('offset', 0)),
+                partial.path.stat().st_size
+            )
+        except (OSError, ValueError):
+            partial.offset = 0
+        return partial
+    
+    @property
+    def validator(self) -> Optional[str]:
+        """Validator for ``If-Range``; weak ETags are not allowed there."""
+        if self.etag and not self.etag.startswith('W/'):
+            return self.etag
+        return self.last_modified
+    
+    @property
+    def resumable(self) -> bool:
+        """Whether the bytes on disk can be continued with a Range request."""
+        return bool(self.offset and (self.validator or self.checksum))
+    
+    def accepts(self, response: "requests.Response") -> bool:
+        """Check that a 206 response continues exactly at our offset."""
+        content_range = response.headers.get('content-range', '')
+        try:
+            start = int(content_range.split()[1].split('-')[0])
+        except (IndexError, ValueError):
+            return False
+        return start == self.offset
+    
+    def restart(self, response: "requests.Response") -> None:
+        """Start the part over using validators from a full response."""
+        self.etag = response.headers.get('etag')
+        self.last_modified = response.headers.get('last-modified')
+        self.checkpoint(0)
+    
+    def checkpoint(self, offset: int) -> None:
+        """Record that ``offset`` bytes of the part are on disk."""
+        self.offset = offset
+        with open(self.sidecar, 'w') as f:
+            json.dump({
+                'url': self.url,
+                'checksum': self.checksum,
+                'etag': self.etag,
+                'last_modified': self.last_modified,
+                'offset': offset,
+            }, f)
+    
+    def complete(self) -> None:
+        """Move the finished part into place and drop the sidecar."""
+        os.replace(self.path, self.output_path)
+        self.sidecar.unlink(missing_ok=True)
+    
+    def discard(self) -> None:
+        """Throw away the part and its sidecar."""
+        self.path.unlink(missing_ok=True)
+        self.sidecar.unlink(missing_ok=True)
+        self.etag = self.last_modified = None
+        self.offset = 0
+
+@dataclass
+class _DownloadJob:
+    """A single file to fetch as part of a concurrent download."""
+    name: str
+    path: str
+    output_path: Path
+    expected_checksum: Optional[str] = None
+    size: Optional[int] = None
+    cacheable: bool = False
+
+class _CombinedProgress:
+    """Folds per-chunk progress from concurrent downloads into one value.
+
+    Chunks are weighted by their size when every size is known. Otherwise
+    each chunk contributes an equal share, which suits split parts since
+    they are equally sized apart from the last one.
+    """
+    
+    def __init__(
+        self,
+        chunk_count: int,
+        callback: Callable[[float], None] | None,
+        weights: Optional[Sequence[Optional[int]]] = None
+    ) -> None:
+        self._fractions = [0.0] * chunk_count
+        self._weights = [1.0] * chunk_count
+        if weights and all(weights) and len(weights) == chunk_count:
+            self._weights = [float(w or 0) for w in weights]
+        self._total_weight = sum(self._weights)
+        self._callback = callback
+        self._lock = threading.Lock()
+    
+    def for_chunk(self, index: int) -> Callable[[float], None] | None:
+        """Get the progress callback for a single chunk."""
+        callback = self._callback
+        if callback is None:
+            return None
+        
+        def update(fraction: float) -> None:
+            with self._lock:
+                self._fractions[index] = fraction * self._weights[index]
+                # Report under the lock so the value never goes backwards
+                callback(sum(self._fractions) / self._total_weight)
+        
+        return update
 
 class UpdateChecker:
     """Checks for and downloads mod updates."""
@@ -27,7 +260,193 @@ class UpdateChecker:
     def __init__(self) -> None:
         """Initialize update checker."""
         self.config = get_config()
-        self.session = requests.Session()
+        self._session: Optional["requests.Session"] = None
+        self.mirrors = MirrorSet(
+            [self.config.mod_hosting_url, *self.config.mod_hosting_mirrors],
+            self.config.data_dir / MIRROR_CACHE_FILENAME,
+            self.config.mirror_probe_ttl
+        )
+        self.chunk_cache: Optional[ChunkCache] = None
+        if self.config.chunk_cache_enabled:
+            self.chunk_cache = ChunkCache(
+                self.config.chunk_cache_dir,
+                self.config.chunk_cache_max_bytes
+            )
+    
+    @property
+    def session(self) -> "requests.Session":
+        """Shared HTTP session, set up on first use to keep startup cheap."""
+        if self._session is None:
+            from .transport import get_session
+            self._session = get_session(self.config.download_concurrency)
+        return self._session
+    
+    def check_updates(self, force: bool = False) -> Optional[ReleaseInfo]:
+        """Get the latest published mod pack release.
+
+        Lookups are cached on disk. Within ``config.update_check_ttl``
+        seconds of the last one the cached answer is returned without any
+        network traffic; after that GitHub is asked with ``If-None-Match``,
+        so an unchanged release only costs a 304. When GitHub cannot be
+        reached, a stale cached answer is used instead.
+
+        Args:
+            force: Revalidate with GitHub even if the cache is fresh
+
+        Returns:
+            The latest release, or None if nothing has been published
+        """
+        url = f"{GITHUB_API_BASE}/releases/latest"
+        cache_path = self.config.data_dir / RELEASE_CACHE_FILENAME
+        cache = self._load_release_cache(cache_path, url)
+        
+        age = time.time() - cache.get('checked_at', 0)
+        if cache and not force and 0 <= age < self.config.update_check_ttl:
+            logger.debug("Using cached release metadata (%.0fs old)", age)
+            return self._parse_release(cache)
+        
+        import requests
+        
+        headers = {'Accept': 'application/vnd.github+json'}
+        if cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        
+        try:
+            response = self.session.get(
+                url, headers=headers, timeout=_METADATA_TIMEOUT
+            )
+            if response.status_code == 404:
+                logger.info("No mod pack release has been published")
+                return None
+            
+            if response.status_code == 304:
+                logger.debug("Release metadata not modified")
+            else:
+                response.raise_for_status()
+                release = response.json()
+                if release.get('id') != cache.get('release', {}).get('id'):
+                    version_info = self._fetch_version_info(release)
+                else:
+                    version_info = cache['version_info']
+                cache = {
+                    'url': url,
+                    'etag': response.headers.get('etag'),
+                    'release': {
+                        key: release.get(key)
+                        for key in ('id', 'tag_name', 'body')
+                    },
+                    'version_info': version_info,
+                }
+        except (requests.RequestException, ValueError) as e:
+            if not cache:
+                raise ModUpdateError(
+                    "Failed to check for updates",
+                    f"URL: {url}, Error: {str(e)}"
+                )
+            logger.warning(
+                "Could not reach GitHub (%s), using cached release metadata", e
+            )
+            return self._parse_release(cache)
+        
+        cache['checked_at'] = time.time()
+        try:
+            write_json_atomic(cache_path, cache)
+        except OSError:
+            logger.warning(
+                "Failed to save release metadata cache", exc_info=True
+            )
+        return self._parse_release(cache)
+    
+    def get_release(self, tag_name: str) -> ReleaseInfo:
+        """Get a specific published release by its tag.
+        
+        Served from the release cache when that tag is the cached latest
+        release, so checking the current install needs no request.
+        """
+        latest_url = f"{GITHUB_API_BASE}/releases/latest"
+        cache = self._load_release_cache(
+            self.config.data_dir / RELEASE_CACHE_FILENAME, latest_url
+        )
+        if cache and cache['release'].get('tag_name') == tag_name:
+            return self._parse_release(cache)
+        
+        import requests
+        
+        url = f"{GITHUB_API_BASE}/releases/tags/{quote(tag_name)}"
+        try:
+            response = self.session.get(url, timeout=_METADATA_TIMEOUT)
+            response.raise_for_status()
+            release = response.json()
+            version_info = self._fetch_version_info(release)
+        except (requests.RequestException, ValueError) as e:
+            raise ModUpdateError(
+                f"Failed to look up release {tag_name}",
+                f"URL: {url}, Error: {str(e)}"
+            )
+        return self._parse_release({
+            'release': {
+                key: release.get(key) for key in ('id', 'tag_name', 'body')
+            },
+            'version_info': version_info,
+        })
+    
+    def _fetch_version_info(self, release: dict[str, Any]) -> dict[str, Any]:
+        """Download the version.json asset describing a release's chunks."""
+        for asset in release.get('assets') or []:
+            if asset.get('name') == VERSION_INFO_ASSET:
+                response = self.session.get(
+                    asset['browser_download_url'], timeout=_METADATA_TIMEOUT
+                )
+                response.raise_for_status()
+                version_info: dict[str, Any] = response.json()
+                return version_info
+        
+        raise ModUpdateError(
+            "Release is missing its version information",
+            f"Tag: {release.get('tag_name')}, expected asset {VERSION_INFO_ASSET}"
+        )
+    
+    @staticmethod
+    def _load_release_cache(cache_path: Path, url: str) -> dict[str, Any]:
+        """Load cached release metadata, ignoring unusable caches."""
+        try:
+            with open(cache_path, 'r') as f:
+                cache: dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if cache.get('url') != url or not cache.get('release'):
+            return {}
+        return cache
+    
+    @staticmethod
+    def _parse_release(cache: dict[str, Any]) -> ReleaseInfo:
+        """Build release info from cached release and version metadata."""
+        release = cache['release']
+        version_info = cache.get('version_info') or {}
+        try:
+            tag_name = str(release['tag_name'])
+            version = str(version_info.get('version') or tag_name)
+            chunk_checksums = version_info.get('chunk_checksums')
+            # Releases from before per-chunk digests don't name a type
+            checksum_type = str(version_info.get('checksum_type') or (
+                CHECKSUM_CHUNKS if chunk_checksums else CHECKSUM_ARCHIVE
+            ))
+            if checksum_type not in (CHECKSUM_ARCHIVE, CHECKSUM_CHUNKS):
+                raise ValueError(f"Unknown checksum type {checksum_type!r}")
+            return ReleaseInfo(
+                # Hosting paths are /v<version>/, so drop the tag's prefix
+                version=version[1:] if version.startswith('v') else version,
+                tag_name=tag_name,
+                chunks=list(version_info['chunks']),
+                checksum=version_info.get('checksum') or "",
+                changelog=release.get('body'),
+                chunk_checksums=chunk_checksums,
+                manifest=version_info.get('manifest'),
+                checksum_type=checksum_type
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ModUpdateError("Invalid release metadata", str(e))
     
     def download_release_assets(
         self,
@@ -35,48 +454,443 @@ def download_release_assets(
         output_dir: Path,
         progress_callback: Callable[[float], None] | None = None
     ) -> bool:
-        """Download release assets from external hosting."""
+        """Download release assets from external hosting.
+
+        Chunks are fetched concurrently on a bounded worker pool sized by
+        ``config.download_concurrency``; all workers share ``self.session``.
+        Progress from every chunk is combined into a single value.
+
+        Each chunk is hashed while it streams to disk and checked against
+        ``release_info.chunk_checksums`` as soon as it finishes; the ordered
+        digests are then checked against ``release_info.checksum``.
+        Releases with a whole-archive checksum take one more read of the
+        chunks to check it.
+
+        Chunks with a known checksum are served from the local chunk cache
+        when present, and added to it after a verified download.
+        """
         try:
-            base_url = self.config.mod_hosting_url
-            version = release_info.version
+            jobs = self._chunk_jobs(release_info, output_dir)
+            digests = self._download_many(jobs, progress_callback)
+            archive_digest = None
+            if release_info.checksum_type == CHECKSUM_ARCHIVE:
+                archive_digest = hashlib.sha256()
+                for job in jobs:
+                    _hash_file(archive_digest, job.output_path)
+            self._verify_release_checksum(
+                release_info,
+                [digests[job.name] for job in jobs],
+                archive_digest
+            )
+            return True
             
-            # Download split files
-            for chunk_name in release_info.chunks:
-                url = f"{base_url}/v{version}/{chunk_name}"
-                output_path = output_dir / chunk_name
-                
-                self._download_file(url, output_path, progress_callback)
+        except Exception:
+            logger.exception("Failed to download assets")
+            return False
+    
+    def iter_release_assets(
+        self,
+        release_info: ReleaseInfo,
+        output_dir: Path,
+        progress_callback: Callable[[float], None] | None = None
+    ) -> Iterator[Path]:
+        """Download release chunks concurrently, yielding them in order.
+
+        Each chunk is yielded once it is complete and verified, so a
+        consumer can start on the first part while later ones are still
+        downloading. Downloads stay at most a small window ahead of the
+        consumer, which is expected to be done with a chunk (and free to
+        delete it) before asking for the next one.
+
+        Only releases with a digest for every chunk can be streamed; an
+        archive-wide checksum is only known once the consumer has already
+        used every chunk.
+
+        Raises:
+            ModUpdateError: If a chunk fails to download or verify, or the
+                release has no per-chunk digests
+        """
+        if not release_info.verifiable_per_chunk:
+            raise ModUpdateError(
+                "Release chunks cannot be verified individually",
+                f"Release {release_info.tag_name} has no per-chunk checksums"
+            )
+        jobs = self._chunk_jobs(release_info, output_dir)
+        if jobs:
+            self.mirrors.ensure_ranked(self.session, jobs[0].path)
+        workers = max(1, min(self.config.download_concurrency, len(jobs)))
+        window = 2 * workers
+        progress = _CombinedProgress(len(jobs), progress_callback)
+        futures: list[Future[str]] = []
+        digests: list[str] = []
+        
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="download"
+        ) as executor:
+            
+            def submit_next() -> None:
+                index = len(futures)
+                job = jobs[index]
+                futures.append(executor.submit(
+                    self._fetch, job, progress.for_chunk(index)
+                ))
             
+            try:
+                while len(futures) < min(window, len(jobs)):
+                    submit_next()
+                
+                for index, job in enumerate(jobs):
+                    digests.append(futures[index].result())
+                    yield job.output_path
+                    # The consumer is done with this chunk; widen the window
+                    if len(futures) < len(jobs):
+                        submit_next()
+            finally:
+                # Also runs when the consumer abandons the generator early
+                for future in futures:
+                    future.cancel()
+        
+        self._verify_release_checksum(release_info, digests)
+    
+    def _chunk_jobs(
+        self,
+        release_info: ReleaseInfo,
+        output_dir: Path
+    ) -> list["_DownloadJob"]:
+        """Build download jobs for the chunks of a release, in order."""
+        expected = release_info.chunk_checksums or {}
+        return [
+            _DownloadJob(
+                name=chunk_name,
+                path=f"v{release_info.version}/{chunk_name}",
+                output_path=output_dir / chunk_name,
+                expected_checksum=expected.get(chunk_name),
+                cacheable=True
+            )
+            for chunk_name in release_info.chunks
+        ]
+    
+    def _verify_release_checksum(
+        self,
+        release_info: ReleaseInfo,
+        digests: Sequence[str],
+        archive_digest: Optional[Any] = None
+    ) -> None:
+        """Check a download against the overall release checksum.
+        
+        Args:
+            release_info: Release with the expected checksum
+            digests: Chunk digests in archive order
+            archive_digest: Hash of the chunks' concatenated bytes, for
+                ``CHECKSUM_ARCHIVE`` releases
+        """
+        if not release_info.checksum or not digests:
+            return
+        
+        if release_info.checksum_type == CHECKSUM_ARCHIVE:
+            if archive_digest is None:
+                raise ChecksumError(
+                    "Release checksum not verified",
+                    "Archive checksum needs the downloaded chunks"
+                )
+            overall = archive_digest.hexdigest()
+        else:
+            overall = combine_checksums(digests)
+        if overall != release_info.checksum.lower():
+            raise ChecksumError(
+                "Release checksum mismatch",
+                f"Expected {release_info.checksum}, got {overall}"
+            )
+    
+    def fetch_manifest(
+        self,
+        release_info: ReleaseInfo
+    ) -> Optional[ReleaseManifest]:
+        """Fetch the file manifest published with a release, if any.
+
+        Mirrors are tried fastest first until one serves it.
+        """
+        if not release_info.manifest:
+            return None
+        
+        import requests
+        
+        path = f"v{release_info.version}/{release_info.manifest}"
+        self.mirrors.ensure_ranked(self.session, path)
+        errors = []
+        for url in self.mirrors.candidates(path):
+            try:
+                response = self.session.get(url, timeout=_METADATA_TIMEOUT)
+                response.raise_for_status()
+                return ReleaseManifest.from_dict(response.json())
+            except (requests.RequestException, ValueError) as e:
+                self.mirrors.mark_failed(url, e)
+                errors.append(f"URL: {url}, Error: {str(e)}")
+        raise ModUpdateError(
+            "Failed to fetch release manifest", "; ".join(errors)
+        )
+    
+    def download_release_files(
+        self,
+        release_info: ReleaseInfo,
+        entries: Sequence[ManifestEntry],
+        output_dir: Path,
+        progress_callback: Callable[[float], None] | None = None
+    ) -> bool:
+        """Download individual release files listed in the manifest.
+
+        Files are published under ``files/`` next to the release chunks and
+        are written below ``output_dir`` using their manifest paths.
+        """
+        try:
+            base_path = f"v{release_info.version}/files"
+            jobs = []
+            for entry in entries:
+                output_path = output_dir / entry.path
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                jobs.append(_DownloadJob(
+                    name=entry.path,
+                    path=f"{base_path}/{quote(entry.path)}",
+                    output_path=output_path,
+                    expected_checksum=entry.sha256,
+                    size=entry.size
+                ))
+            self._download_many(jobs, progress_callback)
             return True
             
         except Exception:
-            logger.exception("Failed to download assets")
+            logger.exception("Failed to download release files")
             return False
     
+    def _download_many(
+        self,
+        jobs: Sequence["_DownloadJob"],
+        progress_callback: Callable[[float], None] | None = None
+    ) -> dict[str, str]:
+        """Run downloads concurrently, returning digests keyed by job name.
+
+        The first failure cancels every download that has not started yet.
+        """
+        if not jobs:
+            return {}
+        
+        self.mirrors.ensure_ranked(self.session, jobs[0].path)
+        workers = max(1, min(self.config.download_concurrency, len(jobs)))
+        progress = _CombinedProgress(
+            len(jobs), progress_callback, [job.size for job in jobs]
+        )
+        digests: dict[str, str] = {}
+        
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="download"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch, job, progress.for_chunk(index)
+                ): job.name
+                for index, job in enumerate(jobs)
+            }
+            
+            try:
+                for future in as_completed(futures):
+                    digests[futures[future]] = future.result()
+                    logger.debug("Downloaded %s", futures[future])
+            except Exception:
+                # Stop queued downloads; in-flight ones finish on their own
+                for pending in futures:
+                    pending.cancel()
+                raise
+        
+        return digests
+    
+    def _fetch(
+        self,
+        job: "_DownloadJob",
+        progress_callback: Callable[[float], None] | None = None
+    ) -> str:
+        """Get a job's file from the chunk cache or the network.
+
+        Returns:
+            str: SHA256 hex digest of the file
+        """
+        expected = job.expected_checksum
+        if self.chunk_cache and job.cacheable and expected:
+            with span(f"cache {job.name}", "disk") as timing:
+                if self.chunk_cache.get(expected, job.output_path):
+                    timing.bytes = job.output_path.stat().st_size
+                    if progress_callback:
+                        progress_callback(1.0)
+                    return expected.lower()
+        
+        with span(f"download {job.name}", "network") as timing:
+            digest = self._download_file(
+                self.mirrors.candidates(job.path),
+                job.output_path,
+                progress_callback,
+                expected_checksum=expected
+            )
+            timing.bytes = job.output_path.stat().st_size
+        
+        # Only verified chunks go in, so later hits need no re-check
+        if self.chunk_cache and job.cacheable and expected:
+            self.chunk_cache.put(digest, job.output_path)
+        return digest
+    
     def _download_file(
         self,
-        url: str,
+        urls: Sequence[str],
         output_path: Path,
         progress_callback: Callable[[float], None] | None = None,
-        chunk_size: int = 8192
-    ) -> None:
-        """Download a file with progress tracking."""
-        try:
-            response = self.session.get(url, stream=True)
+        expected_checksum: Optional[str] = None
+    ) -> str:
+        """Download a file with progress tracking.
+
+        Data is streamed into a ``.part`` file next to ``output_path`` whose
+        sidecar records the server validators and the bytes safely on disk.
+        Interrupted transfers are retried with an HTTP Range request, and a
+        part left behind by an earlier run is resumed the same way.
+
+        ``urls`` are copies of the file on different mirrors, best first.
+        When one errors or stalls for ``_STALL_TIMEOUT`` seconds the
+        transfer moves to the next, continuing from the bytes already on
+        disk if the checksum is known.
+
+        Bytes are hashed as they are written, so verifying against
+        ``expected_checksum`` costs no extra read of the file. Read sizes
+        follow the measured throughput, and ``config.download_rate_limit``
+        caps the combined rate of all concurrent downloads.
+
+        Returns:
+            str: SHA256 hex digest of the downloaded file
+        """
+        import requests
+        
+        failover = _retryable_errors()
+        if len(urls) > 1:
+            # Another mirror may well have what this one refused
+            failover += (requests.HTTPError,)
+        attempts = max(self.config.download_retries + 1, len(urls))
+        for attempt in range(1, attempts + 1):
+            url = urls[(attempt - 1) % len(urls)]
+            try:
+                with self.mirrors.transfer(url):
+                    digest = self._transfer(
+                        url, output_path, progress_callback, expected_checksum
+                    )
+                break
+            except failover as e:
+                self.mirrors.mark_failed(url, e)
+                if attempt == attempts:
+                    raise ModUpdateError(
+                        "Failed to download file",
+                        f"URL: {url}, Error: {str(e)}"
+                    )
+                next_url = urls[attempt % len(urls)]
+                if next_url != url:
+                    logger.warning(
+                        "Download of %s from %s failed (%s), switching to %s",
+                        output_path.name, url, e, next_url
+                    )
+                else:
+                    logger.warning(
+                        "Download of %s interrupted (%s), resuming "
+                        "(attempt %d/%d)",
+                        url, e, attempt + 1, attempts
+                    )
+                # Back off once every mirror has been tried
+                if attempt % len(urls) == 0:
+                    time.sleep(min(2 ** (attempt // len(urls) - 1), 30))
+            except Exception as e:
+                raise ModUpdateError(
+                    "Failed to download file",
+                    f"URL: {url}, Error: {str(e)}"
+                )
+        
+        if expected_checksum and digest != expected_checksum.lower():
+            output_path.unlink(missing_ok=True)
+            raise ChecksumError(
+                f"Checksum mismatch for {output_path.name}",
+                f"URL: {url}, expected {expected_checksum}, got {digest}"
+            )
+        return digest
+    
+    def _transfer(
+        self,
+        url: str,
+        output_path: Path,
+        progress_callback: Callable[[float], None] | None,
+        expected_checksum: Optional[str] = None
+    ) -> str:
+        """Run a single download attempt, resuming any existing part."""
+        partial = _PartialDownload.load(output_path, url, expected_checksum)
+        
+        headers = {}
+        if partial.resumable:
+            headers['Range'] = f"bytes={partial.offset}-"
+            if partial.validator:
+                headers['If-Range'] = partial.validator
+        
+        response = self.session.get(
+            url,
+            stream=True,
+            headers=headers,
+            timeout=(_METADATA_TIMEOUT, _STALL_TIMEOUT)
+        )
+        with response:
+            if response.status_code == 416 and headers:
+                # The part no longer matches the remote file; start over
+                partial.discard()
+                response.close()
+                return self._transfer(
+                    url, output_path, progress_callback, expected_checksum
+                )
             response.raise_for_status()
             
-            total = int(response.headers.get('content-length', 0))
+            length = int(response.headers.get('content-length', 0))
+            if response.status_code == 206 and partial.accepts(response):
+                logger.info(
+                    "Resuming %s at byte %d", output_path.name, partial.offset
+                )
+                total = partial.offset + length if length else 0
+            else:
+                # Server ignored the range or the file changed upstream
+                partial.restart(response)
+                total = length
             
-            with open(output_path, 'wb') as f:
-                downloaded = 0
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback and total:
-                        progress_callback(downloaded / total)
-                        
-        except Exception as e:
-            raise ModUpdateError(
-                "Failed to download file",
-                f"URL: {url}, Error: {str(e)}"
-            )
\ No newline at end of file
+            downloaded = partial.offset
+            limiter = shared_rate_limiter(self.config.download_rate_limit)
+            sha256 = hashlib.sha256()
+            with open(partial.path, 'r+b' if downloaded else 'wb') as f:
+                # Hash state can't be persisted, so catch up on the prefix
+                # already on disk; fresh downloads skip this entirely
+                remaining = downloaded
+                while remaining:
+                    block = f.read(min(remaining, _REHASH_BLOCK_SIZE))
+                    if not block:
+                        break
+                    sha256.update(block)
+                    remaining -= len(block)
+                f.seek(downloaded)
+                f.truncate()
+                try:
+                    for chunk in iter_response(response, limiter):
+                        f.write(chunk)
+                        sha256.update(chunk)
+                        downloaded += len(chunk)
+                        if downloaded - partial.offset >= _CHECKPOINT_BYTES:
+                            f.flush()
+                            partial.checkpoint(downloaded)
+                        if progress_callback and total:
+                            progress_callback(downloaded / total)
+                finally:
+                    f.flush()
+                    partial.checkpoint(downloaded)
+        
+        partial.complete()
+        
+        # Servers that omit content-length still count as finished
+        if progress_callback:
+            progress_callback(1.0)
+        return sha256.hexdigest()
@@ -1,20 +1,176 @@
 """Utility functions for the Rebirth Launcher."""
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 import hashlib
+import itertools
+import json
 import logging
-from typing import Optional
+import mmap
+import os
+import stat
+import threading
+import time
+import uuid
+import zlib
+from typing import Any, Callable, Optional
+
+try:
+    import xxhash
+except ImportError:  # Optional; FAST_HASH_ALGORITHM falls back to CRC-32
+    xxhash = None
+
+from rebirth_launcher.constants import GAME_EXECUTABLES, TRASH_DIRNAME
 
 logger = logging.getLogger(__name__)
 
+class _Crc32:
+    """CRC-32 with the hashlib update/hexdigest interface."""
+    
+    def __init__(self) -> None:
+        self._value = 0
+    
+    def update(self, data: Any) -> None:
+        self._value = zlib.crc32(data, self._value)
+    
+    def hexdigest(self) -> str:
+        return f"{self._value:08x}"
+
+# Non-cryptographic digest for change detection: xxHash when the optional
+# package is installed, otherwise zlib's CRC-32. Both release the GIL on
+# large buffers like hashlib does.
+FAST_HASH_ALGORITHM = "xxh3_64" if xxhash is not None else "crc32"
+HASH_ALGORITHMS = ("sha256", FAST_HASH_ALGORITHM)
+
+# Files up to this size are read in one call
+_SMALL_FILE_SIZE = 1024 * 1024
+# Larger files are fed to the hash in blocks of this size
+_HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+def _new_hasher(algorithm: str) -> Any:
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    if algorithm == "xxh3_64" and xxhash is not None:
+        return xxhash.xxh3_64()
+    if algorithm == "crc32":
+        return _Crc32()
+    raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
+def hash_file(
+    file_path: Path,
+    algorithm: str = "sha256",
+    progress_callback: Optional[Callable[[int], None]] = None
+) -> str:
+    """Hash a file, choosing the read strategy by its size.
+    
+    Small files are read in one call. Larger ones go through
+    ``hashlib.file_digest`` when available and no progress is wanted,
+    otherwise through an mmap fed to the hash in large blocks, with a
+    plain buffered read as the fallback where mapping fails.
+    
+    Args:
+        file_path: File to hash
+        algorithm: ``"sha256"`` or ``FAST_HASH_ALGORITHM``
+        progress_callback: Called with the byte count of each block hashed
+    
+    Raises:
+        OSError: If the file cannot be read
+    """
+    hasher = _new_hasher(algorithm)
+    with open(file_path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= _SMALL_FILE_SIZE:
+            data = f.read()
+            hasher.update(data)
+            if progress_callback:
+                progress_callback(len(data))
+            return str(hasher.hexdigest())
+        
+        if (
+            algorithm == "sha256"
+            and progress_callback is None
+            and hasattr(hashlib, 'file_digest')
+        ):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        
+        # Only mapping itself may fail over to buffered reads; errors while
+        # hashing are real and must not be retried behind the caller's back
+        mapped: Optional[mmap.mmap]
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mapped = None
+        if mapped is not None:
+            with mapped, memoryview(mapped) as view:
+                for offset in range(0, len(view), _HASH_BLOCK_SIZE):
+                    # Views must be released before the map closes
+                    with view[offset:offset + _HASH_BLOCK_SIZE] as block:
+                        hasher.update(block)
+                        count = len(block)
+                    if progress_callback:
+                        progress_callback(count)
+            return str(hasher.hexdigest())
+        
+        buffer = bytearray(_HASH_BLOCK_SIZE)
+        with memoryview(buffer) as view:
+            while count := f.readinto(buffer):
+                hasher.update(view[:count])
+                if progress_callback:
+                    progress_callback(count)
+        return str(hasher.hexdigest())
+
+def iter_file_digests(
+    paths: Iterable[Path],
+    algorithm: str = "sha256",
+    workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int], None]] = None
+) -> Iterator[tuple[Path, Optional[str]]]:
+    """Hash many files on a thread pool, yielding in completion order.
+    
+    ``paths`` is consumed lazily with a bounded number of files in
+    flight, so it can be a generator over a large tree. Files that
+    cannot be read are logged and yield a digest of None.
+    
+    Args:
+        paths: Files to hash
+        algorithm: ``"sha256"`` or ``FAST_HASH_ALGORITHM``
+        workers: Hashing threads; defaults to one per core plus a few
+        progress_callback: Called from worker threads with the byte
+            count of each block hashed
+    """
+    _new_hasher(algorithm)  # Reject unknown algorithms up front
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    
+    def digest(path: Path) -> Optional[str]:
+        try:
+            return hash_file(path, algorithm, progress_callback)
+        except OSError:
+            logger.exception(f"Error calculating checksum for {path}")
+            return None
+    
+    pending: dict[Future[Optional[str]], Path] = {}
+    source = iter(paths)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            while True:
+                for path in itertools.islice(source, workers * 4 - len(pending)):
+                    pending[executor.submit(digest, path)] = path
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
 def calculate_checksum(file_path: Path, chunk_size: int = 8192) -> str | None:
-    """Calculate SHA256 checksum of a file."""
+    """Calculate SHA256 checksum of a file.
+    
+    ``chunk_size`` is no longer used; ``hash_file`` sizes reads itself.
+    """
     try:
-        sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(chunk_size), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return hash_file(file_path)
     except Exception:
         logger.exception(f"Error calculating checksum for {file_path}")
         return None
@@ -48,11 +204,200 @@ def clean_directory(path: Path, preserve: set[str] | None = None) -> bool:
         logger.exception(f"Error cleaning directory {path}")
         return False
 
+def move_to_trash(path: Path, preserve: set[str] | None = None) -> Path | None:
+    """Move directory contents into a trash batch next to ``path``.
+
+    Entries are renamed into ``<parent>/.rebirth-trash/<batch>``, which is
+    on the same filesystem, so every move is a cheap atomic rename. If any
+    rename fails the entries already moved are put back, leaving ``path``
+    untouched. Delete the batch afterwards with ``purge_directory`` or
+    ``purge_in_background``.
+
+    Returns:
+        The batch directory, or None if the contents could not be moved
+    """
+    if not path.exists():
+        return None
+    
+    preserve = preserve or set()
+    batch = path.parent / TRASH_DIRNAME / f"{path.name}-{uuid.uuid4().hex[:12]}"
+    moved: list[tuple[str, str]] = []
+    try:
+        batch.mkdir(parents=True)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name in preserve:
+                    continue
+                destination = os.path.join(batch, entry.name)
+                os.rename(entry.path, destination)
+                moved.append((destination, entry.path))
+        return batch
+    except Exception:
+        logger.exception(f"Error moving contents of {path} to trash")
+        for destination, original in reversed(moved):
+            try:
+                os.rename(destination, original)
+            except OSError:
+                logger.exception(f"Error restoring {original} from trash")
+        return None
+
+def purge_directory(path: Path, workers: Optional[int] = None) -> bool:
+    """Delete a directory tree, unlinking files on parallel workers.
+
+    The tree is listed with ``os.scandir`` (no extra stat calls on most
+    platforms), files are removed concurrently and directories are then
+    removed deepest first.
+    """
+    try:
+        if not path.exists():
+            return True
+        
+        files: list[str] = []
+        directories = [str(path)]
+        pending = [str(path)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                        pending.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        
+        if files:
+            workers = workers or min(32, (os.cpu_count() or 1) + 4)
+            batch_size = max(1, len(files) // (workers * 4))
+            batches = [
+                files[i:i + batch_size] for i in range(0, len(files), batch_size)
+            ]
+            with ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="purge"
+            ) as executor:
+                list(executor.map(_unlink_all, batches))
+        
+        # Children were discovered after their parents
+        for directory in reversed(directories):
+            os.rmdir(directory)
+        return True
+    except Exception:
+        logger.exception(f"Error purging directory {path}")
+        return False
+
+# Purges started by purge_in_background, joined by wait_for_purges
+_purge_threads: list[threading.Thread] = []
+_purge_lock = threading.Lock()
+
+def purge_in_background(paths: list[Path]) -> threading.Thread:
+    """Delete directory trees with ``purge_directory`` on a background thread.
+
+    The trash directory holding each tree is removed once empty. Callers
+    exiting the process should call ``wait_for_purges`` first; trees
+    still present after that are left for ``reap_trash``.
+    """
+    def purge() -> None:
+        start = time.perf_counter()
+        for path in paths:
+            purge_directory(path)
+            try:
+                path.parent.rmdir()
+            except OSError:
+                pass  # Other batches are still in there
+        logger.debug(
+            "Purged %d trash batch(es) in %.2fs",
+            len(paths),
+            time.perf_counter() - start
+        )
+    
+    # Daemon, so an exit after wait_for_purges times out isn't blocked
+    thread = threading.Thread(target=purge, name="purge-trash", daemon=True)
+    with _purge_lock:
+        _purge_threads[:] = [t for t in _purge_threads if t.is_alive()]
+        _purge_threads.append(thread)
+    thread.start()
+    return thread
+
+def wait_for_purges(timeout: Optional[float] = None) -> bool:
+    """Wait for background purges to finish, up to ``timeout`` seconds.
+
+    Returns:
+        True if every purge finished
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with _purge_lock:
+        threads = list(_purge_threads)
+    for thread in threads:
+        remaining = None
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+        thread.join(remaining)
+    return not any(thread.is_alive() for thread in threads)
+
+def reap_trash(parent: Path) -> threading.Thread | None:
+    """Purge trash batches left below ``parent`` by an earlier run."""
+    trash_root = parent / TRASH_DIRNAME
+    try:
+        batches = [entry for entry in trash_root.iterdir() if entry.is_dir()]
+    except OSError:
+        return None
+    
+    if not batches:
+        return None
+    logger.info("Removing %d leftover trash batch(es) in %s", len(batches), parent)
+    return purge_in_background(batches)
+
+def _unlink_all(paths: list[str]) -> None:
+    """Unlink files, clearing the read-only flag where Windows needs it."""
+    for file_path in paths:
+        try:
+            os.unlink(file_path)
+        except PermissionError:
+            os.chmod(file_path, stat.S_IWRITE)
+            os.unlink(file_path)
+
+def format_bytes(size: float) -> str:
+    """Format a byte count for display."""
+    units = ("B", "KiB", "MiB", "GiB", "TiB")
+    value = float(size)
+    for unit in units[:-1]:
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} {units[-1]}"
+
+def write_json_atomic(
+    path: Path,
+    data: Any,
+    indent: Optional[int] = 4
+) -> None:
+    """Write JSON through a temporary file and rename it into place.
+
+    Readers see either the old or the new file, never a torn write.
+    Pass ``indent=None`` for compact output.
+    """
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(temp_path, 'w') as f:
+            if indent is None:
+                json.dump(data, f, separators=(',', ':'))
+            else:
+                json.dump(data, f, indent=indent)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+def game_executable(path: Path) -> Optional[Path]:
+    """Find the game binary in ``path``, Windows or native Linux build."""
+    for name in GAME_EXECUTABLES:
+        exe_path = path / name
+        if exe_path.is_file():
+            return exe_path
+    return None
+
 def is_valid_game_path(path: Path) -> bool:
     """Check if path contains valid 7 Days to Die installation."""
     try:
-        exe_path = path / "7DaysToDie.exe"
-        return exe_path.is_file()
+        return game_executable(path) is not None
     except Exception:
         logger.exception(f"Error checking game path {path}")
-        return False 
\ No newline at end of file
+        return False